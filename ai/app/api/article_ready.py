@@ -1,12 +1,70 @@
 # app/api/article_ready.py
-from fastapi import APIRouter, Query
-from typing import List, Any, Optional
+from fastapi import APIRouter, HTTPException, Query
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 import psycopg2
-from app.services.recommend_core import get_conn 
+from app.db.pool import get_conn
+from app.utils.pagination import cursor_after, fetch_keyset_page
 
 router = APIRouter()
 
+# fields= 로 고를 수 있는 필드 (기본: 전부)
+ARTICLE_FIELDS = ("id", "title", "content", "date", "link", "has_reco", "reco_count", "reco_updated_at")
+# news에서 바로 읽는 컬럼 (id/date/link는 정렬·커서·추천 조회에 항상 필요)
+_NEWS_COLUMNS = {"title": "n.title", "content": "n.content"}
+
+
+def _parse_fields(fields: Optional[str]) -> List[str]:
+    if not fields:
+        return list(ARTICLE_FIELDS)
+    wanted = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in wanted if f not in ARTICLE_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"unknown fields: {','.join(unknown)}")
+    return wanted
+
+
+def _select_news(fields: List[str]) -> str:
+    cols = ["n.id", "n.date", "n.link"] + [_NEWS_COLUMNS[f] for f in fields if f in _NEWS_COLUMNS]
+    return "SELECT " + ", ".join(cols) + " FROM news n"
+
+
+def _reco_status(cur, links: List[str], hours_window: int) -> Dict[str, tuple]:
+    """
+    페이지에 나온 링크들의 추천 후보 캐시 상태를 한 번에 조회.
+    link → (reco_count, has_reco, reco_updated_at)
+    """
+    if not links:
+        return {}
+    cur.execute("""
+        SELECT base_link,
+               COUNT(*) AS reco_count,
+               MAX(updated_at) FILTER (WHERE hours_window = %s) AS reco_updated_at,
+               BOOL_OR(hours_window = %s) AS has_reco
+        FROM article_reco_candidates
+        WHERE base_link = ANY(%s)
+        GROUP BY base_link
+    """, [hours_window, hours_window, links])
+    return {r[0]: (int(r[1]), bool(r[3]), r[2]) for r in cur.fetchall()}
+
+
+def _to_item(row: tuple, fields: List[str], status: Dict[str, tuple]) -> Dict[str, Any]:
+    n_id, dt, link = row[0], row[1], row[2]
+    extra = dict(zip([f for f in fields if f in _NEWS_COLUMNS], row[3:]))
+    reco_count, has_reco, reco_upd = status.get(link, (0, False, None))
+    full = {
+        "id": n_id,
+        "title": extra.get("title"),
+        "content": extra.get("content"),
+        "date": dt.isoformat() if dt else None,
+        "link": link,
+        "has_reco": has_reco,
+        "reco_count": reco_count,
+        "reco_updated_at": reco_upd.isoformat() if reco_upd else None,
+    }
+    return {f: full[f] for f in fields}
+
+
 @router.get("/article")
 def list_articles(
     limit: int = Query(18, ge=1, le=100),
@@ -14,75 +72,82 @@ def list_articles(
     hours_window: int = Query(48, ge=6, le=168),
     topk_return: int = Query(8, ge=1, le=20),
     nli_threshold: float = Query(0.1, ge=0.0, le=1.0),
-    only_ready: bool = Query(False, description="추천 캐시가 준비된 기사만 반환")
+    only_ready: bool = Query(False, description="추천 캐시가 준비된 기사만 반환"),
+    after: Optional[str] = Query(None, description="이전 응답의 next_cursor (주면 offset 무시)"),
+    fields: Optional[str] = Query(None, description="반환 필드 (예: id,title,date,link). 기본은 전부"),
 ):
     """
     기존 /api/article 와 유사하지만:
-    - has_reco(해당 파라미터 조합의 캐시 유무) 추가
-    - reco_count(해당 링크에 관련된 모든 캐시 갯수) 추가
-    - reco_updated_at(해당 파라미터 조합의 최신 갱신시각) 추가
+    - has_reco(해당 hours_window 후보 캐시 유무) 추가
+    - reco_count(해당 링크에 캐시된 hours_window 갯수) 추가
+    - reco_updated_at(해당 hours_window 후보 캐시 갱신시각) 추가
+    - topk_return / nli_threshold는 후보 목록에서 요청 시 골라 쓰므로 준비 여부와 무관 (호환용 파라미터)
     - only_ready=1 이면 캐시 준비된 기사만
     - 기본 정렬: has_reco DESC, date DESC
+    - after(커서)를 주면 keyset 페이지네이션 (준비된 기사 구간 → 나머지 구간 순서)
+    - fields로 필요한 필드만 (목록 화면에서 content 제외 등)
+
+    준비 여부는 WHERE의 EXISTS / NOT EXISTS(semi/anti join)로 구간을 나눠 각각
+    (date, id) 인덱스 순서로 읽고, 추천 캐시 통계는 페이지의 링크들만 한 번에 집계.
+    """
+    wanted = _parse_fields(fields)
+    combo = [hours_window]
+    ready_sql = """
+        EXISTS (
+          SELECT 1 FROM article_reco_candidates r
+          WHERE r.base_link = n.link
+            AND r.hours_window = %s
+        )
     """
+    phases = [(ready_sql, combo)]
+    if not only_ready:
+        phases.append((f"NOT {ready_sql}", combo))
+    select_sql = _select_news(wanted)
+
     conn = get_conn(); cur = conn.cursor()
     try:
-        where = []
-        params: List[Any] = []
-
-        # 현재 파라미터 조합의 캐시 존재 여부 식
-        ready_sql = """
-            EXISTS (
-              SELECT 1 FROM article_reco r
-              WHERE r.base_link = n.link
-                AND r.hours_window = %s
-                AND r.topk_return = %s
-                AND r.stance_threshold = %s
+        if after:
+            rows, next_cursor = fetch_keyset_page(
+                cur,
+                scope="article_ready",
+                select_sql=select_sql,
+                where=[],
+                params=[],
+                key=lambda r: (r[1], r[0]),
+                limit=limit,
+                after=after,
+                phases=phases,
+                date_expr="n.date",
+                id_expr="n.id",
             )
-        """
-        params.extend([hours_window, topk_return, nli_threshold])
-
-        if only_ready:
-            where.append(ready_sql)
-
-        where_clause = f"WHERE {' AND '.join(where)}" if where else ""
-        sql = f"""
-            SELECT
-              n.id, n.title, n.content, n.date, n.link,
-              {ready_sql} AS has_reco,
-              (
-                SELECT COUNT(*) FROM article_reco r2
-                WHERE r2.base_link = n.link
-              ) AS reco_count,
-              (
-                SELECT MAX(updated_at) FROM article_reco r3
-                WHERE r3.base_link = n.link
-                  AND r3.hours_window = %s
-                  AND r3.topk_return = %s
-                  AND r3.stance_threshold = %s
-              ) AS reco_updated_at
-            FROM news n
-            {where_clause}
-            ORDER BY has_reco DESC, n.date DESC NULLS LAST, n.id DESC
-            LIMIT %s OFFSET %s
-        """
-        params.extend([hours_window, topk_return, nli_threshold, limit, offset])
+        else:
+            # 구간마다 offset+limit 까지만 인덱스 순서로 읽고 합침 (전체 정렬 없음)
+            branches, params = [], []
+            for phase, (cond, cond_params) in enumerate(phases):
+                branches.append(f"""
+                    ({select_sql.replace("SELECT ", f"SELECT {phase} AS phase, ", 1)}
+                     WHERE {cond}
+                     ORDER BY n.date DESC NULLS LAST, n.id DESC
+                     LIMIT %s)
+                """)
+                params.extend(list(cond_params) + [offset + limit])
+            cur.execute(f"""
+                SELECT * FROM ({" UNION ALL ".join(branches)}) u
+                ORDER BY phase, date DESC NULLS LAST, id DESC
+                LIMIT %s OFFSET %s
+            """, params + [limit, offset])
+            phased = cur.fetchall()
+            rows = [r[1:] for r in phased]
+            next_cursor = None
+            if rows and len(rows) >= limit:
+                last = phased[-1]
+                next_cursor = cursor_after("article_ready", last[2], last[1], phase=last[0])
 
-        cur.execute(sql, params)
-        rows = cur.fetchall()
-        items = []
-        for r in rows:
-            n_id, title, content, dt, link, has_reco, reco_count, reco_upd = r
-            items.append({
-                "id": n_id,
-                "title": title,
-                "content": content,
-                "date": dt.isoformat() if dt else None,
-                "link": link,
-                "has_reco": bool(has_reco),
-                "reco_count": int(reco_count or 0),
-                "reco_updated_at": reco_upd.isoformat() if reco_upd else None,
-            })
-        return {"count": len(items), "items": items}
+        status = _reco_status(cur, [r[2] for r in rows], hours_window) if (
+            {"has_reco", "reco_count", "reco_updated_at"} & set(wanted)
+        ) else {}
+        items = [_to_item(r, wanted, status) for r in rows]
+        return {"count": len(items), "items": items, "next_cursor": next_cursor}
     finally:
         cur.close(); conn.close()
 
@@ -94,37 +159,29 @@ def list_articles_ready_only(
     hours_window: int = Query(48, ge=6, le=168),
     topk_return: int = Query(8, ge=1, le=20),
     nli_threshold: float = Query(0.1, ge=0.0, le=1.0),
+    fields: Optional[str] = Query(None, description="반환 필드 (예: id,title,date,link). 기본은 전부"),
 ):
     """
-    추천 캐시(해당 파라미터 조합)가 준비된 기사만 “전용 탭”용으로 반환.
+    추천 후보 캐시(해당 hours_window)가 준비된 기사만 “전용 탭”용으로 반환.
+    (topk_return / nli_threshold 조합은 모두 같은 후보 목록에서 나오므로 조건에 쓰지 않음)
     동일 링크 중 최신 updated_at 기준으로 1건만 뽑음.
     """
+    wanted = _parse_fields(fields)
+    news_cols = "".join(f", {_NEWS_COLUMNS[f]}" for f in wanted if f in _NEWS_COLUMNS)
     conn = get_conn(); cur = conn.cursor()
     try:
-        cur.execute("""
+        cur.execute(f"""
             SELECT DISTINCT ON (n.link)
-              n.id, n.title, n.content, n.date, n.link,
-              r.updated_at
-            FROM article_reco r
+              n.id, n.date, n.link, r.updated_at{news_cols}
+            FROM article_reco_candidates r
             JOIN news n ON n.link = r.base_link
-            WHERE r.hours_window=%s AND r.topk_return=%s AND r.stance_threshold=%s
+            WHERE r.hours_window=%s
             ORDER BY n.link, r.updated_at DESC
             LIMIT %s OFFSET %s
-        """, (hours_window, topk_return, nli_threshold, limit, offset))
+        """, (hours_window, limit, offset))
         rows = cur.fetchall()
-        items = []
-        for r in rows:
-            n_id, title, content, dt, link, reco_upd = r
-            items.append({
-                "id": n_id,
-                "title": title,
-                "content": content,
-                "date": dt.isoformat() if dt else None,
-                "link": link,
-                "has_reco": True,
-                "reco_count": None,
-                "reco_updated_at": reco_upd.isoformat() if reco_upd else None,
-            })
+        # (id, date, link, updated_at, ...news 컬럼)
+        items = [_to_item(r[:3] + r[4:], wanted, {r[2]: (None, True, r[3])}) for r in rows]
         return {"count": len(items), "items": items}
     finally:
         cur.close(); conn.close()
@@ -1,132 +1,28 @@
 # app/api/article_reco.py
 from fastapi import APIRouter, Query, BackgroundTasks, HTTPException, Response
-from fastapi.encoders import jsonable_encoder
-from datetime import timedelta, datetime, timezone
-import psycopg2, psycopg2.extras
 
-from app.services.recommend_core import get_conn, compute_recommendations, normalize_clicked
+from app.services import reco_store
+from app.services.recommend_core import is_settled, select_recommendations
 
 router = APIRouter()
-CACHE_TTL_HOURS = 6
 
-DDL_SQL = """
-CREATE TABLE IF NOT EXISTS article_reco (
-  base_link         TEXT NOT NULL,
-  hours_window      INT  NOT NULL,
-  topk_return       INT  NOT NULL,
-  stance_threshold  DOUBLE PRECISION NOT NULL,
-  normalized_link   TEXT NOT NULL,
-  updated_at        TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-  recommendations   JSONB NOT NULL,
-  PRIMARY KEY (base_link, hours_window, topk_return, stance_threshold)
-);
-CREATE INDEX IF NOT EXISTS idx_article_reco_updated_at ON article_reco (updated_at DESC);
-CREATE INDEX IF NOT EXISTS idx_article_reco_base_link ON article_reco (base_link);
-CREATE INDEX IF NOT EXISTS idx_article_reco_normalized ON article_reco (normalized_link);
-"""
-
-def ensure_cache_table():
-    conn = get_conn(); cur = conn.cursor()
-    try:
-        for stmt in filter(None, DDL_SQL.split(";")):
-            s = stmt.strip()
-            if s:
-                cur.execute(s + ";")
-        conn.commit()
-    finally:
-        cur.close(); conn.close()
-
-try:
-    ensure_cache_table()
-except Exception:
-    pass
-
-def _is_stale(updated_at, ttl_hours: int) -> bool:
-    if not updated_at:
-        return True
-    now = datetime.now(timezone.utc)
-    return (updated_at + timedelta(hours=ttl_hours)) < now
-
-def _get_cache(base_link: str, hours_window: int, topk_return: int, stance_threshold: float):
+def _respond(base_link: str, hours_window: int, res: dict, topk_return: int, stance_threshold: float):
     """
-    base_link 또는 normalized_link 둘 다로 조회 (정규화 차이로 인한 캐시 미스 감소)
+    후보 prefix → 요청 조합의 추천 응답. 기사 없음 등 에러 결과는 그대로.
+    prefix로 이 조합이 확정되지 않으면 prefix를 이어서 늘린 뒤 고름 (reco_store.settle)
     """
-    conn = get_conn(); cur = conn.cursor()
-    try:
-        cur.execute("""
-            SELECT recommendations, normalized_link, updated_at
-            FROM article_reco
-            WHERE (base_link=%s OR normalized_link=%s)
-              AND hours_window=%s
-              AND topk_return=%s
-              AND stance_threshold=%s
-            ORDER BY updated_at DESC
-            LIMIT 1;
-        """, (base_link, normalize_clicked(base_link), hours_window, topk_return, stance_threshold))
-        row = cur.fetchone()
-        return row if row else None
-    except psycopg2.errors.UndefinedTable:
-        conn.rollback()
-        ensure_cache_table()
-        return None
-    finally:
-        cur.close(); conn.close()
-
-def _upsert_cache(base_link: str, hours_window: int, topk_return: int, stance_threshold: float,
-                  normalized_link: str, payload: dict):
-    conn = get_conn(); cur = conn.cursor()
-    try:
-        payload_json = jsonable_encoder(payload)
-        cur.execute("""
-            INSERT INTO article_reco (base_link, hours_window, topk_return, stance_threshold,
-                                      normalized_link, recommendations)
-            VALUES (%s, %s, %s, %s, %s, %s::jsonb)
-            ON CONFLICT (base_link, hours_window, topk_return, stance_threshold)
-            DO UPDATE SET
-              normalized_link = EXCLUDED.normalized_link,
-              recommendations = EXCLUDED.recommendations,
-              updated_at = NOW();
-        """, (base_link, hours_window, topk_return, stance_threshold,
-              normalized_link, psycopg2.extras.Json(payload_json)))
-        conn.commit()
-    except psycopg2.Error as e:
-        try:
-            # 테이블 이슈 등 재시도
-            if getattr(e, "pgcode", None):
-                ensure_cache_table()
-                conn.rollback()
-                payload_json = jsonable_encoder(payload)
-                cur.execute("""
-                    INSERT INTO article_reco (base_link, hours_window, topk_return, stance_threshold,
-                                              normalized_link, recommendations)
-                    VALUES (%s, %s, %s, %s, %s, %s::jsonb)
-                    ON CONFLICT (base_link, hours_window, topk_return, stance_threshold)
-                    DO UPDATE SET
-                      normalized_link = EXCLUDED.normalized_link,
-                      recommendations = EXCLUDED.recommendations,
-                      updated_at = NOW();
-                """, (base_link, hours_window, topk_return, stance_threshold,
-                      normalized_link, psycopg2.extras.Json(payload_json)))
-                conn.commit()
-            else:
-                raise
-        finally:
-            pass
-    finally:
-        cur.close(); conn.close()
-
-def _recompute_and_upsert(base_link: str, hours_window: int, topk_return: int, stance_threshold: float):
-    res = compute_recommendations(base_link, hours_window, topk_return, stance_threshold)
-    if "recommendations" in res:
-        _upsert_cache(
-            base_link=base_link,
-            hours_window=hours_window,
-            topk_return=topk_return,
-            stance_threshold=stance_threshold,
-            normalized_link=res.get("clicked") or normalize_clicked(base_link),
-            payload=res
-        )
-    return res
+    res = reco_store.settle(base_link, hours_window, res, topk_return, stance_threshold)
+    if "candidates" not in res:
+        return res
+    return {
+        "clicked": res["clicked"],
+        "recommendations": select_recommendations(res["candidates"], topk_return, stance_threshold),
+    }
+
+def _schedule_refresh(background_tasks: BackgroundTasks, base_link: str, hours_window: int):
+    """같은 키의 백그라운드 리프레시는 하나만 예약"""
+    if reco_store.claim_refresh(base_link, hours_window):
+        background_tasks.add_task(reco_store.refresh_in_background, base_link, hours_window)
 
 def _handle_recommend(background_tasks: BackgroundTasks,
                       clicked_link: str,
@@ -135,29 +31,31 @@ def _handle_recommend(background_tasks: BackgroundTasks,
                       nli_threshold: float,
                       allow_stale: bool):
     """
-    캐시 우선 반환.
+    캐시 우선 반환. 캐시는 (기사, hours_window)당 유사도 순으로 점수 매긴 후보 prefix이고
+    topk_return / nli_threshold는 매 요청 그 목록에서 골라 씀
+    (prefix로 확정되는 조합은 재계산 없음, 아니면 prefix만 이어서 늘림).
     - 캐시 HIT & 신선: 그대로 반환
     - 캐시 HIT & 오래됨:
-        * allow_stale=True  -> 캐시 반환 + 백그라운드 리프레시
+        * allow_stale=True  -> 캐시 반환 + 백그라운드 리프레시 (키당 하나)
         * allow_stale=False -> 동기 재계산 후 최신값 반환
     - 캐시 MISS: 동기 계산 + 업서트 후 반환
+    동기 계산은 키별 single-flight (reco_store.compute_coalesced)
     """
-    cache = _get_cache(clicked_link, hours_window, topk_return, nli_threshold)
+    cache = reco_store.get_cache(clicked_link, hours_window)
     if cache:
-        payload, _, updated_at = cache
-        stale = _is_stale(updated_at, CACHE_TTL_HOURS)
+        stale = reco_store.is_stale(cache[2])
         if stale and not allow_stale:
             # 동기 재계산
-            fresh = _recompute_and_upsert(clicked_link, hours_window, topk_return, nli_threshold)
-            return fresh
+            res = reco_store.compute_coalesced(clicked_link, hours_window, topk_return, nli_threshold)
+            return _respond(clicked_link, hours_window, res, topk_return, nli_threshold)
         if stale and allow_stale:
             # 캐시 반환 + 백그라운드 리프레시
-            background_tasks.add_task(_recompute_and_upsert, clicked_link, hours_window, topk_return, nli_threshold)
-        return payload
+            _schedule_refresh(background_tasks, clicked_link, hours_window)
+        return _respond(clicked_link, hours_window, reco_store.row_result(cache), topk_return, nli_threshold)
 
     # MISS → 동기 계산
-    result = _recompute_and_upsert(clicked_link, hours_window, topk_return, nli_threshold)
-    return result
+    res = reco_store.compute_coalesced(clicked_link, hours_window, topk_return, nli_threshold)
+    return _respond(clicked_link, hours_window, res, topk_return, nli_threshold)
 
 
 @router.get("/article/recommend")
@@ -200,11 +98,11 @@ def recommend_cached_articles(
     topk_return: int = Query(8, ge=1, le=20),
     nli_threshold: float = Query(0.1, ge=0.0, le=1.0),
 ):
-    row = _get_cache(clicked_link, hours_window, topk_return, nli_threshold)
-    if not row:
-        return Response(status_code=204)  # 캐시 없음은 204로
-    payload, _, _ = row
-    return payload
+    row = reco_store.get_cache(clicked_link, hours_window)
+    # 캐시 없음 / 캐시된 prefix로 이 조합이 확정되지 않음은 204로 (여기서는 계산하지 않음)
+    if not row or not is_settled(row[0], row[3], topk_return, nli_threshold):
+        return Response(status_code=204)
+    return _respond(clicked_link, hours_window, reco_store.row_result(row), topk_return, nli_threshold)
 
 @router.get("/recommend-cached")
 def recommend_cached_alias(**kwargs):
@@ -1,41 +1,16 @@
 from fastapi import APIRouter, HTTPException, Query
 from bs4 import BeautifulSoup
-import psycopg2, requests, os, re
+import requests, os, re
 from datetime import datetime, date
+from typing import Optional
 from html import unescape
 from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
 from html import unescape as html_unescape
 
-router = APIRouter()
-
-def init_db():
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS news (
-            id SERIAL PRIMARY KEY,
-            title TEXT NOT NULL,
-            content TEXT,
-            date TIMESTAMP,
-            link TEXT UNIQUE
-        )
-    """)
-
-    cur.execute("ALTER TABLE news ADD COLUMN IF NOT EXISTS summary TEXT")
-    conn.commit()
-    cur.close()
-    conn.close()
-
-# DB 연결 함수
-def get_conn():
-    return psycopg2.connect(
-        host=os.getenv("PGHOST", "db"), 
-        dbname=os.getenv("PGDATABASE", "appdb"),
-        user=os.getenv("PGUSER", "appuser"),
-        password=os.getenv("PGPASSWORD", "apppw"),
-        port=int(os.getenv("PGPORT", "5432")),
-    )
+from app.db.pool import get_conn
+from app.utils.pagination import cursor_after, fetch_keyset_page
 
+router = APIRouter()
 
 UA = {
     "User-Agent": (
@@ -155,8 +130,6 @@ def extract_article_text(doc: BeautifulSoup) -> str:
 # 크롤링
 @router.get("/article/crawl")
 def crawl_news():
-    init_db()
-
     url = "https://news.naver.com/section/100"
     res = requests.get(url, headers=UA, timeout=10)
     soup = BeautifulSoup(res.text, "html.parser")
@@ -182,25 +155,28 @@ def crawl_news():
     conn = get_conn()
     cur = conn.cursor()
     inserted_ids = []
-
-    for title, content, news_date, link in collected:
-        # 이미 같은 link가 있으면 크롤링 안함
-        cur.execute(
-            """
-            INSERT INTO news (title, content, date, link)
-            VALUES (%s, %s, %s, %s)
-            ON CONFLICT (link) DO NOTHING
-            RETURNING id
-            """,
-            (title, content, news_date, link),
-        )
-        row = cur.fetchone()
-        if row:
-            inserted_ids.append(row[0])
-
-    conn.commit()
-    cur.close()
-    conn.close()
+    try:
+        for title, content, news_date, link in collected:
+            # 이미 같은 link가 있으면 크롤링 안함
+            cur.execute(
+                """
+                INSERT INTO news (title, content, date, link)
+                VALUES (%s, %s, %s, %s)
+                ON CONFLICT (link) DO NOTHING
+                RETURNING id
+                """,
+                (title, content, news_date, link),
+            )
+            row = cur.fetchone()
+            if row:
+                inserted_ids.append(row[0])
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+        conn.close()
 
     # 새로 들어간 기사(id)가 있을 때만 요약 webhook 호출
     if inserted_ids:
@@ -219,22 +195,41 @@ def crawl_news():
 
 # 기사 목록 조회
 @router.get("/article")
-def get_news(limit: int = 50, offset: int = 0):
-    init_db()
+def get_news(
+    limit: int = 50,
+    offset: int = 0,
+    after: Optional[str] = Query(None, description="이전 응답의 next_cursor (주면 offset 무시)"),
+):
     conn = get_conn()
     cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT id, title, content, summary, date, link
-        FROM news
-        ORDER BY date DESC NULLS LAST
-        LIMIT %s OFFSET %s
-        """,
-        (limit, offset),
-    )
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
+    try:
+        if after:
+            rows, next_cursor = fetch_keyset_page(
+                cur,
+                scope="article",
+                select_sql="SELECT id, title, content, summary, date, link FROM news",
+                where=[],
+                params=[],
+                key=lambda r: (r[4], r[0]),
+                limit=limit,
+                after=after,
+            )
+        else:
+            cur.execute(
+                """
+                SELECT id, title, content, summary, date, link
+                FROM news
+                ORDER BY date DESC NULLS LAST, id DESC
+                LIMIT %s OFFSET %s
+                """,
+                (limit, offset),
+            )
+            rows = cur.fetchall()
+            # offset 페이지 다음부터는 커서로 이어갈 수 있게
+            next_cursor = cursor_after("article", rows[-1][4], rows[-1][0]) if rows and len(rows) >= limit else None
+    finally:
+        cur.close()
+        conn.close()
 
     arts = []
     for _id, title, content, summary, dt, link in rows:
@@ -248,26 +243,27 @@ def get_news(limit: int = 50, offset: int = 0):
                 "link": link or "",
             }
         )
-    return {"count": len(arts), "articles": arts}
+    return {"count": len(arts), "articles": arts, "next_cursor": next_cursor}
 
 
 @router.get("/article/{article_id:int}")
 def get_article(article_id: int):
-    init_db()
     conn = get_conn()
     cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT id, title, content, summary, date, link
-        FROM news
-        WHERE id = %s
-        LIMIT 1
-        """,
-        (article_id,),
-    )
-    row = cur.fetchone()
-    cur.close()
-    conn.close()
+    try:
+        cur.execute(
+            """
+            SELECT id, title, content, summary, date, link
+            FROM news
+            WHERE id = %s
+            LIMIT 1
+            """,
+            (article_id,),
+        )
+        row = cur.fetchone()
+    finally:
+        cur.close()
+        conn.close()
 
     if not row:
         raise HTTPException(status_code=404, detail="article not found")
@@ -285,25 +281,26 @@ def get_article(article_id: int):
 
 @router.get("/article/by-link")
 def get_article_by_link(link: str = Query(..., description="원문 링크(URL)")):
-    init_db()
     raw = link
     norm = html_unescape(raw).replace("&amp;", "&")
     stripped = _strip_tracking(norm)
 
     conn = get_conn()
     cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT id, title, content, date, link
-        FROM news
-        WHERE link = %s OR link = %s OR link = %s
-        LIMIT 1
-        """,
-        (raw, norm, stripped),
-    )
-    row = cur.fetchone()
-    cur.close()
-    conn.close()
+    try:
+        cur.execute(
+            """
+            SELECT id, title, content, date, link
+            FROM news
+            WHERE link = %s OR link = %s OR link = %s
+            LIMIT 1
+            """,
+            (raw, norm, stripped),
+        )
+        row = cur.fetchone()
+    finally:
+        cur.close()
+        conn.close()
 
     if not row:
         raise HTTPException(status_code=404, detail="article not found")
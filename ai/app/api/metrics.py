@@ -0,0 +1,30 @@
+# app/api/metrics.py
+from fastapi import APIRouter
+
+from app.api.rss_crawl import crawl_counters
+from app.db.pool import pool_stats
+from app.services.reco_cache import tier_stats as reco_cache_stats
+from app.services.reco_precompute import precompute_stats
+from app.services.reco_store import single_flight_stats
+from app.services.recommend_core import scoring_stats
+from app.services.vector_store import vectorizer_stats
+from app.utils.url_normalize import alias_stats
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/admin/metrics")
+def get_metrics():
+    """
+    프로세스 내부 지표 모음 (워커 프로세스별 값).
+    """
+    return {
+        "db_pool": pool_stats(),
+        "vectorizer": vectorizer_stats(),
+        "rss": crawl_counters(),
+        "reco_cache": reco_cache_stats(),
+        "reco_single_flight": single_flight_stats(),
+        "reco_precompute": precompute_stats(),
+        "reco_scoring": scoring_stats(),
+        "link_alias": alias_stats(),
+    }
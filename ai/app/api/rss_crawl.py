@@ -1,24 +1,46 @@
+import asyncio
 import html
+import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from dateutil import parser as dtparser
 from typing import Optional, List, Dict, Any
 import feedparser
 import httpx
 import psycopg2
+import psycopg2.extras
 from fastapi import APIRouter, HTTPException, Query
 from trafilatura import extract as tr_extract
 from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 
+from app.db.pool import get_conn
+from app.utils.pagination import cursor_after, fetch_keyset_page
 from app.ingest.rss_sources import RSS_FEEDS, LEAN
 
 router = APIRouter()
 
-DBCFG = dict(host="Veritas-db", dbname="appdb", user="appuser", password="apppw")
+USER_AGENT = "VeritasBot/0.1 (+research; contact: dev@example.com)"
 
-def get_conn():
-    return psycopg2.connect(**DBCFG)
+# 동시에 크롤링할 피드 수 / 호스트당 동시 요청 수 / 같은 호스트 요청 시작 간 최소 간격(초)
+FEED_CONCURRENCY = int(os.getenv("RSS_FEED_CONCURRENCY", "16"))
+PER_HOST_LIMIT = int(os.getenv("RSS_PER_HOST_LIMIT", "2"))
+POLITE_DELAY = float(os.getenv("RSS_POLITE_DELAY", "0.8"))
+# trafilatura 본문 추출용 워커 수
+EXTRACT_WORKERS = int(os.getenv("RSS_EXTRACT_WORKERS", "4"))
+# 이미 본문이 저장된 기사를 다시 받아보는 주기(시간). 0이면 재수집하지 않음
+REFETCH_AFTER_HOURS = float(os.getenv("RSS_REFETCH_AFTER_HOURS", "0"))
+
+# 프로세스 누적 크롤 카운터 (/api/admin/metrics)
+_COUNTER_KEYS = ("fetches", "bytes_fetched", "not_modified", "fetches_saved", "bytes_saved")
+_crawl_counters: Dict[str, int] = {k: 0 for k in _COUNTER_KEYS}
+_crawl_counters_lock = threading.Lock()
+
+def crawl_counters() -> Dict[str, int]:
+    with _crawl_counters_lock:
+        return dict(_crawl_counters)
 
 def _parse_date(entry):
     for k in ("published", "updated", "pubDate"):
@@ -49,12 +71,77 @@ def _extract_from_rss_entry(entry):
     txt = re.sub(r"\s+", " ", txt)
     return txt
 
-def _polite_fetch(url, timeout=12.0):
-    headers = {"User-Agent": "VeritasBot/0.1 (+research; contact: dev@example.com)"}
-    with httpx.Client(follow_redirects=True, timeout=timeout, headers=headers) as client:
-        r = client.get(url)
+class _CrawlContext:
+    """
+    크롤 1회 동안 공유하는 상태.
+    - keep-alive 풀을 가진 httpx.AsyncClient 하나
+    - 호스트별 동시성 제한 + 요청 시작 간격(politeness)
+    - trafilatura 추출용 워커 풀
+    - 조건부 요청 카운터 + 크롤 끝에 http_cache로 기록할 validator 목록
+    """
+
+    def __init__(self, client: httpx.AsyncClient, extractor: ThreadPoolExecutor,
+                 per_host_limit: int, polite_delay: float):
+        self.client = client
+        self.extractor = extractor
+        self.per_host_limit = max(1, per_host_limit)
+        self.polite_delay = polite_delay
+        self._host_sem: Dict[str, asyncio.Semaphore] = {}
+        self._host_lock: Dict[str, asyncio.Lock] = {}
+        self._host_next: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {k: 0 for k in _COUNTER_KEYS}
+        # (url, etag, last_modified, body_bytes, canonical_url)
+        self.validators: List[tuple] = []
+
+    async def _wait_turn(self, host: str):
+        lock = self._host_lock.setdefault(host, asyncio.Lock())
+        async with lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            start = max(now, self._host_next.get(host, 0.0))
+            self._host_next[host] = start + self.polite_delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def fetch(self, url: str, cached: Optional[Dict[str, Any]] = None) -> Optional[httpx.Response]:
+        """
+        cached에 validator가 있으면 조건부 요청.
+        304면 None 반환 (본문 파싱/추출 생략).
+        """
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        host = (urlparse(url).hostname or "").lower()
+        sem = self._host_sem.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+        async with sem:
+            await self._wait_turn(host)
+            r = await self.client.get(url, headers=headers or None)
+        self.counters["fetches"] += 1
+        if r.status_code == 304:
+            self.counters["not_modified"] += 1
+            self.counters["bytes_saved"] += int((cached or {}).get("body_bytes") or 0)
+            return None
         r.raise_for_status()
-        return r.text
+        self.counters["bytes_fetched"] += len(r.content)
+        return r
+
+    def skip(self, cached: Dict[str, Any]):
+        """요청 자체를 생략한 경우"""
+        self.counters["fetches_saved"] += 1
+        self.counters["bytes_saved"] += int(cached.get("body_bytes") or 0)
+
+    def remember(self, url: str, etag: Optional[str], last_modified: Optional[str],
+                 body_bytes: int, canonical_url: Optional[str] = None):
+        self.validators.append((url, etag, last_modified, body_bytes, canonical_url))
+
+    def remember_response(self, url: str, r: httpx.Response, canonical_url: Optional[str] = None):
+        self.remember(url, r.headers.get("etag"), r.headers.get("last-modified"), len(r.content), canonical_url)
+
+    async def run_cpu(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.extractor, fn, *args)
 
 _CANON_RE = re.compile(
     r'<link[^>]+rel=["\']canonical["\'][^>]*href=["\'](?P<href>[^"\']+)["\']',
@@ -87,49 +174,221 @@ def _canonicalize_url(orig_url: str, html_doc: str) -> str:
     # 3) 추적 파라미터만 제거
     return _strip_tracking_params(orig_url)
 
-def _extract_full(url: str):
+def _extract_text(html_doc: str, url: str):
+    text = tr_extract(html_doc, url=url, include_comments=False, include_tables=False) or ""
+    # trafilatura 텍스트도 정리
+    text = html.unescape(text).strip()
+    text = re.sub(r"\s+", " ", text)
+    canon = _canonicalize_url(url, html_doc)
+    return text, canon
+
+async def _extract_full(ctx: _CrawlContext, url: str, cached: Optional[Dict[str, Any]] = None):
     try:
-        html_doc = _polite_fetch(url)
-        time.sleep(0.8)
-        text = tr_extract(html_doc, url=url, include_comments=False, include_tables=False) or ""
-        # trafilatura 텍스트도 정리
-        text = html.unescape(text).strip()
-        text = re.sub(r"\s+", " ", text)
-        canon = _canonicalize_url(url, html_doc)
+        r = await ctx.fetch(url, cached)
+        if r is None:
+            # 304: 저장된 본문 그대로 사용
+            ctx.remember(url, cached.get("etag"), cached.get("last_modified"),
+                         int(cached.get("body_bytes") or 0), cached.get("stored_link"))
+            return "", cached["stored_link"]
+        text, canon = await ctx.run_cpu(_extract_text, r.text, url)
+        ctx.remember_response(url, r, canon)
         return text, canon
     except Exception:
+        if cached and cached.get("stored_link"):
+            return "", cached["stored_link"]
         return "", _strip_tracking_params(url)
 
-def _upsert(row: dict) -> bool:
+def _load_http_cache(cur, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+    cur.execute(
+        """
+        SELECT url, etag, last_modified, body_bytes, canonical_url, checked_at
+        FROM http_cache WHERE url = ANY(%s)
+        """,
+        (urls,)
+    )
+    return {
+        r[0]: {"etag": r[1], "last_modified": r[2], "body_bytes": r[3],
+               "canonical_url": r[4], "checked_at": r[5]}
+        for r in cur.fetchall()
+    }
+
+def _load_feed_validators(urls: List[str]) -> Dict[str, Dict[str, Any]]:
+    if not urls:
+        return {}
+    conn = get_conn(); cur = conn.cursor()
+    try:
+        return _load_http_cache(cur, urls)
+    finally:
+        cur.close(); conn.close()
+
+def _lookup_known_articles(raw_links: List[str]) -> Dict[str, Dict[str, Any]]:
     """
-    news(link) 고유 제약이 있다고 가정합니다.
-    반환값: True면 새 insert, False면 기존 row update
+    피드 항목 링크 → 기존 상태.
+    stored_link: news에 본문(content)이 있는 행의 link (canonical/추적 파라미터 제거본까지 확인)
+    """
+    if not raw_links:
+        return {}
+    conn = get_conn(); cur = conn.cursor()
+    try:
+        cache = _load_http_cache(cur, raw_links)
+        candidates = {}
+        for u in raw_links:
+            canon = (cache.get(u) or {}).get("canonical_url")
+            candidates[u] = [x for x in (canon, u, _strip_tracking_params(u)) if x]
+        cur.execute(
+            "SELECT link FROM news WHERE link = ANY(%s) AND COALESCE(content,'') <> ''",
+            (list({x for xs in candidates.values() for x in xs}),)
+        )
+        have = {r[0] for r in cur.fetchall()}
+    finally:
+        cur.close(); conn.close()
+
+    known = {}
+    for u in raw_links:
+        stored = next((x for x in candidates[u] if x in have), None)
+        if u in cache or stored:
+            info = dict(cache.get(u) or {})
+            info["stored_link"] = stored
+            known[u] = info
+    return known
+
+def _save_validators(validators: List[tuple]):
+    if not validators:
+        return
+    # 같은 URL이 여러 번 나오면 마지막 값만
+    latest = {v[0]: v for v in validators}
+    conn = get_conn(); cur = conn.cursor()
+    try:
+        psycopg2.extras.execute_values(
+            cur,
+            """
+            INSERT INTO http_cache (url, etag, last_modified, body_bytes, canonical_url)
+            VALUES %s
+            ON CONFLICT (url) DO UPDATE SET
+              etag          = EXCLUDED.etag,
+              last_modified = EXCLUDED.last_modified,
+              body_bytes    = EXCLUDED.body_bytes,
+              canonical_url = COALESCE(EXCLUDED.canonical_url, http_cache.canonical_url),
+              checked_at    = NOW()
+            """,
+            list(latest.values())
+        )
+        conn.commit()
+    finally:
+        cur.close(); conn.close()
+
+def _due_refresh(info: Dict[str, Any]) -> bool:
+    if REFETCH_AFTER_HOURS <= 0:
+        return False
+    checked = info.get("checked_at")
+    return checked is None or checked < datetime.now(timezone.utc) - timedelta(hours=REFETCH_AFTER_HOURS)
+
+# news bulk upsert 한 페이지당 행 수
+UPSERT_PAGE_SIZE = int(os.getenv("RSS_UPSERT_PAGE_SIZE", "500"))
+
+_UPSERT_SQL = """
+INSERT INTO news (source, lean, title, summary, content, link, date, author, section, origin)
+VALUES %s
+ON CONFLICT (link) DO UPDATE SET
+  title   = EXCLUDED.title,
+  -- EXCLUDED.summary가 ''이면 기존 summary 유지
+  summary = COALESCE(NULLIF(EXCLUDED.summary,''), news.summary),
+  content = CASE WHEN COALESCE(LENGTH(news.content),0) < COALESCE(LENGTH(EXCLUDED.content),0)
+                 THEN EXCLUDED.content ELSE news.content END,
+  date    = COALESCE(EXCLUDED.date, news.date),
+  source  = EXCLUDED.source,
+  lean    = EXCLUDED.lean,
+  author  = COALESCE(EXCLUDED.author, news.author),
+  section = COALESCE(EXCLUDED.section, news.section),
+  -- 벡터에 들어가는 필드가 바뀐 경우에만 증분 인덱싱 대상으로
+  updated_at = CASE
+    WHEN news.title IS DISTINCT FROM EXCLUDED.title
+      OR COALESCE(LENGTH(news.content),0) < COALESCE(LENGTH(EXCLUDED.content),0)
+      OR news.date IS DISTINCT FROM COALESCE(EXCLUDED.date, news.date)
+      OR news.source IS DISTINCT FROM EXCLUDED.source
+      OR news.lean IS DISTINCT FROM EXCLUDED.lean
+    THEN NOW() ELSE news.updated_at END
+RETURNING link, (xmax = 0) AS inserted
+"""
+_UPSERT_TEMPLATE = (
+    "(%(source)s, %(lean)s, %(title)s, %(summary)s, %(content)s, %(link)s,"
+    " %(date)s, %(author)s, %(section)s, 'rss')"
+)
+
+def _merge_duplicate(prev: dict, row: dict) -> dict:
+    """
+    같은 link가 한 배치에 두 번 나온 경우, 순서대로 upsert했을 때와 같은 결과로 합침
+    (ON CONFLICT는 한 문장에서 같은 행을 두 번 갱신할 수 없음)
+    """
+    merged = dict(row)
+    if len(prev.get("content") or "") > len(row.get("content") or ""):
+        merged["content"] = prev["content"]
+    for k in ("summary", "date", "author", "section"):
+        if not merged.get(k):
+            merged[k] = prev.get(k)
+    return merged
+
+def _upsert_many(rows: List[Dict[str, Any]]) -> Dict[str, bool]:
     """
-    sql = """
-    INSERT INTO news (source, lean, title, summary, content, link, date, author, section, origin)
-    VALUES (%(source)s, %(lean)s, %(title)s, %(summary)s, %(content)s, %(link)s, %(date)s, %(author)s, %(section)s, 'rss')
-    ON CONFLICT (link) DO UPDATE SET
-      title   = EXCLUDED.title,
-      -- EXCLUDED.summary가 ''이면 기존 summary 유지
-      summary = COALESCE(NULLIF(EXCLUDED.summary,''), news.summary),
-      content = CASE WHEN COALESCE(LENGTH(news.content),0) < COALESCE(LENGTH(EXCLUDED.content),0)
-                     THEN EXCLUDED.content ELSE news.content END,
-      date    = COALESCE(EXCLUDED.date, news.date),
-      source  = EXCLUDED.source,
-      lean    = EXCLUDED.lean,
-      author  = COALESCE(EXCLUDED.author, news.author),
-      section = COALESCE(EXCLUDED.section, news.section)
-    RETURNING (xmax = 0) AS inserted;
+    news(link) 고유 제약이 있다고 가정합니다.
+    link 중복이 없는 rows를 한 트랜잭션에서 execute_values로 upsert.
+    반환값: link → True면 새 insert, False면 기존 row update
     """
+    if not rows:
+        return {}
     conn = get_conn(); cur = conn.cursor()
-    cur.execute(sql, row)
-    inserted = bool(cur.fetchone()[0])
-    conn.commit()
-    cur.close(); conn.close()
-    return inserted
+    try:
+        res = psycopg2.extras.execute_values(
+            cur, _UPSERT_SQL, rows,
+            template=_UPSERT_TEMPLATE, page_size=UPSERT_PAGE_SIZE, fetch=True
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close(); conn.close()
+    return {link: bool(inserted) for link, inserted in res}
 
-def crawl_one_feed(source_name: str, feed_url: str) -> Dict[str, Any]:
-    d = feedparser.parse(feed_url)
+async def _entry_to_row(ctx: _CrawlContext, source_name: str, e,
+                        known: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    raw_link = e.link
+    title = (e.title or "").strip()
+    title = html.unescape(title)
+    date = _parse_date(e)
+    author = getattr(e, "author", None)
+    section = "politics"
+    lean = LEAN.get(source_name, "centrist")
+
+    rss_text = _extract_from_rss_entry(e)
+    info = (known or {}).get(raw_link)
+    if info and info.get("stored_link"):
+        if _due_refresh(info):
+            # 재수집 주기가 지난 기사만 조건부 요청
+            fulltext, canon_link = await _extract_full(ctx, raw_link, info)
+        else:
+            # 이미 본문이 있는 기사: 요청 자체를 생략 (content는 upsert에서 기존 값 유지)
+            ctx.skip(info)
+            fulltext, canon_link = "", info["stored_link"]
+    else:
+        fulltext, canon_link = await _extract_full(ctx, raw_link)
+
+    # fulltext가 더 길면 그걸 content로, 아니면 rss_text 사용
+    content = fulltext if len(fulltext) >= len(rss_text) else rss_text
+
+    return dict(
+        source=source_name,
+        lean=lean,
+        title=title,
+        summary="",
+        content=content,
+        link=canon_link,
+        date=date,
+        author=author,
+        section=section
+    )
+
+def _store_rows(source_name: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
     stats = {
         "source": source_name,
         "processed": 0,
@@ -137,77 +396,155 @@ def crawl_one_feed(source_name: str, feed_url: str) -> Dict[str, Any]:
         "updated": 0,
         "samples": {"inserted": [], "updated": []}
     }
-    for e in d.entries:
-        raw_link = e.link
-        title = (e.title or "").strip()
-        title = html.unescape(title)
-        date = _parse_date(e)
-        author = getattr(e, "author", None)
-        section = "politics"
-        lean = LEAN.get(source_name, "centrist")
-
-        rss_text = _extract_from_rss_entry(e)
-        fulltext, canon_link = _extract_full(raw_link)
-
-        # fulltext가 더 길면 그걸 content로, 아니면 rss_text 사용
-        content = fulltext if len(fulltext) >= len(rss_text) else rss_text
-
-        row = dict(
-            source=source_name,
-            lean=lean,
-            title=title,
-            summary="",       
-            content=content,
-            link=canon_link,
-            date=date,
-            author=author,
-            section=section
-        )
-        inserted = _upsert(row)
+    unique: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        link = row["link"]
+        unique[link] = _merge_duplicate(unique[link], row) if link in unique else row
+    result = _upsert_many(list(unique.values()))
+
+    seen = set()
+    for row in rows:
+        # 배치 안 중복 link는 첫 번째만 insert 가능, 나머지는 update로 집계
+        inserted = result.get(row["link"], False) and row["link"] not in seen
+        seen.add(row["link"])
         stats["processed"] += 1
-        if inserted:
-            stats["inserted"] += 1
-            if len(stats["samples"]["inserted"]) < 3:
-                stats["samples"]["inserted"].append({"title": title, "link": canon_link})
-        else:
-            stats["updated"] += 1
-            if len(stats["samples"]["updated"]) < 3:
-                stats["samples"]["updated"].append({"title": title, "link": canon_link})
+        key = "inserted" if inserted else "updated"
+        stats[key] += 1
+        if len(stats["samples"][key]) < 3:
+            stats["samples"][key].append({"title": row["title"], "link": row["link"]})
     return stats
 
-def crawl_rss(sources: Optional[List[str]] = None) -> Dict[str, Any]:
+async def crawl_one_feed_async(ctx: _CrawlContext, source_name: str, feed_url: str,
+                               cached: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    r = await ctx.fetch(feed_url, cached)
+    if r is None:
+        # 304: 피드가 바뀌지 않았으면 파싱/기사 수집 모두 생략
+        ctx.remember(feed_url, cached.get("etag"), cached.get("last_modified"),
+                     int(cached.get("body_bytes") or 0))
+        return {
+            "source": source_name, "processed": 0, "inserted": 0, "updated": 0,
+            "not_modified": True, "samples": {"inserted": [], "updated": []},
+            "timing": {"total_sec": round(time.perf_counter() - t0, 3)},
+        }
+    d = await ctx.run_cpu(feedparser.parse, r.content)
+    t_feed = time.perf_counter()
+
+    known = await asyncio.to_thread(_lookup_known_articles, [e.link for e in d.entries if e.get("link")])
+    rows = await asyncio.gather(*[_entry_to_row(ctx, source_name, e, known) for e in d.entries])
+    t_articles = time.perf_counter()
+
+    stats = await asyncio.to_thread(_store_rows, source_name, list(rows))
+    t_end = time.perf_counter()
+    # 피드 validator는 기사 저장이 커밋된 뒤에만 기록.
+    # 파싱/저장이 실패했는데 ETag가 남으면 다음 크롤이 304를 받아 그 기사들을 영영 못 가져옴
+    ctx.remember_response(feed_url, r)
+
+    stats["timing"] = {
+        "feed_sec": round(t_feed - t0, 3),
+        "articles_sec": round(t_articles - t_feed, 3),
+        "store_sec": round(t_end - t_articles, 3),
+        "total_sec": round(t_end - t0, 3),
+    }
+    return stats
+
+async def crawl_rss_async(
+    sources: Optional[List[str]] = None,
+    *,
+    feeds: Optional[Dict[str, str]] = None,
+    feed_concurrency: int = FEED_CONCURRENCY,
+    per_host_limit: int = PER_HOST_LIMIT,
+    polite_delay: float = POLITE_DELAY,
+) -> Dict[str, Any]:
+    """
+    공유 AsyncClient(keep-alive 풀) 하나로 피드들을 동시에 크롤링.
+    호스트별 동시성/간격 제한으로 politeness 유지.
+    피드는 ETag/Last-Modified 조건부 요청, 본문이 이미 있는 기사는 재다운로드 생략.
+    """
+    feeds = feeds if feeds is not None else RSS_FEEDS
+    targets = [(src, url) for src, url in feeds.items() if not sources or src in sources]
+
     total = {"processed": 0, "inserted": 0, "updated": 0}
     by_source: Dict[str, Any] = {}
-    for src, url in RSS_FEEDS.items():
-        if sources and src not in sources:
+    feed_sem = asyncio.Semaphore(max(1, feed_concurrency))
+    limits = httpx.Limits(
+        max_connections=max(1, feed_concurrency) * max(1, per_host_limit),
+        max_keepalive_connections=max(1, feed_concurrency) * max(1, per_host_limit),
+    )
+
+    t0 = time.perf_counter()
+    try:
+        feed_cache = await asyncio.to_thread(_load_feed_validators, [url for _, url in targets])
+    except Exception:
+        feed_cache = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, EXTRACT_WORKERS), thread_name_prefix="rss-extract") as extractor:
+        async with httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=12.0,
+            headers={"User-Agent": USER_AGENT},
+            limits=limits,
+        ) as client:
+            ctx = _CrawlContext(client, extractor, per_host_limit, polite_delay)
+
+            async def _one(src: str, url: str):
+                async with feed_sem:
+                    try:
+                        by_source[src] = await crawl_one_feed_async(ctx, src, url, feed_cache.get(url))
+                    except Exception as ex:
+                        by_source[src] = {"error": str(ex)}
+
+            await asyncio.gather(*[_one(src, url) for src, url in targets])
+
+    try:
+        await asyncio.to_thread(_save_validators, ctx.validators)
+    except Exception:
+        pass
+    with _crawl_counters_lock:
+        for k, v in ctx.counters.items():
+            _crawl_counters[k] += v
+
+    for st in by_source.values():
+        if "error" in st:
             continue
-        try:
-            st = crawl_one_feed(src, url)
-            by_source[src] = st
-            total["processed"] += st["processed"]
-            total["inserted"] += st["inserted"]
-            total["updated"] += st["updated"]
-        except Exception as ex:
-            by_source[src] = {"error": str(ex)}
+        total["processed"] += st["processed"]
+        total["inserted"] += st["inserted"]
+        total["updated"] += st["updated"]
+    total.update(ctx.counters)
+    total["elapsed_sec"] = round(time.perf_counter() - t0, 3)
     return {"total": total, "by_source": by_source}
 
+def crawl_rss(sources: Optional[List[str]] = None) -> Dict[str, Any]:
+    """스케줄러 등 동기 코드용 진입점"""
+    return asyncio.run(crawl_rss_async(sources))
+
+def crawl_one_feed(source_name: str, feed_url: str) -> Dict[str, Any]:
+    res = asyncio.run(crawl_rss_async(feeds={source_name: feed_url}))
+    st = res["by_source"][source_name]
+    if "error" in st:
+        raise RuntimeError(st["error"])
+    return st
+
 # -----------------------
 # 수동 실행 API
 # -----------------------
 @router.post("/rss/run")
-def run_rss_now(
+async def run_rss_now(
     sources: Optional[List[str]] = Query(
         default=None,
         description="지정하면 해당 소스만 실행. 예: ?sources=NYTimes&sources=BBC"
     )
 ):
-    return crawl_rss(sources)
+    return await crawl_rss_async(sources)
 
 @router.post("/rss/run/{source_name}")
-def run_one_source_now(source_name: str):
+async def run_one_source_now(source_name: str):
     if source_name not in RSS_FEEDS:
         raise HTTPException(status_code=404, detail=f"unknown source: {source_name}")
-    st = crawl_one_feed(source_name, RSS_FEEDS[source_name])
+    res = await crawl_rss_async([source_name])
+    st = res["by_source"][source_name]
+    if "error" in st:
+        raise HTTPException(status_code=502, detail=st["error"])
     return {"total": {"processed": st["processed"], "inserted": st["inserted"], "updated": st["updated"]},
             "by_source": {source_name: st}}
 
@@ -221,24 +558,27 @@ def rss_stats(since_hours: int = 24):
     """
     since_dt = datetime.now(timezone.utc) - timedelta(hours=since_hours)
     conn = get_conn(); cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT
-            source,
-            COUNT(*) AS total,
-            COUNT(*) FILTER (WHERE COALESCE(date, 'epoch'::timestamptz) >= %s) AS within_window,
-            MAX(date) AS latest_article_date
-        FROM news
-        WHERE origin = 'rss'
-        GROUP BY source
-        ORDER BY source
-        """,
-        (since_dt,)
-    )
-    rows = cur.fetchall()
-    cur.execute("SELECT MAX(COALESCE(date, 'epoch'::timestamptz)) FROM news WHERE origin='rss'")
-    latest_overall = cur.fetchone()[0]
-    cur.close(); conn.close()
+    try:
+        cur.execute(
+            """
+            SELECT
+                source,
+                COUNT(*) AS total,
+                COUNT(*) FILTER (WHERE COALESCE(date, 'epoch') >= %s) AS within_window,
+                MAX(date) AS latest_article_date
+            FROM news
+            WHERE origin = 'rss'
+            GROUP BY source
+            ORDER BY source
+            """,
+            (since_dt,)
+        )
+        rows = cur.fetchall()
+        # idx_news_rss_date 식과 같은 형태여야 인덱스 한 번 읽기로 끝남
+        cur.execute("SELECT MAX(COALESCE(date, 'epoch')) FROM news WHERE origin='rss'")
+        latest_overall = cur.fetchone()[0]
+    finally:
+        cur.close(); conn.close()
 
     return {
         "since": since_dt.isoformat(),
@@ -257,28 +597,51 @@ def rss_stats(since_hours: int = 24):
 def rss_recent(
     source: Optional[str] = Query(default=None, description="특정 소스만 보기"),
     limit: int = Query(default=50, ge=1, le=200),
-    offset: int = Query(default=0, ge=0)
+    offset: int = Query(default=0, ge=0),
+    after: Optional[str] = Query(default=None, description="이전 응답의 next_cursor (주면 offset 무시)")
 ):
     """
     최신 문서 리스트(페이징).
+    after(커서)를 주면 keyset 페이지네이션: 깊은 페이지도 첫 페이지와 같은 비용.
     """
-    conn = get_conn(); cur = conn.cursor()
-    sql = """
-        SELECT source, lean, title, summary, link, date, author, section
+    # idx_news_rss_date (COALESCE(date, 'epoch') DESC, id DESC) WHERE origin='rss' 순서와 동일
+    select_sql = """
+        SELECT source, lean, title, summary, link, date, author, section,
+               COALESCE(date, 'epoch') AS sort_date, id
         FROM news
-        WHERE origin='rss'
     """
+    where = ["origin='rss'"]
     params: List[Any] = []
     if source:
-        sql += " AND source = %s"
+        where.append("source = %s")
         params.append(source)
 
-    sql += " ORDER BY COALESCE(date, 'epoch'::timestamptz) DESC NULLS LAST LIMIT %s OFFSET %s"
-    params.extend([limit, offset])
-
-    cur.execute(sql, tuple(params))
-    rows = cur.fetchall()
-    cur.close(); conn.close()
+    conn = get_conn(); cur = conn.cursor()
+    try:
+        if after:
+            rows, next_cursor = fetch_keyset_page(
+                cur,
+                scope="rss",
+                select_sql=select_sql,
+                where=where,
+                params=params,
+                key=lambda r: (r[8], r[9]),
+                limit=limit,
+                after=after,
+                date_expr="COALESCE(date, 'epoch')",
+                date_nullable=False,
+            )
+        else:
+            sql = select_sql + f" WHERE {' AND '.join(where)}"
+            sql += " ORDER BY COALESCE(date, 'epoch') DESC, id DESC LIMIT %s OFFSET %s"
+            cur.execute(sql, tuple(params + [limit, offset]))
+            rows = cur.fetchall()
+            next_cursor = (
+                cursor_after("rss", rows[-1][8], rows[-1][9], date_nullable=False)
+                if rows and len(rows) >= limit else None
+            )
+    finally:
+        cur.close(); conn.close()
 
     items = []
     for r in rows:
@@ -292,4 +655,4 @@ def rss_recent(
             "author": r[6],
             "section": r[7]
         })
-    return {"count": len(items), "items": items}
+    return {"count": len(items), "items": items, "next_cursor": next_cursor}
@@ -2,46 +2,16 @@ from fastapi import APIRouter, HTTPException, Body, Query
 import os
 import re
 import logging
-import psycopg2
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date  # noqa
 from html import unescape as html_unescape
 
+from app.db.pool import get_conn
+from app.utils.pagination import cursor_after, fetch_keyset_page
+
 log = logging.getLogger(__name__)
 router = APIRouter()
 
-# -------------------- DB 연결 및 초기화 --------------------
-def get_conn():
-    return psycopg2.connect(
-        host=os.getenv("PGHOST", "db"),
-        dbname=os.getenv("PGDATABASE", "appdb"),
-        user=os.getenv("PGUSER", "appuser"),
-        password=os.getenv("PGPASSWORD", "apppw"),
-        port=int(os.getenv("PGPORT", "5432")),
-    )
-
-
-def init_db():
-    """news.summary 컬럼이 없으면 추가."""
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS news (
-            id SERIAL PRIMARY KEY,
-            title   TEXT NOT NULL,
-            content TEXT,
-            date    TIMESTAMP,
-            link    TEXT UNIQUE
-        )
-    """
-    )
-    cur.execute("ALTER TABLE news ADD COLUMN IF NOT EXISTS summary TEXT")
-    conn.commit()
-    cur.close()
-    conn.close()
-
-
 ADVISORY_LOCK_KEY = 777001
 
 
@@ -464,13 +434,18 @@ def _update_summary_for_ids(
             if not content:
                 continue
             s = summarize(content, max_sentences=max_sentences, max_chars=max_chars)
-            cur.execute("UPDATE news SET summary=%s WHERE id=%s", (s, _id))
+            if s == summary_old:
+                # force 재요약 결과가 같으면 쓰지 않음 (updated_at이 바뀌면 증분 인덱싱 대상이 됨)
+                continue
+            cur.execute("UPDATE news SET summary=%s, updated_at=NOW() WHERE id=%s", (s, _id))
             updated += 1
 
         conn.commit()
         return {"updated": updated, "total": len(rows), "skipped": False}
     finally:
         try:
+            # 풀 연결은 끊기지 않으므로 세션 락을 반드시 해제 (실패한 트랜잭션이면 먼저 rollback)
+            conn.rollback()
             release_lock(cur)
         except Exception:
             pass
@@ -502,7 +477,7 @@ def _update_summary_missing(
             where_clauses.append("(summary IS NULL OR summary = '')")
 
         sql = f"""
-            SELECT id, content
+            SELECT id, content, COALESCE(summary, '')
             FROM news
             WHERE {' AND '.join(where_clauses)}
             ORDER BY id DESC
@@ -512,17 +487,22 @@ def _update_summary_missing(
         rows = cur.fetchall()
 
         updated = 0
-        for _id, content in rows:
+        for _id, content, summary_old in rows:
             if not content:
                 continue
             s = summarize(content, max_sentences=max_sentences, max_chars=max_chars)
-            cur.execute("UPDATE news SET summary=%s WHERE id=%s", (s, _id))
+            if s == summary_old:
+                # force 재요약 결과가 같으면 쓰지 않음 (updated_at이 바뀌면 증분 인덱싱 대상이 됨)
+                continue
+            cur.execute("UPDATE news SET summary=%s, updated_at=NOW() WHERE id=%s", (s, _id))
             updated += 1
 
         conn.commit()
         return {"updated": updated, "total": len(rows), "skipped": False}
     finally:
         try:
+            # 풀 연결은 끊기지 않으므로 세션 락을 반드시 해제 (실패한 트랜잭션이면 먼저 rollback)
+            conn.rollback()
             release_lock(cur)
         except Exception:
             pass
@@ -545,7 +525,6 @@ def run_summary_after_crawl(
     - ids가 없으면 summary가 비어 있는 최신 기사들만 limit 개수만큼 처리
       (force=True면 요약 여부 상관없이 최신 기사들 강제 재요약)
     """
-    init_db()
     if ids:
         return _update_summary_for_ids(
             ids,
@@ -570,7 +549,6 @@ def webhook_crawl_complete(payload: Dict[str, Any] = Body(...)):
       { "limit": 300, "max_sentences": 3 }
       { "ids": [..], "max_sentences": 2, "max_chars": 500 }
     """
-    init_db()
     ids: Optional[List[int]] = payload.get("ids")
     force: bool = bool(payload.get("force", False))
     limit: int = int(payload.get("limit", 200))
@@ -611,7 +589,6 @@ def admin_summary_run(
     max_sentences: Optional[int] = Body(DEFAULT_MAX_SENTENCES),
     max_chars: Optional[int] = Body(None),
 ):
-    init_db()
     if ids:
         res = _update_summary_for_ids(
             ids,
@@ -631,7 +608,6 @@ def admin_summary_run(
 
 @router.get("/admin/summary/health")
 def summary_health():
-    init_db()
     return {
         "ok": True,
         "hf": bool(_hf),
@@ -655,13 +631,14 @@ def get_summary_by_id(
     - 기본(strict=False): summary 없으면 빈 문자열 반환
     - strict=True       : summary 없으면 404
     """
-    init_db()
     conn = get_conn()
     cur = conn.cursor()
-    cur.execute("SELECT summary FROM news WHERE id=%s LIMIT 1", (article_id,))
-    row = cur.fetchone()
-    cur.close()
-    conn.close()
+    try:
+        cur.execute("SELECT summary FROM news WHERE id=%s LIMIT 1", (article_id,))
+        row = cur.fetchone()
+    finally:
+        cur.close()
+        conn.close()
 
     if not row:
         raise HTTPException(404, "article not found")
@@ -682,24 +659,25 @@ def get_summary_by_link(
     원문 링크로 기사 요약만 반환.
     - strict=True면 summary 없을 때 404
     """
-    init_db()
     raw = link
     norm = html_unescape(raw).replace("&amp;", "&")
 
     conn = get_conn()
     cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT summary
-        FROM news
-        WHERE link = %s OR link = %s
-        LIMIT 1
-    """,
-        (raw, norm),
-    )
-    row = cur.fetchone()
-    cur.close()
-    conn.close()
+    try:
+        cur.execute(
+            """
+            SELECT summary
+            FROM news
+            WHERE link = %s OR link = %s
+            LIMIT 1
+        """,
+            (raw, norm),
+        )
+        row = cur.fetchone()
+    finally:
+        cur.close()
+        conn.close()
 
     if not row:
         raise HTTPException(404, "article not found")
@@ -716,14 +694,14 @@ def list_summaries(
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
     q: Optional[str] = Query(None, description="제목/본문 간단 검색(옵션)"),
+    after: Optional[str] = Query(None, description="이전 응답의 next_cursor (주면 offset 무시)"),
 ):
     """
     최신 요약 목록(페이징).
-    - 응답: items: [{id, summary}], count
+    - 응답: items: [{id, summary}], count, next_cursor
     - q가 있으면 title/content LIKE 검색
+    - after(커서)를 주면 keyset 페이지네이션: 깊은 페이지도 첫 페이지와 같은 비용
     """
-    init_db()
-
     where = ["summary IS NOT NULL", "summary <> ''"]
     params: List[Any] = []
 
@@ -732,21 +710,34 @@ def list_summaries(
         like = f"%{q}%"
         params.extend([like, like])
 
-    sql = f"""
-        SELECT id, summary
-        FROM news
-        WHERE {' AND '.join(where)}
-        ORDER BY date DESC NULLS LAST, id DESC
-        LIMIT %s OFFSET %s
-    """
-    params.extend([limit, offset])
-
     conn = get_conn()
     cur = conn.cursor()
-    cur.execute(sql, params)
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
+    try:
+        if after:
+            rows, next_cursor = fetch_keyset_page(
+                cur,
+                scope="summary",
+                select_sql="SELECT id, summary, date FROM news",
+                where=where,
+                params=params,
+                key=lambda r: (r[2], r[0]),
+                limit=limit,
+                after=after,
+            )
+        else:
+            sql = f"""
+                SELECT id, summary, date
+                FROM news
+                WHERE {' AND '.join(where)}
+                ORDER BY date DESC NULLS LAST, id DESC
+                LIMIT %s OFFSET %s
+            """
+            cur.execute(sql, params + [limit, offset])
+            rows = cur.fetchall()
+            next_cursor = cursor_after("summary", rows[-1][2], rows[-1][0]) if rows and len(rows) >= limit else None
+    finally:
+        cur.close()
+        conn.close()
 
     items = [{"id": r[0], "summary": (r[1] or "").strip()} for r in rows]
-    return {"count": len(items), "items": items}
+    return {"count": len(items), "items": items, "next_cursor": next_cursor}
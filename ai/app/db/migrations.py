@@ -0,0 +1,205 @@
+# app/db/migrations.py
+"""
+버전 관리되는 스키마 마이그레이션.
+
+- 서버 시작 시(lifespan) run_migrations() 한 번만 실행. 요청 경로에서는 DDL 없음
+- schema_migrations 테이블에 적용된 버전을 기록하고, 아직 안 된 것만 순서대로 적용
+- 워커 여러 개가 동시에 떠도 advisory lock으로 한 프로세스만 적용
+- 기존 DB(init_db / ensure_*_table로 만들어진 테이블)에도 그대로 돌 수 있게 모두 IF NOT EXISTS
+- 새 스키마 변경은 MIGRATIONS 끝에 다음 번호로 추가 (이미 배포된 항목은 수정하지 않음)
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Dict, List, Tuple
+
+from app.db.pool import get_conn
+
+logger = logging.getLogger(__name__)
+
+MIGRATION_LOCK_KEY = 777100
+
+# (version, name, sql)
+MIGRATIONS: List[Tuple[int, str, str]] = [
+    (
+        1,
+        "news",
+        """
+        CREATE TABLE IF NOT EXISTS news (
+            id         SERIAL PRIMARY KEY,
+            title      TEXT NOT NULL,
+            content    TEXT,
+            date       TIMESTAMP,
+            link       TEXT UNIQUE
+        );
+        ALTER TABLE news ADD COLUMN IF NOT EXISTS summary TEXT;
+        ALTER TABLE news ADD COLUMN IF NOT EXISTS source  TEXT;
+        ALTER TABLE news ADD COLUMN IF NOT EXISTS lean    TEXT;
+        ALTER TABLE news ADD COLUMN IF NOT EXISTS author  TEXT;
+        ALTER TABLE news ADD COLUMN IF NOT EXISTS section TEXT;
+        ALTER TABLE news ADD COLUMN IF NOT EXISTS origin  TEXT;
+        -- 증분 TF-IDF 인덱싱용 변경 시각
+        ALTER TABLE news ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW();
+        CREATE INDEX IF NOT EXISTS idx_news_updated_at ON news (updated_at);
+        """,
+    ),
+    (
+        2,
+        "article_reco",
+        """
+        CREATE TABLE IF NOT EXISTS article_reco (
+          base_link         TEXT NOT NULL,
+          hours_window      INT  NOT NULL,
+          topk_return       INT  NOT NULL,
+          stance_threshold  DOUBLE PRECISION NOT NULL,
+          normalized_link   TEXT NOT NULL,
+          updated_at        TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+          recommendations   JSONB NOT NULL,
+          PRIMARY KEY (base_link, hours_window, topk_return, stance_threshold)
+        );
+        CREATE INDEX IF NOT EXISTS idx_article_reco_updated_at ON article_reco (updated_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_article_reco_base_link ON article_reco (base_link);
+        CREATE INDEX IF NOT EXISTS idx_article_reco_normalized ON article_reco (normalized_link);
+        """,
+    ),
+    (
+        3,
+        "http_cache",
+        """
+        -- 피드/기사 URL별 조건부 요청용 validator (ETag / Last-Modified)
+        CREATE TABLE IF NOT EXISTS http_cache (
+          url            TEXT PRIMARY KEY,
+          etag           TEXT,
+          last_modified  TEXT,
+          body_bytes     INT  NOT NULL DEFAULT 0,
+          canonical_url  TEXT,
+          checked_at     TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+        """,
+    ),
+    (
+        4,
+        "news hot query indexes",
+        """
+        -- /api/article, /api/article/summary, article_ready 목록: ORDER BY date DESC NULLS LAST, id DESC
+        CREATE INDEX IF NOT EXISTS idx_news_date_id ON news (date DESC NULLS LAST, id DESC);
+        -- rss_recent / rss_stats: origin='rss' + COALESCE(date, 'epoch') 정렬
+        -- ('epoch'는 타입 없는 리터럴이라 date 컬럼 타입을 따라가므로 immutable 식)
+        CREATE INDEX IF NOT EXISTS idx_news_rss_date
+          ON news ((COALESCE(date, 'epoch')) DESC, id DESC)
+          WHERE origin = 'rss';
+        -- _update_summary_missing: 요약 없는 최신 기사
+        CREATE INDEX IF NOT EXISTS idx_news_summary_missing
+          ON news (id DESC)
+          WHERE summary IS NULL OR summary = '';
+        ANALYZE news;
+        """,
+    ),
+    (
+        5,
+        "link_alias",
+        """
+        -- 네이버 등 클릭 URL → 원문 URL (url_normalize.normalize_clicked 메모이즈)
+        -- canonical_link NULL: 원문 링크를 못 찾음 (짧은 TTL 뒤 다시 조회)
+        CREATE TABLE IF NOT EXISTS link_alias (
+          clicked_link    TEXT PRIMARY KEY,
+          canonical_link  TEXT,
+          checked_at      TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+        """,
+    ),
+    (
+        6,
+        "article_reco_candidates",
+        """
+        -- 기준 기사 × hours_window 당 유사도 순으로 점수 매긴 후보 앞부분(prefix)
+        -- (유사도/NLI 확률/stance/lean/score). 미리 계산은 기본 조합이 확정되는 데까지만 매김
+        -- next_bound: prefix 다음 후보의 점수 상한(유사도), fetched: 그 후보의 검색 offset (NULL = 후보 끝)
+        -- topk_return / stance_threshold 조합은 요청 시 prefix로 확정되면(is_settled) 여기서 골라 쓰고,
+        -- 아니면 요청 경로에서 prefix를 이어서 늘려(NLI 추가) 다시 저장
+        CREATE TABLE IF NOT EXISTS article_reco_candidates (
+          base_link         TEXT NOT NULL,
+          hours_window      INT  NOT NULL,
+          normalized_link   TEXT NOT NULL,
+          updated_at        TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+          candidates        JSONB NOT NULL,
+          next_bound        DOUBLE PRECISION,
+          fetched           INT NOT NULL DEFAULT 0,
+          PRIMARY KEY (base_link, hours_window)
+        );
+        CREATE INDEX IF NOT EXISTS idx_article_reco_cand_updated_at
+          ON article_reco_candidates (updated_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_article_reco_cand_normalized
+          ON article_reco_candidates (normalized_link);
+        """,
+    ),
+    (
+        7,
+        "drop_article_reco",
+        """
+        -- 조합별 결과 캐시(article_reco)는 6부터 읽지 않음
+        -- (후보 캐시는 다음 크롤 후 미리 계산으로 다시 채워짐)
+        DROP TABLE IF EXISTS article_reco;
+        """,
+    ),
+]
+
+
+def run_migrations() -> Dict[str, Any]:
+    """
+    아직 적용되지 않은 마이그레이션을 버전 순서대로 적용.
+    각 버전은 자기 트랜잭션에서 적용되고, 실패하면 그 버전부터 중단 (예외 전파).
+    """
+    t0 = time.time()
+    applied_now: List[int] = []
+    conn = get_conn()
+    cur = conn.cursor()
+    try:
+        cur.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_KEY,))
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version    INT PRIMARY KEY,
+                name       TEXT NOT NULL,
+                applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+            )
+            """
+        )
+        conn.commit()
+
+        cur.execute("SELECT version FROM schema_migrations")
+        done = {r[0] for r in cur.fetchall()}
+        conn.commit()
+
+        for version, name, sql in sorted(MIGRATIONS):
+            if version in done:
+                continue
+            logger.info("[migrations] apply %d %s", version, name)
+            cur.execute(sql)
+            cur.execute(
+                "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                (version, name),
+            )
+            conn.commit()
+            applied_now.append(version)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        try:
+            conn.rollback()
+            cur.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_KEY,))
+            conn.commit()
+        except Exception:
+            pass
+        cur.close()
+        conn.close()
+
+    res = {
+        "applied": applied_now,
+        "current": max([v for v, _, _ in MIGRATIONS]),
+        "elapsed_sec": round(time.time() - t0, 3),
+    }
+    logger.info("[migrations] done: %s", res)
+    return res
@@ -0,0 +1,273 @@
+# app/db/pool.py
+"""
+PostgreSQL 접속 설정(단일 소스) + 프로세스 공유 커넥션 풀.
+
+- 모든 모듈은 get_conn()으로 연결을 빌린다.
+  기존 코드처럼 conn.close()를 호출하면 실제로 끊지 않고 풀로 반납된다.
+- 스레드 안전 (동기 핸들러 스레드풀 + APScheduler 잡이 함께 사용)
+- 풀이 가득 차면 DB_POOL_TIMEOUT초까지 대기, 넘으면 PoolTimeout
+- close() 없이 버려진(GC된) 연결은 슬롯을 돌려받음 (예외 경로 누수로 풀이 영구히 막히지 않도록)
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote_plus
+
+import psycopg2
+import psycopg2.extensions
+
+logger = logging.getLogger(__name__)
+
+# 예전 모듈별 설정(PG*, DB_HOST, POSTGRES_*)을 모두 받아들이되 값은 여기 한 곳에서만 결정
+PG_CONFIG: Dict[str, Any] = dict(
+    host=os.getenv("PGHOST") or os.getenv("DB_HOST") or "db",
+    port=int(os.getenv("PGPORT", "5432")),
+    dbname=os.getenv("PGDATABASE") or os.getenv("POSTGRES_DB") or "appdb",
+    user=os.getenv("PGUSER") or os.getenv("POSTGRES_USER") or "appuser",
+    password=os.getenv("PGPASSWORD") or os.getenv("POSTGRES_PASSWORD") or "apppw",
+)
+
+DATABASE_URL = "postgresql+psycopg2://{user}:{password}@{host}:{port}/{dbname}".format(
+    user=quote_plus(PG_CONFIG["user"]),
+    password=quote_plus(PG_CONFIG["password"]),
+    host=PG_CONFIG["host"],
+    port=PG_CONFIG["port"],
+    dbname=PG_CONFIG["dbname"],
+)
+
+# 풀 최대 연결 수 / 빌릴 때 최대 대기(초) / 이 시간 이상 놀던 연결은 빌려주기 전에 SELECT 1로 확인
+POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+POOL_PING_AFTER_SEC = float(os.getenv("DB_POOL_PING_AFTER_SEC", "30"))
+
+
+class PoolTimeout(psycopg2.OperationalError):
+    """DB_POOL_TIMEOUT 안에 연결을 빌리지 못함"""
+
+
+class PooledConnection(psycopg2.extensions.connection):
+    """close()가 풀 반납으로 동작하는 연결"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool: Optional["ConnectionPool"] = None
+        self._checked_out = False
+        self._reclaim: Optional[weakref.finalize] = None
+
+    def close(self):
+        if self._pool is None:
+            return super().close()
+        if self._checked_out:
+            self._pool._return(self)
+        # 이미 반납된 연결에 대한 중복 close()는 무시
+
+    def _disconnect(self):
+        try:
+            psycopg2.extensions.connection.close(self)
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    def __init__(self, dsn: Dict[str, Any], *, maxconn: int, timeout: float, ping_after: float):
+        self.dsn = dict(dsn)
+        self.maxconn = max(1, maxconn)
+        self.timeout = timeout
+        self.ping_after = ping_after
+        self.pid = os.getpid()
+        self._idle: List[Tuple[PooledConnection, float]] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.maxconn)
+        self._stats = {
+            "checked_out": 0,
+            "waiting": 0,
+            "checkouts": 0,
+            "timeouts": 0,
+            "connects": 0,
+            "connect_errors": 0,
+            "discarded": 0,
+            "leaked": 0,
+            "connect_sec_total": 0.0,
+            "connect_sec_max": 0.0,
+            "wait_sec_total": 0.0,
+            "wait_sec_max": 0.0,
+        }
+
+    def getconn(self) -> PooledConnection:
+        t0 = time.perf_counter()
+        with self._lock:
+            self._stats["waiting"] += 1
+        ok = self._slots.acquire(timeout=self.timeout)
+        waited = time.perf_counter() - t0
+        with self._lock:
+            self._stats["waiting"] -= 1
+            if not ok:
+                self._stats["timeouts"] += 1
+            else:
+                self._stats["wait_sec_total"] += waited
+                self._stats["wait_sec_max"] = max(self._stats["wait_sec_max"], waited)
+        if not ok:
+            raise PoolTimeout(f"DB 커넥션 풀 대기 초과 ({self.timeout}s, max={self.maxconn})")
+
+        try:
+            conn = self._take_idle() or self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+        conn._pool = self
+        conn._checked_out = True
+        # 반납 없이 GC되면 슬롯 회수 (conn 자체를 참조하면 안 되므로 풀 메서드만 등록)
+        conn._reclaim = weakref.finalize(conn, self._reclaim_leaked)
+        conn._reclaim.atexit = False
+        with self._lock:
+            self._stats["checked_out"] += 1
+            self._stats["checkouts"] += 1
+        return conn
+
+    def _take_idle(self) -> Optional[PooledConnection]:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                conn, returned_at = self._idle.pop()
+            if conn.closed:
+                self._discard(conn)
+                continue
+            if time.monotonic() - returned_at < self.ping_after:
+                return conn
+            try:
+                cur = conn.cursor()
+                cur.execute("SELECT 1")
+                cur.close()
+                conn.rollback()
+                return conn
+            except Exception:
+                self._discard(conn)
+
+    def _connect(self) -> PooledConnection:
+        t0 = time.perf_counter()
+        try:
+            conn = psycopg2.connect(connection_factory=PooledConnection, **self.dsn)
+        except Exception:
+            with self._lock:
+                self._stats["connect_errors"] += 1
+            raise
+        sec = time.perf_counter() - t0
+        with self._lock:
+            self._stats["connects"] += 1
+            self._stats["connect_sec_total"] += sec
+            self._stats["connect_sec_max"] = max(self._stats["connect_sec_max"], sec)
+        return conn
+
+    def _discard(self, conn: PooledConnection):
+        conn._pool = None
+        conn._disconnect()
+        with self._lock:
+            self._stats["discarded"] += 1
+
+    def _reclaim_leaked(self):
+        """close() 없이 GC된 연결의 슬롯 반납. 소켓은 psycopg2 dealloc이 닫음"""
+        with self._lock:
+            self._stats["checked_out"] -= 1
+            self._stats["leaked"] += 1
+        self._slots.release()
+        logger.warning("[db.pool] close() 없이 버려진 연결 슬롯 회수 (try/finally 누락 경로 확인)")
+
+    def _return(self, conn: PooledConnection):
+        conn._checked_out = False
+        if conn._reclaim is not None:
+            conn._reclaim.detach()
+            conn._reclaim = None
+        keep = not conn.closed
+        if keep:
+            try:
+                # 읽기만 한 요청도 트랜잭션이 열려 있으므로 정리해서 돌려놓음
+                if conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+                if conn.autocommit:
+                    conn.autocommit = False
+            except Exception:
+                keep = False
+        with self._lock:
+            self._stats["checked_out"] -= 1
+            if keep:
+                self._idle.append((conn, time.monotonic()))
+        if not keep:
+            self._discard(conn)
+        self._slots.release()
+
+    def closeall(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn._pool = None
+            conn._disconnect()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            s = dict(self._stats)
+            s["idle"] = len(self._idle)
+        s["max"] = self.maxconn
+        connects = s.pop("connect_sec_total")
+        s["connect_ms_avg"] = round(connects / s["connects"] * 1000, 2) if s["connects"] else None
+        s["connect_ms_max"] = round(s.pop("connect_sec_max") * 1000, 2)
+        waited = s.pop("wait_sec_total")
+        s["wait_ms_avg"] = round(waited / s["checkouts"] * 1000, 3) if s["checkouts"] else None
+        s["wait_ms_max"] = round(s.pop("wait_sec_max") * 1000, 2)
+        return s
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    global _pool
+    pool = _pool
+    # fork된 자식 프로세스는 부모 소켓을 공유하면 안 되므로 새 풀
+    if pool is None or pool.pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool.pid != os.getpid():
+                _pool = ConnectionPool(
+                    PG_CONFIG,
+                    maxconn=POOL_MAX,
+                    timeout=POOL_TIMEOUT,
+                    ping_after=POOL_PING_AFTER_SEC,
+                )
+            pool = _pool
+    return pool
+
+
+def get_conn() -> PooledConnection:
+    """풀에서 연결을 빌림. 사용 후 conn.close()로 반납"""
+    return get_pool().getconn()
+
+
+@contextmanager
+def db_conn():
+    conn = get_conn()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.closeall()
+
+
+def pool_stats() -> Dict[str, Any]:
+    pool = _pool
+    if pool is None:
+        return {"max": POOL_MAX, "checked_out": 0, "idle": 0, "waiting": 0, "connects": 0}
+    return pool.stats()
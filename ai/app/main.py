@@ -6,14 +6,18 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from apscheduler.schedulers.background import BackgroundScheduler
 
-from app.api.crawl import init_db, router as article_router
+from app.api.crawl import router as article_router
 from app.api.rss_crawl import crawl_rss, router as rss_router
 from app.api.summary import router as summary_router, run_summary_after_crawl
 from app.model.model import load_model
 from app.api import article_reco, article_ready
 from app.api.article_meta import router as article_meta_router
+from app.api.metrics import router as metrics_router
+from app.db.migrations import run_migrations
+from app.db.pool import close_pool
 
-from app.services.recommend_batch import build_full_tfidf_index
+from app.services.recommend_batch import build_tfidf_index
+from app.services.reco_precompute import enqueue_recent as enqueue_reco_precompute
 
 BOOTSTRAP_DO_CRAWL   = os.getenv("BOOTSTRAP_DO_CRAWL", "1") == "1"
 BOOTSTRAP_LOOKBACK_H = int(os.getenv("BOOTSTRAP_LOOKBACK_H", "720"))
@@ -41,12 +45,19 @@ def job_crawl_all():
         print("[job_crawl_all] 요약 작업 시작")
         run_summary_after_crawl(limit=SUMMARY_LIMIT_AFTER_CRAWL, force=True)
     finally:
-        print("[job_crawl_all] TF-IDF 벡터 인덱스 재구축 시작")
+        print("[job_crawl_all] TF-IDF 벡터 인덱스 갱신 시작")
         try:
-            res = build_full_tfidf_index()
-            print(f"[job_crawl_all] TF-IDF 인덱스 재구축 완료: {res}")
+            res = build_tfidf_index()
+            print(f"[job_crawl_all] TF-IDF 인덱스 갱신 완료: {res}")
         except Exception as e:
-            print("[job_crawl_all] TF-IDF 인덱스 재구축 실패:", e)
+            print("[job_crawl_all] TF-IDF 인덱스 갱신 실패:", e)
+        else:
+            # 새 기사 추천 미리 계산 (워커가 백그라운드로 처리, 여기서는 큐에 넣기만)
+            try:
+                res = enqueue_reco_precompute()
+                print(f"[job_crawl_all] 추천 사전 계산 등록: {res}")
+            except Exception as e:
+                print("[job_crawl_all] 추천 사전 계산 등록 실패:", e)
 
 
 def start_scheduler_once():
@@ -88,8 +99,8 @@ def bootstrap_heavy_jobs():
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print("[startup] init_db")
-    init_db()
+    print("[startup] migrations")
+    run_migrations()
 
     print("[startup] load_model")
     if QUICK_BOOT:
@@ -113,6 +124,7 @@ async def lifespan(app: FastAPI):
         coalesce=True,
     )
     yield
+    close_pool()
     print("[shutdown] done")
 
 
@@ -135,3 +147,4 @@ app.include_router(summary_router, prefix="/api")
 app.include_router(article_reco.router,  prefix="/api")
 app.include_router(article_ready.router, prefix="/api")
 app.include_router(article_meta_router,  prefix="/api")
+app.include_router(metrics_router,       prefix="/api")
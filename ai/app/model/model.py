@@ -1,3 +1,6 @@
+from typing import List, Optional, Tuple
+import os
+
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 import torch, torch.nn.functional as F
 
@@ -5,6 +8,10 @@ _MODEL_NAME = "MoritzLaurer/mDeBERTa-v3-base-xnli-multilingual-nli-2mil7"
 _tokenizer = None
 _model = None
 _LABELS = ["entailment", "neutral", "contradiction"]
+_NEUTRAL_PROBS = [0.33, 0.34, 0.33]
+
+# 한 번의 forward pass에 넣을 (premise, hypothesis) 쌍 개수
+NLI_BATCH_SIZE = int(os.getenv("NLI_BATCH_SIZE", "16"))
 
 def load_model():
     global _tokenizer, _model
@@ -14,49 +21,60 @@ def load_model():
         _model.eval()
     return True
 
-def _safe_pair(premise: str, hypothesis: str):
-    """모델 max position에 맞춰 토큰 기준으로 안전하게 자르기"""
-    max_pos = getattr(_model.config, "max_position_embeddings", 512)
-    max_len = max_pos - 3
-    enc = _tokenizer(
-        premise, hypothesis,
-        add_special_tokens=True,
-        truncation="longest_first",
-        max_length=max_len,
-        return_tensors=None
-    )
-
-    if len(enc["input_ids"]) > max_pos:
-
-        p_ids = _tokenizer.encode(premise, add_special_tokens=False)
-        h_ids = _tokenizer.encode(hypothesis, add_special_tokens=False)
-
-        while len(p_ids) + len(h_ids) + 3 > max_len:
-            if len(p_ids) >= len(h_ids):
-                p_ids = p_ids[:-1]
-            else:
-                h_ids = h_ids[:-1]
-        premise = _tokenizer.decode(p_ids, skip_special_tokens=True)
-        hypothesis = _tokenizer.decode(h_ids, skip_special_tokens=True)
-    return premise, hypothesis
+def _max_len() -> int:
+    """모델 max position에 맞춘 pair 토큰 길이 상한"""
+    return min(getattr(_model.config, "max_position_embeddings", 512) - 3, 510)
 
 @torch.no_grad()
-def nli_infer(premise: str, hypothesis: str):
-    global _tokenizer, _model
+def nli_infer_batch(
+    premise: str,
+    hypotheses: List[str],
+    batch_size: Optional[int] = None,
+) -> List[Tuple[str, List[float]]]:
+    """
+    하나의 premise와 여러 hypothesis를 배치로 추론.
+
+    - 전체 pair를 토크나이저 한 번으로 인코딩 (longest_first truncation)
+    - micro-batch 단위로 가장 긴 pair 길이에 맞춰 padding 후 forward
+    - 반환: hypotheses 순서대로 (label, [entailment, neutral, contradiction])
+    """
     if _model is None:
         load_model()
-    if not premise or not hypothesis:
-        return "neutral", [0.33, 0.34, 0.33]
 
-    premise, hypothesis = _safe_pair(premise, hypothesis)
+    results: List[Tuple[str, List[float]]] = [
+        ("neutral", list(_NEUTRAL_PROBS)) for _ in hypotheses
+    ]
+    if not premise:
+        return results
 
-    inputs = _tokenizer(
-        premise, hypothesis,
-        return_tensors="pt",
+    idx = [i for i, h in enumerate(hypotheses) if h]
+    if not idx:
+        return results
+
+    enc = _tokenizer(
+        [premise] * len(idx),
+        [hypotheses[i] for i in idx],
+        add_special_tokens=True,
         truncation="longest_first",
-        max_length=min(getattr(_model.config, "max_position_embeddings", 512) - 3, 510)
+        max_length=_max_len(),
+        padding=False,
     )
-    logits = _model(**inputs).logits
-    probs = F.softmax(logits, dim=-1).cpu().tolist()[0]
-    label = _LABELS[int(probs.index(max(probs)))]
-    return label, probs
+
+    bs = max(1, batch_size or NLI_BATCH_SIZE)
+    # 길이순으로 묶어서 padding 낭비 ↓
+    order = sorted(range(len(idx)), key=lambda j: len(enc["input_ids"][j]))
+    for start in range(0, len(order), bs):
+        chunk = order[start:start + bs]
+        features = [{k: enc[k][j] for k in enc.keys()} for j in chunk]
+        inputs = _tokenizer.pad(features, padding="longest", return_tensors="pt")
+        logits = _model(**inputs).logits
+        probs_batch = F.softmax(logits, dim=-1).cpu().tolist()
+        for j, probs in zip(chunk, probs_batch):
+            label = _LABELS[int(probs.index(max(probs)))]
+            results[idx[j]] = (label, probs)
+    return results
+
+def nli_infer(premise: str, hypothesis: str):
+    if not premise or not hypothesis:
+        return "neutral", list(_NEUTRAL_PROBS)
+    return nli_infer_batch(premise, [hypothesis], batch_size=1)[0]
@@ -7,9 +7,9 @@ from typing import List, Optional, Dict, Any
 
 import httpx
 import xmltodict
-import psycopg2
 from psycopg2.extras import DictCursor
 
+from app.db.pool import get_conn
 from app.schemas.briefing import GovDoc, MetaResponse, BriefingInfo, BillInfo
 from app.services.brief_matcher import pick_best_briefing
 
@@ -17,18 +17,6 @@ from app.services.bill_service import fetch_bills_around
 from app.services.bill_matcher import pick_best_bill
 
 
-DBCFG = dict(
-    host=os.getenv("DB_HOST", "Veritas-db"),
-    dbname=os.getenv("POSTGRES_DB", "appdb"),
-    user=os.getenv("POSTGRES_USER", "appuser"),
-    password=os.getenv("POSTGRES_PASSWORD", "apppw"),
-)
-
-
-def get_conn():
-    return psycopg2.connect(**DBCFG)
-
-
 GOV_POLICY_NEWS_KEY = os.getenv("GOV_POLICY_NEWS_KEY", "")
 GOV_PRESS_RELEASE_KEY = os.getenv("GOV_PRESS_RELEASE_KEY", "")
 GOV_SPEECH_KEY = os.getenv("GOV_SPEECH_KEY", "")
@@ -0,0 +1,236 @@
+# app/services/reco_cache.py
+"""
+추천 후보 캐시의 앞단 계층 (article_reco_candidates 테이블 앞).
+
+조회 순서: memory(L1, 프로세스 내부 LRU+TTL) → redis(선택, 워커 간 공유) → pg(article_reco_candidates, 영구 L2)
+- 키: (link, hours_window). 값은 유사도 순으로 점수 매긴 후보 prefix라 topk_return / stance_threshold 조합은
+  호출 쪽에서 is_settled 확인 후 select_recommendations로 골라 씀 (조합마다 캐시 항목을 따로 두지 않음)
+- link는 클릭된 URL 그대로 + 정규화된 URL 둘 다 키로 넣어 둠
+  (L1/redis 조회에는 normalize_clicked가 필요 없음 → 네이버 원문 조회 HTTP 없이 응답)
+- 값: (candidates, normalized_link, updated_at, next_bound, fetched). 오래됨(stale) 판단은 기존처럼 updated_at 기준
+  next_bound / fetched: prefix 다음 후보의 유사도 상한 / 검색 offset (None/0이면 후보 끝)
+- REDIS_URL이 없거나 redis 패키지가 없으면 redis 계층은 꺼짐 (set_redis_client로 호환 객체 주입 가능)
+- 계층별 hit/miss/error/지연은 tier_stats()로 /admin/metrics에 노출
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+logger = logging.getLogger(__name__)
+
+# 항목 하나가 후보 SEARCH_MAX_K개 목록이라 조합별 결과(8건)를 넣던 때보다 작게
+L1_MAX_ITEMS = int(os.getenv("RECO_L1_MAX_ITEMS", "1024"))
+L1_TTL_SEC = float(os.getenv("RECO_L1_TTL_SEC", "300"))
+REDIS_URL = os.getenv("REDIS_URL", "")
+REDIS_TTL_SEC = int(os.getenv("RECO_REDIS_TTL_SEC", "3600"))
+REDIS_PREFIX = os.getenv("RECO_REDIS_PREFIX", "reco:")
+
+CacheKey = Tuple[str, int]
+CacheRow = Tuple[Any, Optional[str], Optional[datetime], Optional[float], int]
+
+TIERS = ("memory", "redis", "pg")
+
+
+def cache_key(link: str, hours_window: int) -> CacheKey:
+    return (link, int(hours_window))
+
+
+# ---------------- 계층별 지표 ----------------
+_stats: Dict[str, Dict[str, float]] = {
+    t: {"hits": 0, "misses": 0, "errors": 0, "lookup_sec": 0.0} for t in TIERS
+}
+_stats_lock = threading.Lock()
+
+
+def record(tier: str, outcome: str, elapsed: float):
+    """outcome: hits / misses / errors"""
+    with _stats_lock:
+        st = _stats[tier]
+        st[outcome] += 1
+        st["lookup_sec"] += elapsed
+
+
+def tier_stats() -> Dict[str, Any]:
+    with _stats_lock:
+        out: Dict[str, Any] = {}
+        for tier, st in _stats.items():
+            lookups = st["hits"] + st["misses"] + st["errors"]
+            out[tier] = {
+                "hits": int(st["hits"]),
+                "misses": int(st["misses"]),
+                "errors": int(st["errors"]),
+                "hit_ratio": round(st["hits"] / lookups, 4) if lookups else None,
+                "avg_lookup_us": round(st["lookup_sec"] / lookups * 1e6, 1) if lookups else None,
+            }
+    out["memory"]["size"] = len(_l1)
+    out["memory"]["max_items"] = L1_MAX_ITEMS
+    out["redis"]["enabled"] = _get_redis() is not None
+    return out
+
+
+# ---------------- L1: 프로세스 내부 LRU + TTL ----------------
+_l1: "OrderedDict[CacheKey, Tuple[float, CacheRow]]" = OrderedDict()
+_l1_lock = threading.Lock()
+
+
+def _l1_get(key: CacheKey) -> Optional[CacheRow]:
+    now = time.monotonic()
+    with _l1_lock:
+        ent = _l1.get(key)
+        if ent is None:
+            return None
+        expires, row = ent
+        if expires < now:
+            del _l1[key]
+            return None
+        _l1.move_to_end(key)
+        return row
+
+
+def _l1_put(key: CacheKey, row: CacheRow):
+    if L1_MAX_ITEMS <= 0:
+        return
+    with _l1_lock:
+        _l1[key] = (time.monotonic() + L1_TTL_SEC, row)
+        _l1.move_to_end(key)
+        while len(_l1) > L1_MAX_ITEMS:
+            _l1.popitem(last=False)
+
+
+# ---------------- redis (선택) ----------------
+_redis_client: Any = None
+_redis_ready = False
+_redis_lock = threading.Lock()
+
+
+def set_redis_client(client: Any):
+    """
+    redis 계층 클라이언트 지정 (get / setex 를 가진 redis.Redis 호환 객체, None이면 끔).
+    테스트/벤치에서는 fakeredis 같은 로컬 가짜 객체를 넣어 쓴다.
+    """
+    global _redis_client, _redis_ready
+    with _redis_lock:
+        _redis_client = client
+        _redis_ready = True
+
+
+def _get_redis():
+    global _redis_client, _redis_ready
+    if _redis_ready:
+        return _redis_client
+    with _redis_lock:
+        if not _redis_ready:
+            if REDIS_URL:
+                try:
+                    import redis  # 선택 의존성
+
+                    _redis_client = redis.Redis.from_url(
+                        REDIS_URL, socket_timeout=0.2, socket_connect_timeout=0.2
+                    )
+                except ImportError:
+                    logger.warning("[reco_cache] REDIS_URL이 있지만 redis 패키지가 없어 redis 계층 끔")
+                    _redis_client = None
+            _redis_ready = True
+    return _redis_client
+
+
+def _redis_key(key: CacheKey) -> str:
+    link, hw = key
+    return f"{REDIS_PREFIX}cand:{hw}:{link}"
+
+
+def _encode(row: CacheRow) -> str:
+    payload, normalized, updated_at, next_bound, fetched = row
+    return json.dumps(
+        {
+            "p": jsonable_encoder(payload),
+            "n": normalized,
+            "u": updated_at.isoformat() if updated_at else None,
+            "b": next_bound,
+            "f": fetched,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def _decode(raw) -> CacheRow:
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8")
+    data = json.loads(raw)
+    u = datetime.fromisoformat(data["u"]) if data.get("u") else None
+    # b/f가 없으면 후보 끝으로 취급
+    return data["p"], data.get("n"), u, data.get("b"), int(data.get("f") or 0)
+
+
+def _redis_get(key: CacheKey) -> Optional[CacheRow]:
+    r = _get_redis()
+    if r is None:
+        return None
+    t0 = time.perf_counter()
+    try:
+        raw = r.get(_redis_key(key))
+        if raw is None:
+            record("redis", "misses", time.perf_counter() - t0)
+            return None
+        row = _decode(raw)
+    except Exception as e:
+        # redis 장애나 깨진 값(디코드 실패)은 캐시 미스로 취급하고 pg로 내려감
+        record("redis", "errors", time.perf_counter() - t0)
+        logger.warning("[reco_cache] redis get 실패: %s", e)
+        return None
+    record("redis", "hits", time.perf_counter() - t0)
+    return row
+
+
+def _redis_put(keys, row: CacheRow):
+    r = _get_redis()
+    if r is None:
+        return
+    raw = _encode(row)
+    try:
+        for key in keys:
+            r.setex(_redis_key(key), REDIS_TTL_SEC, raw)
+    except Exception as e:
+        logger.warning("[reco_cache] redis set 실패: %s", e)
+
+
+# ---------------- 공개 API ----------------
+def lookup(key: CacheKey) -> Optional[CacheRow]:
+    """memory → redis 순서로 조회. redis hit이면 L1에 채워 둠. 둘 다 없으면 None (pg는 호출 쪽에서)"""
+    t0 = time.perf_counter()
+    row = _l1_get(key)
+    record("memory", "hits" if row is not None else "misses", time.perf_counter() - t0)
+    if row is not None:
+        return row
+
+    row = _redis_get(key)
+    if row is not None:
+        _l1_put(key, row)
+    return row
+
+
+def store(links, hours_window: int, row: CacheRow, *, redis: bool = True):
+    """
+    links의 각 URL(클릭 URL, 정규화 URL 등) 키로 L1(+redis)에 채움.
+    redis=False: redis에서 읽어 온 값을 다시 쓰지 않을 때
+    """
+    keys = [cache_key(l, hours_window) for l in dict.fromkeys(links) if l]
+    for key in keys:
+        _l1_put(key, row)
+    if redis:
+        _redis_put(keys, row)
+
+
+def clear_memory():
+    with _l1_lock:
+        _l1.clear()
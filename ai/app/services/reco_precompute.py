@@ -0,0 +1,163 @@
+# app/services/reco_precompute.py
+"""
+새로 크롤된 기사 추천 미리 계산.
+
+job_crawl_all이 인덱스를 갱신한 뒤 enqueue_recent()를 호출하면
+- 최근 PRECOMPUTE_HOURS 시간 기사 중 기본 hours_window 후보 캐시가 없거나 오래된 것을 찾아
+- 날짜 최신순 우선순위 큐에 넣고 (이미 큐에 있는 링크는 건너뜀)
+- 워커 PRECOMPUTE_WORKERS개가 하나씩 꺼내 article_reco_candidates 캐시를 채움
+  (기본 조합으로 확정되는 데까지 점수 매긴 prefix. 그 prefix로 확정되는 다른 조합도 바로 응답,
+   아니면 요청 시 prefix만 이어서 늘림)
+계산은 요청 경로와 같은 single-flight(reco_store.compute_coalesced)를 타므로
+사용자가 같은 기사를 동시에 클릭해도 중복 계산하지 않음.
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.db.pool import get_conn
+from app.services.reco_store import CACHE_TTL_HOURS, compute_coalesced
+
+logger = logging.getLogger(__name__)
+
+PRECOMPUTE_ENABLED = os.getenv("RECO_PRECOMPUTE", "1") == "1"
+PRECOMPUTE_HOURS = int(os.getenv("RECO_PRECOMPUTE_HOURS", "48"))
+PRECOMPUTE_WORKERS = int(os.getenv("RECO_PRECOMPUTE_WORKERS", "2"))
+PRECOMPUTE_MAX_ITEMS = int(os.getenv("RECO_PRECOMPUTE_MAX_ITEMS", "2000"))
+
+# /article/recommend 기본 hours_window
+DEFAULT_HOURS_WINDOW = 48
+
+# (-기사 시각, 순번, link) → 최신 기사부터
+_queue: "queue.PriorityQueue[Tuple[float, int, str]]" = queue.PriorityQueue()
+_seq = itertools.count()
+_queued: set = set()
+_lock = threading.Lock()
+_workers: List[threading.Thread] = []
+_recent_done: "deque[float]" = deque(maxlen=200)
+
+_stats: Dict[str, Any] = {
+    "batches": 0,
+    "enqueued": 0,
+    "already_queued": 0,
+    "done": 0,
+    "not_found": 0,
+    "failed": 0,
+    "busy_sec": 0.0,
+    "last_batch": None,
+}
+
+
+def _load_targets(hours: int, limit: int) -> List[Tuple[str, datetime]]:
+    """최근 hours시간 기사 중 기본 hours_window 후보 캐시가 없거나 TTL이 지난 것 (최신순)"""
+    now = datetime.now(timezone.utc)
+    conn = get_conn(); cur = conn.cursor()
+    try:
+        cur.execute(
+            """
+            SELECT n.link, n.date
+            FROM news n
+            WHERE n.date >= %s
+              AND n.link IS NOT NULL
+              AND NOT EXISTS (
+                SELECT 1 FROM article_reco_candidates r
+                WHERE r.base_link = n.link
+                  AND r.hours_window = %s
+                  AND r.updated_at >= %s
+              )
+            ORDER BY n.date DESC NULLS LAST, n.id DESC
+            LIMIT %s
+            """,
+            (now - timedelta(hours=hours), DEFAULT_HOURS_WINDOW,
+             now - timedelta(hours=CACHE_TTL_HOURS), limit),
+        )
+        return cur.fetchall()
+    finally:
+        cur.close(); conn.close()
+
+
+def _ensure_workers():
+    with _lock:
+        alive = [t for t in _workers if t.is_alive()]
+        _workers[:] = alive
+        for i in range(len(alive), max(1, PRECOMPUTE_WORKERS)):
+            t = threading.Thread(target=_worker_loop, name=f"reco-precompute-{i}", daemon=True)
+            t.start()
+            _workers.append(t)
+
+
+def _worker_loop():
+    while True:
+        _, _, link = _queue.get()
+        t0 = time.perf_counter()
+        outcome = "failed"
+        try:
+            res = compute_coalesced(link, DEFAULT_HOURS_WINDOW)
+            outcome = "done" if isinstance(res, dict) and "candidates" in res else "not_found"
+        except Exception:
+            logger.exception("[reco_precompute] 계산 실패: %s", link)
+        finally:
+            with _lock:
+                _queued.discard(link)
+                _stats[outcome] += 1
+                _stats["busy_sec"] += time.perf_counter() - t0
+                _recent_done.append(time.monotonic())
+            _queue.task_done()
+
+
+def enqueue_recent(hours: Optional[int] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+    """최근 기사 추천 계산을 큐에 넣고 바로 반환 (계산은 워커가 백그라운드로)"""
+    if not PRECOMPUTE_ENABLED:
+        return {"enabled": False}
+    hours = PRECOMPUTE_HOURS if hours is None else hours
+    limit = PRECOMPUTE_MAX_ITEMS if limit is None else limit
+
+    targets = _load_targets(hours, limit)
+    added = 0
+    with _lock:
+        for link, date in targets:
+            if link in _queued:
+                _stats["already_queued"] += 1
+                continue
+            _queued.add(link)
+            ts = date.timestamp() if date else 0.0
+            _queue.put((-ts, next(_seq), link))
+            added += 1
+        _stats["batches"] += 1
+        _stats["enqueued"] += added
+        _stats["last_batch"] = {
+            "at": datetime.now(timezone.utc).isoformat(),
+            "hours": hours,
+            "candidates": len(targets),
+            "enqueued": added,
+        }
+    _ensure_workers()
+    res = {"candidates": len(targets), "enqueued": added, "backlog": _queue.qsize()}
+    logger.info("[reco_precompute] %s", res)
+    return res
+
+
+def precompute_stats() -> Dict[str, Any]:
+    with _lock:
+        out = dict(_stats)
+        finished = out["done"] + out["not_found"] + out["failed"]
+        recent = list(_recent_done)
+        out["backlog"] = _queue.qsize()
+        out["in_progress"] = len(_queued) - out["backlog"]
+        out["workers"] = sum(1 for t in _workers if t.is_alive())
+    out["busy_sec"] = round(out["busy_sec"], 2)
+    out["avg_sec_per_item"] = round(out["busy_sec"] / finished, 3) if finished else None
+    # 최근 완료 200건 기준 처리량
+    if len(recent) >= 2 and recent[-1] > recent[0]:
+        out["items_per_min"] = round((len(recent) - 1) / (recent[-1] - recent[0]) * 60, 2)
+    else:
+        out["items_per_min"] = None
+    return out
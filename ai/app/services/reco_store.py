@@ -0,0 +1,268 @@
+# app/services/reco_store.py
+"""
+추천 후보 캐시 읽기/쓰기와 키별 single-flight 계산.
+
+요청 경로(app.api.article_reco)와 미리 계산(reco_precompute)이 같이 쓰는 부분이라
+라우터가 아니라 여기에 둔다.
+- get_cache: memory(L1) → redis → article_reco_candidates(L2) 조회 (계층은 reco_cache)
+- upsert_cache: article_reco_candidates 업서트 + L1/redis write-through
+- compute_coalesced: (기사, hours_window)당 한 번만 계산 (프로세스 안 SingleFlight + 워커 간 advisory lock)
+- settle: 캐시된 후보 prefix로 요청 조합이 확정되지 않으면 prefix를 이어서 늘림 (같은 single-flight)
+- refresh_in_background: 오래된 캐시 백그라운드 갱신 (claim_refresh로 키당 하나만 예약, 계산은 compute_coalesced)
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import psycopg2
+import psycopg2.extras
+from fastapi.encoders import jsonable_encoder
+
+from app.db.pool import POOL_MAX, get_conn
+from app.services import reco_cache
+from app.services.recommend_core import (
+    DEFAULT_STANCE_THRESHOLD,
+    DEFAULT_TOPK_RETURN,
+    compute_candidates,
+    is_settled,
+    normalize_clicked,
+)
+from app.services.single_flight import SingleFlight, pg_key_lock
+
+CACHE_TTL_HOURS = 6
+
+# 같은 키 계산은 프로세스 안/간 모두 한 번만 (다른 워커 계산을 기다리는 최대 시간)
+RECO_FLIGHT_WAIT_SEC = float(os.getenv("RECO_FLIGHT_WAIT_SEC", "30"))
+# 계산 하나가 동시에 쥐는 풀 연결 수: advisory lock 연결(계산 내내) + 조회/업서트 연결 1개(한 번에 하나씩).
+# 클릭 URL 정규화(link_alias 연결, 네이버 조회)는 슬롯/락을 잡기 전에 끝냄
+_CONNS_PER_COMPUTE = 2
+# 계산이 다 돌아도 요청 경로(캐시 조회 등)에 남겨 둘 풀 연결 수
+RECO_POOL_RESERVE = int(os.getenv("RECO_POOL_RESERVE", "2"))
+_MAX_COMPUTE = max(1, (POOL_MAX - RECO_POOL_RESERVE) // _CONNS_PER_COMPUTE)
+# 동시에 도는 추천 계산 수 상한 (기본/최대는 풀 크기에서: DB_POOL_MAX=10이면 4)
+RECO_COMPUTE_CONCURRENCY = min(int(os.getenv("RECO_COMPUTE_CONCURRENCY", "0")) or _MAX_COMPUTE, _MAX_COMPUTE)
+
+_reco_flight = SingleFlight()
+_compute_slots = threading.BoundedSemaphore(max(1, RECO_COMPUTE_CONCURRENCY))
+# settle: prefix를 늘린 횟수 / 늘려도 확정 못 하고 응답한 횟수
+_settle_stats = {"extended": 0, "unsettled": 0}
+_settle_lock = threading.Lock()
+
+
+def _count_settle(name: str):
+    with _settle_lock:
+        _settle_stats[name] += 1
+
+
+def is_stale(updated_at, ttl_hours: int = CACHE_TTL_HOURS) -> bool:
+    if not updated_at:
+        return True
+    now = datetime.now(timezone.utc)
+    return (updated_at + timedelta(hours=ttl_hours)) < now
+
+
+def _select_cache_row(where: str, params: tuple):
+    """article_reco_candidates 한 행 조회. 연결은 조회가 끝나면 바로 반납"""
+    conn = get_conn(); cur = conn.cursor()
+    try:
+        cur.execute(f"""
+            SELECT candidates, normalized_link, updated_at, next_bound, fetched
+            FROM article_reco_candidates
+            WHERE {where}
+            ORDER BY updated_at DESC
+            LIMIT 1;
+        """, params)
+        return cur.fetchone()
+    except psycopg2.errors.UndefinedTable:
+        # 마이그레이션 전: 캐시 없음으로 취급
+        conn.rollback()
+        return None
+    finally:
+        cur.close(); conn.close()
+
+
+def get_cache_pg(base_link: str, hours_window: int, normalized: Optional[str] = None):
+    """
+    article_reco_candidates(L2) 조회.
+    - 먼저 클릭 URL 그대로 PK 조회 (대부분 여기서 끝나고 normalize_clicked 호출 없음)
+    - 없으면 정규화 URL로 base_link / normalized_link 조회 (정규화 차이로 인한 캐시 미스 감소)
+    normalize_clicked는 자체적으로 연결을 빌리거나 HTTP를 탈 수 있어서
+    첫 조회 연결을 반납한 뒤에 부른다 (요청 하나가 풀 슬롯 두 개를 잡지 않게).
+    normalized: 이미 구한 정규화 URL (compute_coalesced처럼 다른 연결을 쥔 채 부를 때)
+    """
+    row = _select_cache_row("base_link=%s AND hours_window=%s", (base_link, hours_window))
+    if row:
+        return row
+    if normalized is None:
+        normalized = normalize_clicked(base_link)
+    return _select_cache_row(
+        "(base_link=%s OR normalized_link=%s) AND hours_window=%s",
+        (normalized, normalized, hours_window),
+    )
+
+
+def get_cache(base_link: str, hours_window: int):
+    """
+    memory(L1) → redis → article_reco_candidates(L2) 순서로 조회.
+    반환: (candidates, normalized_link, updated_at, next_bound, fetched) 또는 None
+    """
+    row = reco_cache.lookup(reco_cache.cache_key(base_link, hours_window))
+    if row is not None:
+        return row
+
+    t0 = time.perf_counter()
+    try:
+        row = get_cache_pg(base_link, hours_window)
+    except psycopg2.Error:
+        reco_cache.record("pg", "errors", time.perf_counter() - t0)
+        raise
+    reco_cache.record("pg", "hits" if row else "misses", time.perf_counter() - t0)
+    if row:
+        reco_cache.store([base_link, row[1]], hours_window, row)
+    return row
+
+
+def upsert_cache(base_link: str, hours_window: int, normalized_link: str, candidates: list,
+                 next_bound: Optional[float] = None, fetched: int = 0,
+                 updated_at: Optional[datetime] = None):
+    """
+    updated_at: prefix를 이어서 늘린 경우 원래 계산 시각을 그대로 둠
+    (앞부분은 그때 점수라 오래됨 판단/리프레시는 처음 계산 기준)
+    """
+    conn = get_conn(); cur = conn.cursor()
+    try:
+        candidates_json = jsonable_encoder(candidates)
+        cur.execute("""
+            INSERT INTO article_reco_candidates
+              (base_link, hours_window, normalized_link, candidates, next_bound, fetched, updated_at)
+            VALUES (%s, %s, %s, %s::jsonb, %s, %s, COALESCE(%s, NOW()))
+            ON CONFLICT (base_link, hours_window)
+            DO UPDATE SET
+              normalized_link = EXCLUDED.normalized_link,
+              candidates = EXCLUDED.candidates,
+              next_bound = EXCLUDED.next_bound,
+              fetched = EXCLUDED.fetched,
+              updated_at = EXCLUDED.updated_at
+            RETURNING updated_at;
+        """, (base_link, hours_window, normalized_link, psycopg2.extras.Json(candidates_json),
+              next_bound, fetched, updated_at))
+        updated_at = cur.fetchone()[0]
+        conn.commit()
+    except psycopg2.Error:
+        conn.rollback()
+        raise
+    finally:
+        cur.close(); conn.close()
+    # write-through: 이 워커의 L1과 redis도 바로 갱신
+    reco_cache.store([base_link, normalized_link], hours_window,
+                     (candidates_json, normalized_link, updated_at, next_bound, fetched))
+
+
+def row_result(row) -> dict:
+    candidates, normalized_link, updated_at, next_bound, fetched = row
+    return {
+        "clicked": normalized_link,
+        "candidates": candidates,
+        "next_bound": next_bound,
+        "fetched": fetched,
+        "updated_at": updated_at,
+    }
+
+
+def _recompute_and_upsert(base_link: str, hours_window: int, topk_return: int,
+                          stance_threshold: float, prior: Optional[dict], normalized: str):
+    res = compute_candidates(base_link, hours_window, topk_return, stance_threshold,
+                             prior=prior, normalized=normalized)
+    if "candidates" in res:
+        upsert_cache(
+            base_link=base_link,
+            hours_window=hours_window,
+            normalized_link=res.get("clicked") or normalized,
+            candidates=res["candidates"],
+            next_bound=res["next_bound"],
+            fetched=res["fetched"],
+            updated_at=prior.get("updated_at") if prior else None,
+        )
+    return res
+
+
+def compute_coalesced(base_link: str, hours_window: int,
+                      topk_return: int = DEFAULT_TOPK_RETURN,
+                      stance_threshold: float = DEFAULT_STANCE_THRESHOLD,
+                      *, prior: Optional[dict] = None):
+    """
+    캐시 MISS / 동기 재계산 / prefix 연장 경로. (기사, hours_window)마다 한 번만 계산 — topk/threshold가 달라도 같은 키.
+    - prior 없음: 처음부터 계산, prior 있음: 그 prefix를 (topk_return, stance_threshold)가 확정될 때까지 늘림
+    - 같은 프로세스의 동시 요청: leader 결과를 같이 받음 (leader 조합으로 확정된 결과라 settle에서 다시 확인)
+    - 다른 워커가 계산 중: advisory lock을 기다렸다가 그쪽이 올린 캐시를 사용
+      (기다려도 캐시가 여전히 없거나 오래됐으면/시간 초과면 직접 계산)
+    반환: {"clicked", "candidates", "next_bound", "fetched"} 또는 에러 결과
+    """
+    key = reco_cache.cache_key(base_link, hours_window)
+
+    def run():
+        # 정규화(link_alias 연결, 네이버 조회 최대 10s)는 슬롯/advisory lock 연결을 잡기 전에
+        normalized = normalize_clicked(base_link)
+        with _compute_slots:
+            with pg_key_lock(key, wait_sec=RECO_FLIGHT_WAIT_SEC) as (_, waited):
+                if waited:
+                    row = get_cache_pg(base_link, hours_window, normalized)
+                    if row and not is_stale(row[2]):
+                        reco_cache.store([base_link, row[1]], hours_window, row)
+                        return row_result(row)
+                return _recompute_and_upsert(base_link, hours_window, topk_return, stance_threshold,
+                                             prior, normalized)
+
+    return _reco_flight.do(key, run)
+
+
+# 다른 조합으로 계산한 leader 결과를 받아 확정이 안 된 경우 다시 늘리는 횟수 상한
+_SETTLE_ROUNDS = 4
+
+
+def settle(base_link: str, hours_window: int, res: dict, topk_return: int, stance_threshold: float) -> dict:
+    """
+    후보 prefix(res)로 (topk_return, stance_threshold) 결과가 확정되는지 확인하고, 아니면 prefix를 늘린 결과 반환.
+    확정된 조합은 NLI/검색 없이 바로 반환. 에러 결과는 그대로.
+    """
+    for _ in range(_SETTLE_ROUNDS):
+        if "candidates" not in res or is_settled(
+            res["candidates"], res.get("next_bound"), topk_return, stance_threshold
+        ):
+            return res
+        _count_settle("extended")
+        res = compute_coalesced(base_link, hours_window, topk_return, stance_threshold, prior=res)
+    if "candidates" in res and not is_settled(
+        res["candidates"], res.get("next_bound"), topk_return, stance_threshold
+    ):
+        # 동시 요청이 계속 다른 조합으로 leader를 잡은 경우: 지금 prefix로 응답 (다음 요청에서 다시 늘림)
+        _count_settle("unsettled")
+    return res
+
+
+def claim_refresh(base_link: str, hours_window: int) -> bool:
+    """같은 키의 백그라운드 리프레시는 하나만 (True면 refresh_in_background를 예약할 것)"""
+    return _reco_flight.claim(reco_cache.cache_key(base_link, hours_window))
+
+
+def refresh_in_background(base_link: str, hours_window: int):
+    """
+    오래된 캐시 백그라운드 갱신 (기본 조합으로 확정되는 데까지). 동기 경로와 같은 compute_coalesced를 타므로
+    락 순서(SingleFlight → _compute_slots → advisory lock)와 동시 계산 상한이 같다.
+    - 같은 키 foreground 계산이 돌고 있으면 그 결과를 같이 받음
+    - 다른 워커가 갱신 중이면 advisory lock을 기다렸다가 그쪽이 올린 캐시를 사용
+    """
+    try:
+        compute_coalesced(base_link, hours_window)
+    finally:
+        _reco_flight.release(reco_cache.cache_key(base_link, hours_window))
+
+
+def single_flight_stats():
+    with _settle_lock:
+        settle_stats = dict(_settle_stats)
+    return {**_reco_flight.snapshot(), **settle_stats}
@@ -1,7 +1,17 @@
 # app/services/recommend_batch.py
 from __future__ import annotations
 
-from app.services.vector_store import train_vectorizer_and_index_all
+import os
+import time
+
+from app.services.vector_store import (
+    index_incremental,
+    load_index_state,
+    train_vectorizer_and_index_all,
+)
+
+# 이 시간이 지나면 증분 대신 vectorizer를 다시 fit 하는 full 재구축
+FULL_REFIT_HOURS = float(os.getenv("TFIDF_FULL_REFIT_HOURS", "24"))
 
 
 def build_full_tfidf_index() -> dict:
@@ -10,3 +20,20 @@ def build_full_tfidf_index() -> dict:
     """
     res = train_vectorizer_and_index_all()
     return res
+
+
+def build_tfidf_index(force_full: bool = False) -> dict:
+    """
+    주기 작업용 인덱스 갱신.
+    - 기본: high-water mark 이후 변경된 기사만 증분 인덱싱
+    - 마지막 full refit 후 FULL_REFIT_HOURS 경과 / 어휘 drift 초과 / 기존 인덱스 없음 → full 재구축
+    """
+    state = load_index_state()
+    last_full = float((state or {}).get("last_full_at") or 0.0)
+    if force_full or (time.time() - last_full) > FULL_REFIT_HOURS * 3600:
+        return {"mode": "full", **build_full_tfidf_index()}
+
+    res = index_incremental()
+    if res.get("needs_full"):
+        return {"mode": "full", "trigger": res.get("reason"), **build_full_tfidf_index()}
+    return {"mode": "incremental", **res}
@@ -1,24 +1,38 @@
 # app/services/recommend_core.py
 from __future__ import annotations
 
-import psycopg2
-from typing import Optional
-
-from app.model.model import nli_infer
+import logging
+import os
+import threading
+from datetime import timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.db.pool import get_conn
+from app.utils.lean import infer_lean, is_opposite_lean
 from app.utils.url_normalize import (
     normalize_clicked,
     strip_tracking_params,
     normalize_variant_urls,
 )
 from summa import summarizer
-from urllib.parse import urlparse
 
-DBCFG = dict(host="Veritas-db", dbname="appdb", user="appuser", password="apppw")
+logger = logging.getLogger(__name__)
 
+# 기준 기사 × hours_window 당 "유사도 순으로 점수 매긴 앞부분(prefix)"과 그 다음 후보의 유사도 상한(next_bound)을
+# 캐시해 두고, topk_return / stance_threshold 조합은 prefix만으로 결과가 확정되면(is_settled) 거기서 골라 씀.
+# 확정이 안 되는 조합이 오면 prefix를 이어서 늘림 (이미 매긴 점수는 재사용)
 
-def get_conn():
-    return psycopg2.connect(**DBCFG)
+# 유사도 상한으로 NLI를 조기 종료 (0이면 후보 SEARCH_MAX_K개 전부 NLI, 결과는 같음)
+EARLY_STOP = os.getenv("RECO_EARLY_STOP", "1") == "1"
+# 후보 검색: 첫 페이지 SEARCH_FIRST_K개, 결과가 안 정해지면 두 배씩 늘려 최대 SEARCH_MAX_K개까지
+SEARCH_FIRST_K = int(os.getenv("RECO_SEARCH_FIRST_K", "24"))
+SEARCH_MAX_K = int(os.getenv("RECO_SEARCH_MAX_K", "80"))
+# 조기 종료 판단 단위 (model.NLI_BATCH_SIZE와 같은 환경변수 → 한 번의 forward 크기)
+NLI_CHUNK = max(1, int(os.getenv("NLI_BATCH_SIZE", "16")))
 
+# /article/recommend 기본 조합 (미리 계산 / 백그라운드 리프레시가 확정시켜 두는 조합)
+DEFAULT_TOPK_RETURN = 8
+DEFAULT_STANCE_THRESHOLD = 0.1
 
 def summarize_text(text: str, ratio=0.2, hard_cap=600):
     text = (text or "").strip()
@@ -33,101 +47,52 @@ def summarize_text(text: str, ratio=0.2, hard_cap=600):
     return text[:hard_cap]
 
 
-LEAN_MAP = {
-    # 진보
-    "오마이뉴스": "progressive",
-    "한겨레": "progressive",
-    "프레시안": "progressive",
-    "경향신문": "progressive",
-    "JTBC": "progressive",
-    # 보수
-    "조선일보": "conservative",
-    "동아일보": "conservative",
-    "매일경제": "conservative",
-    "국민일보": "conservative",
-    "시사저널": "conservative",
-    # 중도
-    "뉴시스": "centrist",
-    "서울신문": "centrist",
-    "SBS": "centrist",
-    "연합뉴스TV": "centrist",
-}
+HYPOTHESIS_MAX_CHARS = 600
 
 
-def _infer_source_name(source: str | None, link: str | None) -> str | None:
-    if source and source.strip():
-        return source.strip()
+def hypothesis_text(summary: str | None, title: str | None) -> str:
+    """
+    NLI 가설 문장. api/summary.py가 저장한 news.summary를 그대로 사용 (요약 재계산 없음).
+    요약이 아직 없는 기사(요약 작업 전)는 제목.
+    """
+    s = (summary or "").strip()
+    if s:
+        return s[:HYPOTHESIS_MAX_CHARS]
+    return (title or "").strip()
 
-    if not link:
-        return None
 
-    try:
-        host = (urlparse(link).hostname or "").lower()
-    except Exception:
+def _utc_iso(dt) -> Optional[str]:
+    """인덱스 payload에 넣던 date 값과 같은 형식 (naive는 UTC로 간주)"""
+    if dt is None:
         return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.isoformat()
 
-    if host.startswith("www."):
-        host = host[4:]
-
-    if "yonhapnewstv.co.kr" in host:
-        return "연합뉴스"
-    if "ohmynews.com" in host:
-        return "오마이뉴스"
-    if "chosun.com" in host:
-        return "조선일보"
-    if "jtbc.co.kr" in host:
-        return "JTBC"
-    if "sbs.co.kr" in host:
-        return "SBS"
-    if "mk.co.kr" in host:
-        return "매일경제"
-    if "hani.co.kr" in host:
-        return "한겨레"
-    if "pressian.com" in host:
-        return "프레시안"
-    if "sisajournal.com" in host:
-        return "시사저널"
-    if "seoul.co.kr" in host:
-        return "서울신문"
-    if "donga.com" in host:
-        return "동아일보"
-    if "newsis.com" in host:
-        return "뉴시스"
-    if "kmib.co.kr" in host:
-        return "국민일보"
-    if "khan.co.kr" in host:
-        return "경향신문"
-
-    return None
-
-
-def _infer_lean(source: str | None, link: str | None, db_lean: str | None) -> str | None:
-    if db_lean:
-        return db_lean
-
-    src_name = _infer_source_name(source, link)
-    if src_name and src_name in LEAN_MAP:
-        return LEAN_MAP[src_name]
-
-    return None
-
-
-def _is_opposite_lean(base: str, cand: str) -> bool:
-    if base == "progressive" and cand == "conservative":
-        return True
-    if base == "conservative" and cand == "progressive":
-        return True
-    if base == "centrist" and cand in ("progressive", "conservative"):
-        return True
-    return False
+
+def _load_candidate_rows(cur, ids: Iterable[int]) -> Dict[int, Tuple[Optional[str], Optional[str], Any]]:
+    """후보 기사 id → (title, summary, date). 한 번의 쿼리 (포인트 id = news.id)"""
+    ids = [int(i) for i in ids if i is not None]
+    if not ids:
+        return {}
+    cur.execute(
+        """
+        SELECT id, title, summary, date
+        FROM news
+        WHERE id = ANY(%s)
+        """,
+        (ids,),
+    )
+    return {r[0]: (r[1], r[2], r[3]) for r in cur.fetchall()}
 
 
-def _fetch_base(cur, clicked_link: str):
+def _fetch_base(cur, clicked_link: str, normalized: str):
     """
-    기준 기사 1건 조회.
+    기준 기사 1건 조회 (정규화 URL 먼저, 없으면 클릭 URL 그대로).
     - summary 우선, 없으면 content
+    normalized: normalize_clicked(clicked_link). 네이버 원문 조회(HTTP)와 link_alias 연결을 타므로
+    cur의 연결을 빌리기 전에 호출 쪽에서 구해 넘김.
     """
-    normalized = normalize_clicked(clicked_link)
     cur.execute(
         """
         SELECT source,
@@ -135,7 +100,9 @@ def _fetch_base(cur, clicked_link: str):
                title,
                COALESCE(summary, content, '') AS text_for_vector,
                date,
-               link
+               link,
+               summary,
+               id
         FROM news WHERE link = %s;
         """,
         (normalized,),
@@ -149,128 +116,375 @@ def _fetch_base(cur, clicked_link: str):
                    title,
                    COALESCE(summary, content, '') AS text_for_vector,
                    date,
-                   link
+                   link,
+                   summary,
+                   id
             FROM news WHERE link = %s;
             """,
             (clicked_link,),
         )
         base = cur.fetchone()
-        normalized = clicked_link if base else normalized
-    return base, normalized
+    return base
 
 
-def compute_recommendations(
-    clicked_link: str,
-    hours_window: int = 48,
-    topk_return: int = 8,
-    stance_threshold: float = 0.15,
-):
+def _score_item(cand: Tuple[Any, dict, Optional[str], str], nli_res) -> dict:
     """
-    벡터DB(Qdrant) 기반 반대 의견 추천.
-
-    - TF-IDF 쿼리: 제목 2번 + summary/본문 앞 400자
-    - 우선: 반대 lean + stance 절대값이 stance_threshold 이상인 애들만
-    - 그런 애들이 없으면 → stance 기준 완화해서 fallback
+    후보 (hit, 후보 정보, lean, 가설) + NLI 결과 → 점수 매긴 후보.
+    score = sim * (0.8 + 0.2 * stance_norm)은 임계값과 무관하므로 여기서 한 번만 계산.
     """
-    from app.services.vector_store import search_similar_with_lean_fallback
-
-    conn = get_conn()
-    cur = conn.cursor()
-    try:
-        base, normalized = _fetch_base(cur, clicked_link)
-        if not base:
-            return {
-                "error": "해당 기사를 찾을 수 없습니다.",
-                "normalized": normalize_clicked(clicked_link),
-            }
+    h, info, cand_lean, _ = cand
+
+    if nli_res:
+        _, probs = nli_res
+        eprob, nprob, cprob = float(probs[0]), float(probs[1]), float(probs[2])
+    else:
+        eprob = nprob = cprob = 0.0
+
+    stance = cprob - eprob  # [-1, 1]
+    stance_norm = max(0.0, min(1.0, (stance + 1.0) / 2.0))
+
+    base_w, gain_w = 0.8, 0.2
+    sim_score = float(h.score or 0.0)
+    score = sim_score * (base_w + gain_w * stance_norm)
+
+    return dict(
+        title=info.get("title"),
+        link=normalize_variant_urls(strip_tracking_params(info.get("link") or "")),
+        source=info.get("source"),
+        lean=cand_lean,
+        date=info.get("date"),
+        probs={
+            "entailment": eprob,
+            "neutral": nprob,
+            "contradiction": cprob,
+        },
+        stance=stance,
+        sim=sim_score,
+        score=score,
+    )
 
-        b_source, b_lean_db, b_title, b_text, b_date, b_link = base
-        b_lean = _infer_lean(b_source, b_link, b_lean_db)
 
-        short_text = (b_text or "")[:400]
-        title_clean = (b_title or "").strip()
-        premise_tfidf = f"{title_clean} {title_clean} {short_text}".strip()
+def _score_upper_bound(sim: float) -> float:
+    """score = sim * (0.8 + 0.2 * stance_norm), stance_norm ∈ [0, 1] 이므로 score의 상한"""
+    return sim if sim >= 0 else 0.8 * sim
 
-        premise_nli = summarize_text(b_text or b_title, ratio=0.2, hard_cap=600) or (b_title or "")
-    finally:
-        cur.close()
-        conn.close()
 
-    hits = search_similar_with_lean_fallback(
-        query_text=premise_tfidf,
-        base_lean=b_lean,
-        base_date=b_date,
-        hours_window=hours_window,
-        top_k=80,  
+def is_settled(
+    candidates: List[dict],
+    next_bound: Optional[float],
+    topk_return: int,
+    stance_threshold: float,
+) -> bool:
+    """
+    유사도 순 prefix(candidates) + 아직 점수 매기지 않은 후보의 유사도 상한(next_bound)으로
+    (topk_return, stance_threshold) 결과가 확정인지.
+    - next_bound None: 후보가 이게 전부 (검색 끝 / SEARCH_MAX_K 도달)
+    - strong이 topk개 이상이고 k번째 strong 점수 >= 남은 후보의 점수 상한이면
+      남은 후보는 strong이 되어도 top-k에 못 들어가고, strong이 k개 이상이면 weak은 쓰이지 않으므로
+      후보 전체를 점수 매긴 것과 같은 결과 (동점이면 먼저 나온 후보가 앞서는 정렬 안정성도 동일)
+    """
+    if next_bound is None:
+        return True
+    strong = sorted(
+        (c["score"] for c in candidates if abs(c["stance"]) >= stance_threshold), reverse=True
     )
+    if len(strong) < topk_return:
+        return False
+    return strong[topk_return - 1] >= _score_upper_bound(float(next_bound))
+
+
+def _extend_prefix(
+    fetch_page: Callable[[int, int], list],
+    to_cands: Callable[[list, int], list],
+    premise_nli: str,
+    topk_return: int,
+    stance_threshold: float,
+    *,
+    prior: Optional[dict] = None,
+    infer: Optional[Callable[[str, List[str]], list]] = None,
+) -> Tuple[dict, Dict[str, int]]:
+    """
+    유사도 내림차순 검색 결과를 페이지로 받아가며 NLI 점수를 매겨 prefix를 (topk_return, stance_threshold)
+    결과가 확정될 때까지 늘림.
+    fetch_page(limit, offset) → hits, to_cands(hits, offset) → [(검색 offset, (hit, 후보 정보, lean, 가설))]
+    prior: 이전에 저장한 {"candidates", "next_bound", "fetched"} — 그 뒤부터 이어서 (이미 매긴 점수 재사용)
+
+    - EARLY_STOP: 페이지 안에서도 NLI_CHUNK개씩 추론하다가 확정되면 나머지는 NLI 없이 남겨 둠
+      (남긴 후보는 다음에 다른 조합이 prefix를 늘릴 때 다시 검색해서 매김)
+    - 페이지를 다 매겨도 안 정해지면 받아 온 개수의 두 배까지 더 받아옴 (최대 SEARCH_MAX_K)
+    같은 가설 문장은 한 번만 추론.
+    반환: ({"candidates", "next_bound", "fetched"}, 지표)
+      fetched: prefix 다음 후보의 검색 offset, next_bound: 그 후보부터의 유사도 상한 (None이면 후보 끝)
+    """
+    if infer is None:
+        # transformers/torch는 실제 추론 때만 로드 (캐시/라우팅 쪽만 쓰는 곳에서 import 비용 없게)
+        from app.model.model import nli_infer_batch as infer
+
+    st = {"candidates": 0, "nli_calls": 0, "nli_skipped": 0, "search_calls": 0, "fetched": 0}
+    memo: Dict[str, Any] = {}
+
+    def run(chunk):
+        hyps = [c[3] for c in chunk]
+        missing = [h for h in dict.fromkeys(hyps) if h not in memo]
+        if missing:
+            st["nli_calls"] += len(missing)
+            try:
+                memo.update(zip(missing, infer(premise_nli, missing)))
+            except Exception as e:
+                # NLI 실패 시 stance 0 (유사도 점수만으로 정렬)
+                logger.warning("[recommend] NLI 추론 실패, stance 없이 점수 계산: %s", e)
+        return [memo.get(h) for h in hyps]
+
+    scored: List[dict] = list((prior or {}).get("candidates") or [])
+    # 인덱스가 그 사이 바뀌어 같은 기사가 다시 나오면 건너뜀
+    seen = {c["link"] for c in scored}
+    fetched = int((prior or {}).get("fetched") or 0)
+    next_bound: Optional[float] = prior["next_bound"] if prior else float("inf")
+
+    while not is_settled(scored, next_bound, topk_return, stance_threshold):
+        target = max(SEARCH_FIRST_K, fetched * 2) if EARLY_STOP else SEARCH_MAX_K
+        limit = min(target, SEARCH_MAX_K) - fetched
+        if limit <= 0:
+            next_bound = None
+            break
+        page = fetch_page(limit, fetched)
+        st["search_calls"] += 1
+        st["fetched"] += len(page)
+        exhausted = len(page) < limit or fetched + len(page) >= SEARCH_MAX_K
+        page_end = fetched + len(page)
+        # 다음 페이지 후보는 이번 페이지 마지막 유사도 이하
+        page_bound = None if exhausted else float(page[-1].score or 0.0)
+
+        # 유사도 내림차순 (Qdrant 결과 순서 그대로, 안정 정렬)
+        cands = sorted(to_cands(page, fetched), key=lambda pc: float(pc[1][0].score or 0.0), reverse=True)
+        done = 0
+        stopped = False
+        while done < len(cands):
+            chunk = cands[done:done + (NLI_CHUNK if EARLY_STOP else len(cands))]
+            for (_, cand), nli_res in zip(chunk, run([c for _, c in chunk])):
+                item = _score_item(cand, nli_res)
+                if item["link"] in seen:
+                    continue
+                seen.add(item["link"])
+                scored.append(item)
+            done += len(chunk)
+            if done < len(cands):
+                bound = float(cands[done][1][0].score or 0.0)
+                if is_settled(scored, bound, topk_return, stance_threshold):
+                    fetched, next_bound = cands[done][0], bound
+                    st["nli_skipped"] += len(cands) - done
+                    stopped = True
+                    break
+        st["candidates"] += done
+        if stopped:
+            break
+        fetched, next_bound = page_end, page_bound
+
+    return {"candidates": scored, "next_bound": next_bound, "fetched": fetched}, st
+
+
+def select_recommendations(candidates: List[dict], topk_return: int, stance_threshold: float) -> List[dict]:
+    """
+    점수 매긴 후보 prefix(유사도 순) → topk_return / stance_threshold 조합의 추천 목록.
+    - 우선: stance 절대값이 stance_threshold 이상인 후보(strong)를 점수순으로
+    - 모자라면 나머지(weak)를 점수순으로 채움
+    NLI/검색 없이 메모리에서 거르고 자르기만 함. prefix로 확정되는 조합인지는 호출 쪽에서
+    is_settled로 먼저 확인 (아니면 prefix를 늘린 뒤 호출).
+    (동점이면 유사도가 높은 후보가 앞서는 것도 조합마다 따로 계산하던 때와 같음)
+    """
+    strong_picks: List[dict] = []
+    weak_picks: List[dict] = []
+    for c in candidates:
+        if abs(c["stance"]) >= stance_threshold:
+            strong_picks.append(c)
+        else:
+            weak_picks.append(c)
 
-    if not hits:
-        return {"clicked": normalize_clicked(b_link), "recommendations": []}
+    strong_picks.sort(key=lambda x: x["score"], reverse=True)
+    weak_picks.sort(key=lambda x: x["score"], reverse=True)
 
-    strong_picks = []
-    weak_picks = []
+    merged: list = strong_picks[:topk_return]
+    if len(merged) < topk_return:
+        need = topk_return - len(merged)
+        merged.extend(weak_picks[:need])
 
-    for h in hits:
+    with _scoring_lock:
+        _scoring_stats["derived"] += 1
+    # sim은 캐시용 필드 (응답 형식은 그대로)
+    return [{k: v for k, v in c.items() if k != "sim"} for c in merged]
+
+
+_scoring_stats: Dict[str, int] = {
+    "computations": 0,
+    "extensions": 0,
+    "candidates": 0,
+    "nli_calls": 0,
+    "nli_skipped": 0,
+    "search_calls": 0,
+    "points_fetched": 0,
+    "derived": 0,
+}
+_scoring_lock = threading.Lock()
+
+
+def _record_scoring(st: Dict[str, int], *, extended: bool):
+    with _scoring_lock:
+        _scoring_stats["extensions" if extended else "computations"] += 1
+        _scoring_stats["candidates"] += st["candidates"]
+        _scoring_stats["nli_calls"] += st["nli_calls"]
+        _scoring_stats["nli_skipped"] += st["nli_skipped"]
+        _scoring_stats["search_calls"] += st["search_calls"]
+        _scoring_stats["points_fetched"] += st["fetched"]
+    logger.debug("[recommend] 검색 %d회/%d건, 후보 %d, NLI %d, 건너뜀 %d%s",
+                 st["search_calls"], st["fetched"], st["candidates"], st["nli_calls"],
+                 st["nli_skipped"], " (prefix 연장)" if extended else "")
+
+
+def scoring_stats() -> Dict[str, Any]:
+    with _scoring_lock:
+        out: Dict[str, Any] = dict(_scoring_stats)
+    out["early_stop"] = EARLY_STOP
+    runs = out["computations"] + out["extensions"]
+    # 계산 1번으로 응답한 조합 수 (topk/threshold가 달라도 같은 prefix 재사용)
+    out["derived_per_computation"] = round(out["derived"] / runs, 2) if runs else None
+    out["avg_nli_skipped_per_computation"] = round(out["nli_skipped"] / runs, 2) if runs else None
+    out["avg_points_per_computation"] = round(out["points_fetched"] / runs, 2) if runs else None
+    return out
+
+
+def _page_candidates(hits, b_lean: Optional[str], offset: int = 0) -> List[Tuple[int, Tuple[Any, dict, Optional[str], str]]]:
+    """
+    검색 결과 한 페이지 → (검색 offset, (hit, 후보 정보, lean, 가설)) 목록.
+    offset: 이 페이지 첫 hit의 검색 offset (prefix를 중간에서 끊을 때 다음 검색 위치)
+    payload에는 필터용 필드만 있으므로 제목/요약/날짜는 news에서 id로 한 번에 읽음.
+    """
+    picked = []
+    for pos, h in enumerate(hits, start=offset):
         payload = h.payload or {}
         link = payload.get("link")
         src = payload.get("source")
         lean_db = payload.get("lean")
-        title = payload.get("title")
-        text = payload.get("content", "")
-        date_iso = payload.get("date")
 
-        cand_lean = _infer_lean(src, link, lean_db)
+        cand_lean = infer_lean(src, link, lean_db)
 
-        if b_lean and cand_lean and not _is_opposite_lean(b_lean, cand_lean):
+        # 서버 필터로 이미 걸러지지만, lean 추정 규칙이 바뀐 이전 인덱스 대비
+        if b_lean and cand_lean and not is_opposite_lean(b_lean, cand_lean):
             continue
 
-        hyp = summarize_text(text or title, ratio=0.2, hard_cap=600) or (title or "")
-        try:
-            label, probs = nli_infer(premise_nli, hyp)
-            eprob, nprob, cprob = float(probs[0]), float(probs[1]), float(probs[2])
-        except Exception:
-            eprob = nprob = cprob = 0.0
-
-        stance = cprob - eprob  # [-1, 1]
-        stance_norm = max(0.0, min(1.0, (stance + 1.0) / 2.0))
-
-        is_strong = abs(stance) >= stance_threshold
-
-        base_w, gain_w = 0.8, 0.2
-        sim_score = float(h.score or 0.0)
-        score = sim_score * (base_w + gain_w * stance_norm)
-
-        out_link = normalize_variant_urls(strip_tracking_params(link or ""))
-
-        item = dict(
-            title=title,
-            link=out_link,
-            source=src,
-            lean=cand_lean,
-            date=date_iso,
-            probs={
-                "entailment": eprob,
-                "neutral": nprob,
-                "contradiction": cprob,
-            },
-            stance=stance,
-            score=score,
-        )
+        picked.append((pos, h, payload, cand_lean))
+    if not picked:
+        return []
+
+    conn = get_conn()
+    cur = conn.cursor()
+    try:
+        rows = _load_candidate_rows(cur, [h.id for _, h, _, _ in picked])
+    finally:
+        cur.close()
+        conn.close()
+
+    cands = []
+    for pos, h, payload, cand_lean in picked:
+        row = rows.get(int(h.id))
+        if row is None:
+            # 인덱스 갱신 전에 삭제된 기사
+            continue
+        title, summary, date = row
+        info = {
+            "link": payload.get("link"),
+            "source": payload.get("source"),
+            "title": title,
+            "date": _utc_iso(date),
+        }
+        # 가설 문장: 저장된 summary 재사용 (후보마다 요약하지 않음)
+        cands.append((pos, (h, info, cand_lean, hypothesis_text(summary, title))))
+    return cands
+
+
+def compute_candidates(
+    clicked_link: str,
+    hours_window: int = 48,
+    topk_return: int = DEFAULT_TOPK_RETURN,
+    stance_threshold: float = DEFAULT_STANCE_THRESHOLD,
+    *,
+    prior: Optional[dict] = None,
+    normalized: Optional[str] = None,
+):
+    """
+    벡터DB(Qdrant) 기반 반대 의견 후보 prefix + 점수.
+
+    - TF-IDF 쿼리: 인덱싱된 기사면 Qdrant에 저장된 포인트 벡터(id 조회)를 그대로 사용,
+      아직 인덱싱 전이면 제목 2번 + summary/본문 앞 400자를 vectorizer로 변환
+    - 반대 lean / 기간은 Qdrant 필터로만 (같은 성향 후보는 받아오지 않음)
+    - 유사도 순으로 NLI 점수를 매기며 (topk_return, stance_threshold) 결과가 확정되는 데까지만 (_extend_prefix)
+    - prior: 캐시에 있던 prefix (이 조합으로는 확정이 안 될 때 이어서 늘림)
+    - normalized: 호출 쪽에서 미리 구한 normalize_clicked(clicked_link) (없으면 여기서, 연결을 빌리기 전에)
+    반환: {"clicked", "candidates", "next_bound", "fetched"} — 조합 선택은 is_settled + select_recommendations로
+    """
+    from app.services.vector_store import (
+        opposite_lean_filter,
+        query_vector_for_point,
+        query_vector_for_text,
+        search_page,
+    )
+
+    if normalized is None:
+        normalized = normalize_clicked(clicked_link)
+    conn = get_conn()
+    cur = conn.cursor()
+    try:
+        base = _fetch_base(cur, clicked_link, normalized)
+        if not base:
+            return {
+                "error": "해당 기사를 찾을 수 없습니다.",
+                "normalized": normalized,
+            }
+
+        b_source, b_lean_db, b_title, b_text, b_date, b_link, b_summary, b_id = base
+        b_lean = infer_lean(b_source, b_link, b_lean_db)
 
-        if is_strong:
-            strong_picks.append(item)
+        if (b_summary or "").strip():
+            premise_nli = hypothesis_text(b_summary, b_title)
         else:
-            weak_picks.append(item)
+            # 요약 작업 전 기사만 여기서 한 번 요약
+            premise_nli = summarize_text(b_text or b_title, ratio=0.2, hard_cap=600) or (b_title or "")
+    finally:
+        cur.close()
+        conn.close()
 
-    strong_picks.sort(key=lambda x: x["score"], reverse=True)
-    weak_picks.sort(key=lambda x: x["score"], reverse=True)
+    # 반대 성향 + 기간은 Qdrant 필터로 (lean/date_ts payload 인덱스)
+    # 인덱싱된 기사는 저장 벡터로 (vectorizer 로드/transform 없음), 아니면 텍스트 변환
+    query = query_vector_for_point(b_id)
+    if query is None:
+        short_text = (b_text or "")[:400]
+        title_clean = (b_title or "").strip()
+        query = query_vector_for_text(f"{title_clean} {title_clean} {short_text}".strip())
+    collection, using, q_vec = query
+    flt = opposite_lean_filter(b_lean, b_date, hours_window, exclude_id=b_id)
+
+    prefix, st = _extend_prefix(
+        lambda limit, offset: search_page(collection, using, q_vec, flt, limit=limit, offset=offset),
+        lambda page, offset: _page_candidates(page, b_lean, offset),
+        premise_nli,
+        topk_return,
+        stance_threshold,
+        prior=prior,
+    )
+    _record_scoring(st, extended=prior is not None)
+    return {"clicked": normalize_clicked(b_link), **prefix}
 
-    merged: list = strong_picks[:topk_return]
-    if len(merged) < topk_return:
-        need = topk_return - len(merged)
-        merged.extend(weak_picks[:need])
 
+def compute_recommendations(
+    clicked_link: str,
+    hours_window: int = 48,
+    topk_return: int = 8,
+    stance_threshold: float = 0.15,
+):
+    """캐시 없이 한 조합만 필요할 때: compute_candidates(그 조합으로 확정될 때까지) + select_recommendations"""
+    res = compute_candidates(clicked_link, hours_window, topk_return, stance_threshold)
+    if "candidates" not in res:
+        return res
     return {
-        "clicked": normalize_clicked(b_link),
-        "recommendations": merged,
+        "clicked": res["clicked"],
+        "recommendations": select_recommendations(res["candidates"], topk_return, stance_threshold),
     }
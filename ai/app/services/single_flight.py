@@ -0,0 +1,118 @@
+# app/services/single_flight.py
+"""
+같은 키의 무거운 계산을 한 번만 돌리는 single-flight.
+
+- 프로세스 안: SingleFlight.do(key, fn) — 먼저 온 호출(leader)만 fn을 실행하고
+  같은 키로 동시에 들어온 나머지는 그 결과(또는 예외)를 그대로 받음
+- 프로세스 간: pg_key_lock(key) — 키 해시로 PostgreSQL advisory lock을 잡아
+  다른 워커 프로세스가 같은 키를 계산 중이면 끝날 때까지 기다림
+- 백그라운드 작업 중복 방지: claim(key) / release(key)
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, Set, Tuple
+
+import psycopg2
+
+from app.db.pool import get_conn
+
+
+def lock_id(key: Hashable) -> int:
+    """키 → advisory lock용 signed 64bit 정수"""
+    digest = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+@contextmanager
+def pg_key_lock(key: Hashable, *, wait_sec: float) -> Iterator[Tuple[bool, bool]]:
+    """
+    키별 세션 advisory lock. (acquired, waited)를 넘겨줌.
+    - 바로 잡히면 (True, False)
+    - 다른 프로세스가 잡고 있으면 wait_sec까지 기다림 → (True, True) 또는 시간 초과 (False, True)
+    - wait_sec <= 0 이면 기다리지 않음 → (False, False)
+    락을 잡고 있는 동안 트랜잭션을 열어 두지 않도록 autocommit 연결 사용.
+    """
+    lid = lock_id(key)
+    conn = get_conn()
+    try:
+        conn.autocommit = True
+        cur = conn.cursor()
+    except Exception:
+        conn.close()
+        raise
+    acquired = waited = False
+    try:
+        cur.execute("SELECT pg_try_advisory_lock(%s)", (lid,))
+        acquired = bool(cur.fetchone()[0])
+        if not acquired and wait_sec > 0:
+            waited = True
+            cur.execute("SET lock_timeout = %s", (f"{int(wait_sec * 1000)}ms",))
+            try:
+                cur.execute("SELECT pg_advisory_lock(%s)", (lid,))
+                acquired = True
+            except psycopg2.errors.LockNotAvailable:
+                acquired = False
+            finally:
+                cur.execute("RESET lock_timeout")
+        yield acquired, waited
+    finally:
+        try:
+            if acquired:
+                cur.execute("SELECT pg_advisory_unlock(%s)", (lid,))
+        finally:
+            cur.close()
+            conn.close()
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._claimed: Set[Hashable] = set()
+        self.stats: Dict[str, int] = {"runs": 0, "coalesced": 0, "claimed": 0, "claim_deduped": 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            fut = self._calls.get(key)
+            leader = fut is None
+            if leader:
+                fut = self._calls[key] = Future()
+                self.stats["runs"] += 1
+            else:
+                self.stats["coalesced"] += 1
+        if not leader:
+            return fut.result()
+
+        try:
+            res = fn()
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(res)
+            return res
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def claim(self, key: Hashable) -> bool:
+        """백그라운드 작업 예약 전에 호출. 이미 예약/실행 중인 키면 False"""
+        with self._lock:
+            if key in self._claimed:
+                self.stats["claim_deduped"] += 1
+                return False
+            self._claimed.add(key)
+            self.stats["claimed"] += 1
+            return True
+
+    def release(self, key: Hashable):
+        with self._lock:
+            self._claimed.discard(key)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.stats, "inflight": len(self._calls), "claimed_now": len(self._claimed)}
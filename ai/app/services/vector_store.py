@@ -2,33 +2,63 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from datetime import timezone
+from typing import List, Optional, Dict, Any, Tuple, Union
+from datetime import datetime, timedelta, timezone
 import logging
+import threading
 import time
+import json
 import os
+import re
 
 import joblib
-from sklearn.feature_extraction.text import TfidfVectorizer
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.preprocessing import normalize
 
 from qdrant_client import QdrantClient
 from qdrant_client.http.models import (
-    Distance,
-    VectorParams,
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
     PointStruct,
+    SparseVector,
+    SparseVectorParams,
     Filter,
     FieldCondition,
+    HasIdCondition,
     Range,
-    MatchValue,
+    MatchAny,
+    PayloadSchemaType,
 )
 
+from app.db.pool import get_conn
+from app.utils.lean import infer_lean, opposite_lean_values
+
 logger = logging.getLogger(__name__)
 
+# blue/green 도입 전 단일 pickle 경로 (스탬프가 없을 때만 사용)
 VECTORIZER_PATH = Path("models/tfidf_news.pkl")
+# 현재 활성 버전(컬렉션 + vectorizer pickle 쌍) 스탬프.
+# 쿼리 경로는 이 파일만 stat 해서 리로드 여부 판단
+VECTORIZER_VERSION_PATH = Path("models/tfidf_news.version")
+# 증분 인덱싱 상태 (high-water mark, 마지막 full refit 시각, 기준 OOV 비율)
+INDEX_STATE_PATH = Path("models/tfidf_news.state.json")
+
+# 증분 인덱싱 시 high-water mark 이전 구간을 겹쳐서 다시 읽는 폭
+# (NOW()는 트랜잭션 시작 시각이라 늦게 커밋된 행이 mark보다 과거 시각을 가질 수 있음)
+INCREMENTAL_OVERLAP_SEC = int(os.getenv("TFIDF_INCREMENTAL_OVERLAP_SEC", "600"))
+# 새 문서의 OOV 비율이 학습 당시보다 이만큼 높아지면 full refit
+DRIFT_THRESHOLD = float(os.getenv("TFIDF_DRIFT_THRESHOLD", "0.15"))
+DRIFT_SAMPLE_DOCS = 2000
 
 QDRANT_HOST = os.getenv("QDRANT_HOST", "qdrant")
 QDRANT_PORT = int(os.getenv("QDRANT_PORT", "6333"))
+# 활성 버전 컬렉션(news_tfidf_v{n})을 가리키는 alias
 COLLECTION = "news_tfidf"
+# news_tfidf 컬렉션의 named sparse vector 이름
+SPARSE_VECTOR_NAME = "tfidf"
 
 client = QdrantClient(
     host=QDRANT_HOST,
@@ -36,6 +66,15 @@ client = QdrantClient(
     timeout=1800.0,
 )
 
+# 포인트 payload 필드. 검색 결과도 이 필드만 받음 (이전 버전의 두꺼운 payload 컬렉션 포함)
+PAYLOAD_FIELDS = ["id", "lean", "source", "date_ts", "link"]
+
+# 검색 필터에 쓰는 payload 필드 인덱스 (lean: 반대 성향 필터, date_ts: 기간 필터)
+PAYLOAD_INDEXES = {
+    "lean": PayloadSchemaType.KEYWORD,
+    "date_ts": PayloadSchemaType.INTEGER,
+}
+
 
 def train_vectorizer_and_index_all(batch_size: int = 1000) -> Dict[str, int]:
     """
@@ -44,30 +83,150 @@ def train_vectorizer_and_index_all(batch_size: int = 1000) -> Dict[str, int]:
     - summary 있으면 summary 위주, 없으면 content 일부만 사용
     - 제목을 2번 넣어서 가중치 ↑
     - 본문은 앞 400자까지만 사용해서 긴 기사 노이즈 ↓
-    - 매 호출마다 news_tfidf 컬렉션을 현재 dim으로 recreate
+    - 매 호출마다 새 버전 컬렉션(news_tfidf_v{n}, sparse vector)에 인덱싱한 뒤
+      개수 검증이 통과하면 news_tfidf alias와 vectorizer 스탬프를 함께 전환
+      (재구축 중에도 기존 버전이 계속 서비스되고, 직전 버전은 롤백용으로 보관)
     """
-    from app.services.recommend_core import get_conn  
-
     t_global_start = time.time()
 
-    logger.info("[vector_store] step1: news 전체 SELECT 시작")
+    # ---- pass 1: 서버 사이드 커서로 스트리밍하면서 vectorizer fit (원문 텍스트는 chunk 단위로만 보유)
+    logger.info("[vector_store] step1: news 스트리밍 + TF-IDF fit 시작")
+
+    tfidf = _new_vectorizer()
+    fit_stats: Dict[str, Any] = {"rows": 0, "sample": []}
+    _fit_streaming(tfidf, _iter_news_chunks(), fit_stats)
+    total = fit_stats["rows"]
+
+    if not total:
+        logger.info("[vector_store] step1: news row 없음, 인덱싱 스킵")
+        return {"indexed": 0}
+
+    version = _next_index_version()
+    target = _collection_for(version)
+    _save_vectorizer(tfidf, version)
+    baseline_oov = _oov_ratio(tfidf, fit_stats["sample"])
+    fit_stats["sample"] = []
+
+    dim = tfidf.n_features_out_
+    step1_time = time.time() - t_global_start
+    logger.info(
+        "[vector_store] step1 완료: rows=%d, dim=%d (%.2f초 소요)",
+        total,
+        dim,
+        step1_time,
+    )
+
+    logger.info(
+        "[vector_store] 새 버전 컬렉션 %s 를 sparse(%s, dim=%d) 로 생성합니다.",
+        target,
+        SPARSE_VECTOR_NAME,
+        dim,
+    )
+    if client.collection_exists(collection_name=target):
+        client.delete_collection(collection_name=target)
+    client.create_collection(
+        collection_name=target,
+        vectors_config={},
+        sparse_vectors_config={SPARSE_VECTOR_NAME: SparseVectorParams()},
+    )
+    _ensure_payload_indexes(target)
+
+    # ---- pass 2: 다시 스트리밍하면서 chunk 단위 transform + upsert
+    logger.info(
+        "[vector_store] step2: transform + Qdrant upsert 시작 (total≈%d, batch_size=%d)",
+        total,
+        batch_size,
+    )
+
+    hw: Dict[str, Any] = {"max": None}
+
+    def _batches():
+        # 생산자: transform + PointStruct 생성 (업로드는 워커 스레드에서 병행)
+        for rows in _iter_news_chunks(chunk_size=batch_size):
+            X_batch = tfidf.transform([_doc_for_vector(r[1], r[2]) for r in rows])
+            points = [_point_for(X_batch, offset, *r[:7]) for offset, r in enumerate(rows)]
+            stamps = [r[7] for r in rows if r[7] is not None]
+            if stamps and (hw["max"] is None or max(stamps) > hw["max"]):
+                hw["max"] = max(stamps)
+            yield points, (min(stamps) if stamps else None)
+
+    up = _upload_batches(target, _batches())
+    indexed = up["points"]
+    high_water = hw["max"]
+    if up["failed_since"] is not None and high_water is not None:
+        # 실패한 배치는 다음 증분 인덱싱이 다시 집어가도록 mark를 당겨 둠
+        high_water = min(high_water, up["failed_since"])
+
+    total_time = time.time() - t_global_start
+    logger.info(
+        "[vector_store] 전체 TF-IDF 인덱스 재구축 완료: indexed=%d, failed=%d (총 %.2f초, %.0f points/s)",
+        indexed,
+        up["failed_points"],
+        total_time,
+        up["points_per_sec"],
+    )
+
+    failed_ratio = up["failed_points"] / max(1, indexed + up["failed_points"])
+    if failed_ratio > MAX_FAILED_RATIO:
+        _drop_index_version(version)
+        raise RuntimeError(
+            f"upsert 실패 비율 {failed_ratio:.3f} > {MAX_FAILED_RATIO}, alias 전환 취소"
+        )
+
+    # sanity check 통과 전에는 alias를 건드리지 않음 (기존 버전이 계속 서비스)
+    count = _wait_for_count(target, indexed)
+    logger.info("[vector_store] Qdrant 컬렉션 %s 현재 포인트 개수: %d", target, count)
+    if count < indexed:
+        _drop_index_version(version)
+        raise RuntimeError(
+            f"sanity check 실패: {target} count={count} < indexed={indexed}, alias 전환 취소"
+        )
+
+    _activate_index_version(
+        version,
+        high_water=high_water.isoformat() if high_water else None,
+    )
+
+    _save_index_state(
+        {
+            "high_water": high_water.isoformat() if high_water else None,
+            "last_full_at": time.time(),
+            "baseline_oov": baseline_oov,
+            "indexed": indexed,
+        }
+    )
+
+    return {
+        "indexed": indexed,
+        "failed": up["failed_points"],
+        "points_per_sec": up["points_per_sec"],
+        "version": version,
+        "collection": target,
+    }
+
+
+def index_incremental(batch_size: int = 1000) -> Dict[str, Any]:
+    """
+    high-water mark 이후 insert/update된 news 행만 기존 vectorizer로 transform 해서 upsert.
+
+    - vectorizer/상태 파일이 없으면 needs_full=True 반환 (호출 측에서 full 재구축)
+    - 새 문서들의 OOV 비율이 학습 당시 대비 DRIFT_THRESHOLD 이상 높으면 needs_full=True
+    """
+    t_start = time.time()
+    state = load_index_state()
+    if not state or not state.get("high_water") or _current_stamp() is None:
+        return {"indexed": 0, "needs_full": True, "reason": "no_base_index"}
+    if not _is_sparse_collection(active_collection()):
+        return {"indexed": 0, "needs_full": True, "reason": "legacy_dense_collection"}
+
+    since = datetime.fromisoformat(state["high_water"]) - timedelta(seconds=INCREMENTAL_OVERLAP_SEC)
 
     conn = get_conn()
     cur = conn.cursor()
     try:
         cur.execute(
-            """
-            SELECT id,
-                   title,
-                   COALESCE(summary, content, '') AS text_for_vector,
-                   link,
-                   source,
-                   lean,
-                   date
-            FROM news
-            WHERE link IS NOT NULL
-              AND link <> '';
-            """
+            _NEWS_VECTOR_SQL + " AND updated_at >= %s ORDER BY updated_at;",
+            (since,),
         )
         rows = cur.fetchall()
     finally:
@@ -75,200 +234,742 @@ def train_vectorizer_and_index_all(batch_size: int = 1000) -> Dict[str, int]:
         conn.close()
 
     if not rows:
-        logger.info("[vector_store] step1: news row 없음, 인덱싱 스킵")
-        return {"indexed": 0}
+        return {"indexed": 0, "needs_full": False}
 
-    ids = [r[0] for r in rows]
-    titles = [r[1] for r in rows]
-    texts = [r[2] for r in rows]
-    links = [r[3] for r in rows]
-    srcs = [r[4] for r in rows]
-    leans = [r[5] for r in rows]
-    dates = [r[6] for r in rows]
+    tfidf, collection = get_active_index()
+    try:
+        _ensure_payload_indexes(collection)
+    except Exception as e:
+        # 인덱스 생성 실패로 증분 인덱싱까지 막지 않음 (검색이 느려질 뿐)
+        logger.warning("[vector_store] payload 인덱스 확인 실패(%s): %s", collection, e)
+    docs = [_doc_for_vector(r[1], r[2]) for r in rows]
+
+    drift = _oov_ratio(tfidf, docs[:DRIFT_SAMPLE_DOCS]) - float(state.get("baseline_oov") or 0.0)
+    if drift > DRIFT_THRESHOLD:
+        logger.info("[vector_store] 증분 인덱싱: 어휘 drift %.3f > %.3f, full refit 필요", drift, DRIFT_THRESHOLD)
+        return {"indexed": 0, "needs_full": True, "reason": "drift", "drift": round(drift, 4)}
+
+    X = tfidf.transform(docs)
+
+    def _batches():
+        for start in range(0, len(rows), batch_size):
+            end = min(start + batch_size, len(rows))
+            X_batch = X[start:end]
+            points = [
+                _point_for(X_batch, offset, *r[:7])
+                for offset, r in enumerate(rows[start:end])
+            ]
+            stamps = [r[7] for r in rows[start:end] if r[7] is not None]
+            yield points, (min(stamps) if stamps else None)
+
+    up = _upload_batches(collection, _batches())
+    indexed = up["points"]
+
+    high_water = max((r[7] for r in rows if r[7] is not None), default=None)
+    if up["failed_since"] is not None and high_water is not None:
+        high_water = min(high_water, up["failed_since"])
+    if high_water is not None:
+        state["high_water"] = max(datetime.fromisoformat(state["high_water"]), high_water).isoformat()
+    state["indexed"] = int(state.get("indexed") or 0) + indexed
+    _save_index_state(state)
 
-    step1_time = time.time() - t_global_start
     logger.info(
-        "[vector_store] step1 완료: rows=%d (%.2f초 소요)",
-        len(rows),
-        step1_time,
+        "[vector_store] 증분 인덱싱 완료: indexed=%d, drift=%.3f (%.2f초)",
+        indexed,
+        drift,
+        time.time() - t_start,
     )
+    return {
+        "indexed": indexed,
+        "failed": up["failed_points"],
+        "needs_full": False,
+        "drift": round(drift, 4),
+    }
+
+
+_NEWS_VECTOR_SQL = """
+    SELECT id,
+           title,
+           COALESCE(summary, content, '') AS text_for_vector,
+           link,
+           source,
+           lean,
+           date,
+           updated_at
+    FROM news
+    WHERE link IS NOT NULL
+      AND link <> ''
+"""
+
+# 업로드 파이프라인: 동시 업로드 워커 수 / 배치당 재시도 / wait 여부
+UPSERT_WORKERS = int(os.getenv("QDRANT_UPSERT_WORKERS", "4"))
+UPSERT_MAX_RETRIES = int(os.getenv("QDRANT_UPSERT_RETRIES", "5"))
+UPSERT_WAIT = os.getenv("QDRANT_UPSERT_WAIT", "1") == "1"
+# 재시도 후에도 실패한 포인트가 이 비율을 넘으면 새 버전을 활성화하지 않음
+MAX_FAILED_RATIO = float(os.getenv("TFIDF_MAX_FAILED_RATIO", "0.01"))
+
+# 서버 사이드 커서에서 한 번에 가져오는 행 수
+STREAM_ITERSIZE = int(os.getenv("TFIDF_STREAM_ITERSIZE", "2000"))
+
+
+# 해시 버킷 수 (fit 중 df/tf 누적 배열 크기 = 메모리 상한)
+HASH_N_FEATURES = int(os.getenv("TFIDF_HASH_N_FEATURES", str(2 ** 22)))
+
+
+class StreamingTfidfVectorizer:
+    """
+    HashingVectorizer 기반 TF-IDF.
 
-    logger.info("[vector_store] step2: TF-IDF fit_transform 시작")
-
-    docs: List[str] = []
-    for t, x in zip(titles, texts):
-        title = (t or "").strip()
-        body = (x or "").strip()
-        body_short = body[:400]
-        doc = f"{title} {title} {body_short}".strip()
-        docs.append(doc)
+    TfidfVectorizer.fit은 전체 코퍼스의 토큰 인덱스를 한 번에 들고 있어서
+    메모리가 테이블 크기에 비례해 커진다. 여기서는 chunk마다 해시 버킷별
+    df/tf만 누적(partial_fit)하고, finalize에서 TfidfVectorizer와 같은 규칙
+    (min_df, max_df, tf 상위 max_features, smooth idf)으로 버킷을 고른다.
+    fit 메모리는 n_features 크기 배열 두 개로 고정.
+    """
 
-    tfidf = TfidfVectorizer(
+    def __init__(
+        self,
+        *,
+        min_df: int = 3,
+        max_df: float = 0.9,
+        ngram_range=(1, 2),
+        max_features: int = 20000,
+        sublinear_tf: bool = True,
+        n_features: int = HASH_N_FEATURES,
+    ):
+        self.min_df = min_df
+        self.max_df = max_df
+        self.max_features = max_features
+        self.sublinear_tf = sublinear_tf
+        self.hasher = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=ngram_range,
+            alternate_sign=False,
+            norm=None,
+        )
+        self.n_docs = 0
+        self._df = np.zeros(n_features, dtype=np.int64)
+        self._tf = np.zeros(n_features, dtype=np.float64)
+        self.columns_ = None
+        self.idf_ = None
+
+    def partial_fit(self, docs: List[str]) -> "StreamingTfidfVectorizer":
+        if not docs:
+            return self
+        Xh = self.hasher.transform(docs)
+        n = self.hasher.n_features
+        # 행마다 버킷 인덱스는 중복 없이 합산되어 있으므로 bincount = df
+        self._df += np.bincount(Xh.indices, minlength=n)
+        self._tf += np.bincount(Xh.indices, weights=Xh.data, minlength=n)
+        self.n_docs += len(docs)
+        return self
+
+    def finalize(self) -> "StreamingTfidfVectorizer":
+        df = self._df
+        keep = np.flatnonzero((df >= self.min_df) & (df <= self.max_df * self.n_docs))
+        if self.max_features and keep.size > self.max_features:
+            top = np.argsort(-self._tf[keep], kind="stable")[: self.max_features]
+            keep = keep[top]
+        self.columns_ = np.sort(keep)
+        self.idf_ = np.log((1.0 + self.n_docs) / (1.0 + df[self.columns_])) + 1.0
+        # 누적 배열은 더 이상 필요 없음 (pickle 크기 ↓)
+        self._df = self._tf = None
+        return self
+
+    @property
+    def n_features_out_(self) -> int:
+        return int(self.columns_.size)
+
+    def transform(self, docs: List[str]):
+        X = self.hasher.transform(docs)[:, self.columns_].tocsr()
+        if self.sublinear_tf:
+            np.log(X.data, X.data)
+            X.data += 1.0
+        X = X.multiply(self.idf_).tocsr()
+        return normalize(X, norm="l2", copy=False)
+
+    def oov_ratio(self, docs: List[str]) -> float:
+        """토큰(n-gram) 중 선택된 버킷 밖으로 떨어지는 비율"""
+        if not docs:
+            return 0.0
+        Xh = self.hasher.transform(docs)
+        total = Xh.data.sum()
+        if not total:
+            return 0.0
+        inside = Xh.data[np.isin(Xh.indices, self.columns_)].sum()
+        return float((total - inside) / total)
+
+
+# 저장/로드되는 vectorizer. 지금 학습은 모두 StreamingTfidfVectorizer,
+# TfidfVectorizer는 그 이전에 저장된 pickle (증분 인덱싱/쿼리에는 그대로 사용 가능)
+Vectorizer = Union[StreamingTfidfVectorizer, TfidfVectorizer]
+
+
+def _new_vectorizer() -> StreamingTfidfVectorizer:
+    return StreamingTfidfVectorizer(
         min_df=3,             # 너무 희귀한 단어 제거
         max_df=0.9,           # 거의 모든 문서에 나오는 단어 제거
         ngram_range=(1, 2),   # unigram + bigram
         max_features=20000,   # 상위 2만 개 feature만 사용
         sublinear_tf=True,    # tf를 log 스케일로
     )
-    X = tfidf.fit_transform(docs)
 
-    VECTORIZER_PATH.parent.mkdir(parents=True, exist_ok=True)
-    joblib.dump(tfidf, VECTORIZER_PATH)
 
-    dim = X.shape[1]
-    step2_time = time.time() - t_global_start - step1_time
-    logger.info(
-        "[vector_store] step2 완료: dim=%d (TF-IDF 학습 %.2f초 소요)",
-        dim,
-        step2_time,
-    )
-
-    logger.info(
-        "[vector_store] 컬렉션 %s 를 dim=%d 로 recreate_collection 합니다.",
-        COLLECTION,
-        dim,
-    )
-    client.recreate_collection(
-        collection_name=COLLECTION,
-        vectors_config=VectorParams(
-            size=dim,
-            distance=Distance.COSINE,
-        ),
-    )
+def _iter_news_chunks(chunk_size: int = STREAM_ITERSIZE):
+    """
+    news 전체를 psycopg2 named(server-side) cursor로 chunk 단위 스트리밍.
+    테이블 크기와 무관하게 메모리에는 chunk 하나만 올라옴.
+    """
+    conn = get_conn()
+    try:
+        cur = conn.cursor(name="news_tfidf_stream")
+        cur.itersize = chunk_size
+        cur.execute(_NEWS_VECTOR_SQL + " ORDER BY id;")
+        while True:
+            rows = cur.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield rows
+        cur.close()
+    finally:
+        conn.close()
 
-    total = len(ids)
-    logger.info(
-        "[vector_store] step3: Qdrant upsert 시작 (total=%d, batch_size=%d)",
-        total,
-        batch_size,
-    )
 
-    indexed = 0
+def _fit_streaming(tfidf: StreamingTfidfVectorizer, chunks, stats: Dict[str, Any]) -> None:
+    """chunk 단위 partial_fit. 행 수와 drift 기준용 샘플만 stats에 남김"""
+    for rows in chunks:
+        docs = [_doc_for_vector(r[1], r[2]) for r in rows]
+        stats["rows"] += len(docs)
+        room = DRIFT_SAMPLE_DOCS - len(stats["sample"])
+        if room > 0:
+            stats["sample"].extend(docs[:room])
+        tfidf.partial_fit(docs)
+    tfidf.finalize()
 
-    for start in range(0, total, batch_size):
-        end = min(start + batch_size, total)
-        logger.info(
-            "[vector_store] step3: upsert batch %d ~ %d / %d",
-            start + 1,
-            end,
-            total,
-        )
 
-        X_batch = X[start:end].toarray().tolist()
-        points: List[PointStruct] = []
-
-        for offset, (doc_id, title, text, link, src, lean, dt) in enumerate(
-            zip(
-                ids[start:end],
-                titles[start:end],
-                texts[start:end],
-                links[start:end],
-                srcs[start:end],
-                leans[start:end],
-                dates[start:end],
-            )
-        ):
-            vec = X_batch[offset]
-
-            if dt is not None:
-                dt_utc = dt
-                if dt_utc.tzinfo is None:
-                    dt_utc = dt_utc.replace(tzinfo=timezone.utc)
-                ts = int(dt_utc.timestamp())
-                date_iso = dt_utc.isoformat()
-            else:
-                ts = None
-                date_iso = None
-
-            payload: Dict[str, Any] = {
-                "id": int(doc_id),
-                "title": title,
-                "content": text, 
-                "link": link,
-                "source": src,
-                "lean": lean,
-                "date_ts": ts,
-                "date": date_iso,
-            }
-            points.append(PointStruct(id=int(doc_id), vector=vec, payload=payload))
-
-        logger.info(
-            "[vector_store] step3: calling client.upsert() for batch %d ~ %d (count=%d)",
-            start + 1,
-            end,
-            len(points),
-        )
+def _upsert_with_retry(collection: str, points: List[PointStruct], *, wait: bool, max_retries: int) -> int:
+    """배치 단위 upsert. 실패 시 지수 백오프로 재시도하고 재시도 횟수를 반환 (최종 실패는 예외)"""
+    attempt = 0
+    while True:
         try:
-            client.upsert(collection_name=COLLECTION, points=points)
+            client.upsert(collection_name=collection, points=points, wait=wait)
+            return attempt
         except Exception as e:
-            import traceback
-            logger.error(
-                "[vector_store] Qdrant upsert 실패 (batch %d ~ %d): %r",
-                start + 1,
-                end,
+            if attempt >= max_retries:
+                raise
+            delay = min(30.0, 0.5 * (2 ** attempt))
+            attempt += 1
+            logger.warning(
+                "[vector_store] upsert 실패 (count=%d), %.1f초 후 재시도 %d/%d: %r",
+                len(points),
+                delay,
+                attempt,
+                max_retries,
                 e,
             )
-            traceback.print_exc()
-            raise
+            time.sleep(delay)
 
-        indexed += len(points)
-        logger.info(
-            "[vector_store] step3: done upsert batch %d ~ %d (누적 indexed=%d)",
-            start + 1,
-            end,
-            indexed,
-        )
 
-    total_time = time.time() - t_global_start
+def _upload_batches(
+    collection: str,
+    batches,
+    *,
+    workers: int = UPSERT_WORKERS,
+    wait: bool = UPSERT_WAIT,
+    max_retries: int = UPSERT_MAX_RETRIES,
+) -> Dict[str, Any]:
+    """
+    (points, 배치 내 최소 updated_at) 스트림을 워커 스레드로 병렬 업로드.
+
+    - 동시에 떠 있는 배치는 workers * 2개로 제한 (생산자가 앞서가면 대기 = backpressure)
+    - 배치별 재시도 후에도 실패하면 전체를 중단하지 않고 실패 건수/시점만 기록
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = max(1, workers)
+    inflight = threading.BoundedSemaphore(workers * 2)
+    lock = threading.Lock()
+    stats: Dict[str, Any] = {
+        "points": 0,
+        "batches": 0,
+        "retries": 0,
+        "failed_batches": 0,
+        "failed_points": 0,
+        "failed_since": None,
+    }
+
+    def _job(points, since):
+        try:
+            retries = _upsert_with_retry(collection, points, wait=wait, max_retries=max_retries)
+            with lock:
+                stats["points"] += len(points)
+                stats["batches"] += 1
+                stats["retries"] += retries
+        except Exception as e:
+            logger.error("[vector_store] upsert 최종 실패 (count=%d): %r", len(points), e)
+            with lock:
+                stats["failed_batches"] += 1
+                stats["failed_points"] += len(points)
+                stats["retries"] += max_retries
+                if since is not None and (stats["failed_since"] is None or since < stats["failed_since"]):
+                    stats["failed_since"] = since
+        finally:
+            inflight.release()
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="qdrant-upsert") as ex:
+        for points, since in batches:
+            if not points:
+                continue
+            inflight.acquire()
+            ex.submit(_job, points, since)
+    elapsed = time.perf_counter() - t0
+
+    stats["elapsed_sec"] = round(elapsed, 2)
+    stats["points_per_sec"] = round(stats["points"] / elapsed, 1) if elapsed > 0 else 0.0
     logger.info(
-        "[vector_store] 전체 TF-IDF 인덱스 재구축 완료: indexed=%d (총 %.2f초)",
-        indexed,
-        total_time,
+        "[vector_store] 업로드 완료: %s points, %d batches, %d failed (%.0f points/s, workers=%d, wait=%s)",
+        stats["points"],
+        stats["batches"],
+        stats["failed_batches"],
+        stats["points_per_sec"],
+        workers,
+        wait,
+    )
+    return stats
+
+
+def _wait_for_count(collection: str, expected: int, timeout_sec: float = 120.0) -> int:
+    """wait=False 업로드는 비동기 반영이므로 기대 개수에 도달할 때까지 잠시 폴링"""
+    deadline = time.time() + timeout_sec
+    count = -1
+    while True:
+        try:
+            count = client.count(collection_name=collection, exact=True).count
+        except Exception as e:
+            logger.warning("[vector_store] Qdrant 포인트 개수 조회 실패: %s", e)
+        if count >= expected or UPSERT_WAIT or time.time() >= deadline:
+            return count
+        time.sleep(1.0)
+
+
+def _doc_for_vector(title: Optional[str], text: Optional[str]) -> str:
+    """제목 2번 + 본문(summary 우선) 앞 400자"""
+    title = (title or "").strip()
+    body_short = (text or "").strip()[:400]
+    return f"{title} {title} {body_short}".strip()
+
+
+def _point_for(X, row: int, doc_id, title, text, link, src, lean, dt) -> PointStruct:
+    vec = {SPARSE_VECTOR_NAME: _csr_row_to_sparse(X, row)}
+
+    if dt is not None:
+        dt_utc = dt
+        if dt_utc.tzinfo is None:
+            dt_utc = dt_utc.replace(tzinfo=timezone.utc)
+        ts = int(dt_utc.timestamp())
+    else:
+        ts = None
+
+    # 필터/랭킹에 쓰는 필드만 (제목/본문/날짜 표시값은 news에서 id로 한 번에 조회)
+    payload: Dict[str, Any] = {
+        "id": int(doc_id),
+        "link": link,
+        "source": src,
+        # 검색 시 lean은 서버 필터로만 거르므로 출처로 추정한 값까지 넣어 둠
+        "lean": infer_lean(src, link, lean),
+        "date_ts": ts,
+    }
+    return PointStruct(id=int(doc_id), vector=vec, payload=payload)
+
+
+def _oov_ratio(tfidf: Vectorizer, docs: List[str]) -> float:
+    """문서 토큰(n-gram) 중 vectorizer 어휘에 없는 비율"""
+    if hasattr(tfidf, "oov_ratio"):
+        return tfidf.oov_ratio(docs)
+    analyze = tfidf.build_analyzer()
+    vocab = tfidf.vocabulary_
+    total = oov = 0
+    for d in docs:
+        for tok in analyze(d):
+            total += 1
+            if tok not in vocab:
+                oov += 1
+    return (oov / total) if total else 0.0
+
+
+def load_index_state() -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(INDEX_STATE_PATH.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("[vector_store] 인덱스 상태 파일 읽기 실패: %s", e)
+        return None
+
+
+def _save_index_state(state: Dict[str, Any]) -> None:
+    INDEX_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = INDEX_STATE_PATH.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(state), encoding="utf-8")
+    os.replace(tmp, INDEX_STATE_PATH)
+
+
+def _csr_row_to_sparse(X, row: int) -> SparseVector:
+    """CSR 행의 indices/data를 그대로 Qdrant SparseVector로 (dense 변환 없음)"""
+    lo, hi = X.indptr[row], X.indptr[row + 1]
+    return SparseVector(
+        indices=X.indices[lo:hi].tolist(),
+        values=X.data[lo:hi].tolist(),
     )
 
+
+# payload 인덱스를 확인/생성한 컬렉션
+_payload_indexed: set = set()
+
+
+def _ensure_payload_indexes(collection: str) -> None:
+    """
+    PAYLOAD_INDEXES 필드 인덱스 생성 (이미 있으면 Qdrant가 그대로 둠).
+    새 컬렉션은 생성 직후, 이전에 만들어진 컬렉션은 alias 전환(롤백 포함)/증분 인덱싱 때 한 번.
+    검색 경로(search_page)에서는 부르지 않음.
+    """
+    if collection in _payload_indexed:
+        return
+    for field, schema in PAYLOAD_INDEXES.items():
+        client.create_payload_index(
+            collection_name=collection, field_name=field, field_schema=schema, wait=True
+        )
+    _payload_indexed.add(collection)
+
+
+# 컬렉션별 sparse 여부 캐시. 인덱스 버전(스탬프)별로 두어서 다른 워커가 재구축해도
+# 스탬프가 바뀌는 순간 모든 워커가 다시 확인함 (news_tfidf처럼 이름이 같은 컬렉션 대비)
+_collection_layout_cache: Dict[str, Any] = {"version": None, "layout": {}}
+_layout_lock = threading.Lock()
+
+
+def _is_sparse_collection(collection: str) -> bool:
+    """
+    컬렉션이 named sparse vector 구조인지 확인.
+    재구축 전의 dense 컬렉션에도 쿼리가 깨지지 않도록 마이그레이션 기간 동안 사용.
+    """
+    stamp = _current_stamp()
+    version = str(stamp["version"]) if stamp else None
+    with _layout_lock:
+        if _collection_layout_cache["version"] != version:
+            _collection_layout_cache["version"] = version
+            _collection_layout_cache["layout"] = {}
+        cached = _collection_layout_cache["layout"].get(collection)
+    if cached is not None:
+        return cached
+    try:
+        info = client.get_collection(collection_name=collection)
+        sparse = bool((info.config.params.sparse_vectors or {}).get(SPARSE_VECTOR_NAME))
+    except Exception as e:
+        logger.warning("[vector_store] 컬렉션 정보 조회 실패(%s), sparse로 가정: %s", collection, e)
+        return True
+    with _layout_lock:
+        if _collection_layout_cache["version"] == version:
+            _collection_layout_cache["layout"][collection] = sparse
+    return sparse
+
+
+def _collection_for(version: int) -> str:
+    return f"{COLLECTION}_v{version}"
+
+
+def _vectorizer_path_for(version: int) -> Path:
+    return VECTORIZER_PATH.with_name(f"{VECTORIZER_PATH.stem}_v{version}.pkl")
+
+
+def _existing_index_versions() -> List[int]:
+    pat = re.compile(rf"^{re.escape(COLLECTION)}_v(\d+)$")
+    versions = []
+    for c in client.get_collections().collections:
+        m = pat.match(c.name)
+        if m:
+            versions.append(int(m.group(1)))
+    return sorted(versions)
+
+
+def _int_version(v: Any) -> int:
+    """스탬프 버전 → 정수 (blue/green 이전의 'mtime:...' 버전은 0)"""
+    return v if isinstance(v, int) else 0
+
+
+def _next_index_version() -> int:
+    stamp = _current_stamp() or {}
+    return max(_existing_index_versions() + [_int_version(stamp.get("version"))]) + 1
+
+
+def _save_vectorizer(tfidf: StreamingTfidfVectorizer, version: int) -> Path:
+    """
+    버전별 pickle을 임시 파일에 쓴 뒤 rename.
+    활성화(스탬프 갱신)는 alias 전환과 함께 _activate_index_version에서.
+    """
+    path = _vectorizer_path_for(version)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".pkl.tmp")
+    joblib.dump(tfidf, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _write_stamp(stamp: Dict[str, Any]) -> None:
+    VECTORIZER_VERSION_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_stamp = VECTORIZER_VERSION_PATH.with_suffix(".version.tmp")
+    tmp_stamp.write_text(json.dumps(stamp), encoding="utf-8")
+    os.replace(tmp_stamp, VECTORIZER_VERSION_PATH)
+
+
+def _switch_alias(target: str) -> None:
+    """alias(news_tfidf)를 target 컬렉션으로 원자적으로 전환"""
     try:
-        count_res = client.count(collection_name=COLLECTION, exact=True)
-        logger.info(
-            "[vector_store] Qdrant 컬렉션 %s 현재 포인트 개수: %d",
-            COLLECTION,
-            count_res.count,
+        # 롤백 대상처럼 payload 인덱스 도입 전에 만든 컬렉션도 검색 전에 인덱스를 갖추게
+        _ensure_payload_indexes(target)
+    except Exception as e:
+        # 인덱스 생성 실패로 전환까지 막지 않음 (검색이 느려질 뿐, 다음 증분 인덱싱 때 다시 시도)
+        logger.warning("[vector_store] payload 인덱스 확인 실패(%s): %s", target, e)
+    ops: List[Any] = []
+    aliases = {a.alias_name for a in client.get_aliases().aliases}
+    if COLLECTION in aliases:
+        ops.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=COLLECTION)))
+    elif client.collection_exists(collection_name=COLLECTION):
+        # blue/green 도입 전 실제 컬렉션 이름이 news_tfidf 인 경우 (1회성 마이그레이션)
+        logger.warning("[vector_store] 기존 실컬렉션 %s 삭제 후 alias로 전환", COLLECTION)
+        client.delete_collection(collection_name=COLLECTION)
+    ops.append(
+        CreateAliasOperation(
+            create_alias=CreateAlias(collection_name=target, alias_name=COLLECTION)
         )
+    )
+    client.update_collection_aliases(change_aliases_operations=ops)
+
+
+def _activate_index_version(version: int, *, high_water: Optional[str]) -> None:
+    """
+    새 버전 활성화: alias 전환 → 스탬프 교체(프로세스 내 vectorizer/컬렉션 쌍 전환)
+    → 직전 버전은 롤백용으로 남기고 그 이전 버전 정리.
+    """
+    prev = _current_stamp()
+    target = _collection_for(version)
+    _switch_alias(target)
+
+    prev_entry = None
+    if prev and _int_version(prev.get("version")):
+        prev_entry = {k: prev.get(k) for k in ("version", "collection", "path", "high_water")}
+    _write_stamp(
+        {
+            "version": version,
+            "collection": target,
+            "path": str(_vectorizer_path_for(version)),
+            "high_water": high_water,
+            "previous": prev_entry,
+        }
+    )
+    logger.info("[vector_store] 활성 인덱스 전환: %s (이전: %s)", target, (prev_entry or {}).get("collection"))
+
+    keep = {version, _int_version((prev_entry or {}).get("version"))}
+    for v in _existing_index_versions():
+        if v not in keep:
+            _drop_index_version(v)
+
+
+def _drop_index_version(version: int) -> None:
+    try:
+        client.delete_collection(collection_name=_collection_for(version))
     except Exception as e:
-        logger.warning("[vector_store] Qdrant 포인트 개수 조회 실패: %s", e)
+        logger.warning("[vector_store] 컬렉션 삭제 실패 (v%d): %s", version, e)
+    _vectorizer_path_for(version).unlink(missing_ok=True)
 
-    return {"indexed": indexed}
 
+def rollback_tfidf_index() -> Dict[str, Any]:
+    """
+    직전 버전으로 alias/스탬프를 되돌림.
+    증분 인덱싱이 그 사이 변경분을 다시 따라잡도록 high-water mark도 직전 버전 기준으로 복원.
+    """
+    stamp = _current_stamp()
+    prev = (stamp or {}).get("previous")
+    if not prev or not client.collection_exists(collection_name=prev["collection"]):
+        return {"ok": False, "reason": "no_previous_version"}
 
-def load_vectorizer() -> TfidfVectorizer:
-    if not VECTORIZER_PATH.exists():
+    _switch_alias(prev["collection"])
+    _write_stamp({**prev, "previous": None})
+
+    state = load_index_state() or {}
+    state["high_water"] = prev.get("high_water")
+    _save_index_state(state)
+    logger.info("[vector_store] 인덱스 롤백: %s → %s", stamp.get("collection"), prev["collection"])
+    return {"ok": True, "collection": prev["collection"], "version": prev.get("version")}
+
+
+def load_vectorizer(path: Optional[Path] = None) -> Vectorizer:
+    path = Path(path) if path else VECTORIZER_PATH
+    if not path.exists():
         raise RuntimeError(
             "TF-IDF vectorizer not found. "
             "먼저 train_vectorizer_and_index_all()을 실행해서 벡터라이저를 학습/저장하세요."
         )
-    return joblib.load(VECTORIZER_PATH)
+    return joblib.load(path)
+
+
+# -------------------- 프로세스 공용 vectorizer 홀더 --------------------
+# (version, vectorizer, collection) 튜플을 통째로 교체하므로
+# 읽는 쪽은 락 없이 참조만 가져가면 되고, vectorizer와 컬렉션이 항상 같은 버전으로 짝지어짐
+_vec_current: Optional[Tuple[Optional[str], Vectorizer, str]] = None
+_vec_load_lock = threading.Lock()
+_stamp_cache: Dict[str, Any] = {"mtime_ns": None, "stamp": None}
+
+VECTORIZER_STATS: Dict[str, Any] = {
+    "reloads": 0,
+    "version": None,
+    "collection": None,
+    "loaded_at": None,
+    "last_load_sec": None,
+    "total_load_sec": 0.0,
+    "errors": 0,
+    "query_by_point": 0,
+    "query_by_text": 0,
+}
+
+
+def _current_stamp() -> Optional[Dict[str, Any]]:
+    """
+    활성 버전 스탬프. 파일 mtime이 바뀐 경우에만 다시 읽음.
+    스탬프가 없으면(blue/green 이전 산출물) 단일 pickle + news_tfidf를 사용.
+    """
+    try:
+        st = VECTORIZER_VERSION_PATH.stat()
+    except FileNotFoundError:
+        try:
+            mtime = VECTORIZER_PATH.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        return {"version": f"mtime:{mtime}", "collection": COLLECTION, "path": str(VECTORIZER_PATH)}
+
+    if _stamp_cache["mtime_ns"] != st.st_mtime_ns:
+        try:
+            _stamp_cache["stamp"] = json.loads(VECTORIZER_VERSION_PATH.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning("[vector_store] 버전 스탬프 읽기 실패: %s", e)
+            return _stamp_cache["stamp"]
+        _stamp_cache["mtime_ns"] = st.st_mtime_ns
+    return _stamp_cache["stamp"]
 
 
-def _opposite_lean_values(base: Optional[str]) -> List[str]:
-    if base == "progressive":
-        return ["conservative"]
-    if base == "conservative":
-        return ["progressive"]
-    if base == "centrist":
-        return ["progressive", "conservative"]
-    return []
+def active_collection() -> str:
+    stamp = _current_stamp()
+    return (stamp or {}).get("collection") or COLLECTION
 
 
-def search_similar_with_lean_fallback(
-    query_text: str,
-    *,
+def get_active_index() -> Tuple[Vectorizer, str]:
+    """
+    프로세스 내에서 한 번만 로드한 (vectorizer, collection) 쌍 반환.
+    - 버전 스탬프가 바뀌면 한 스레드만 새로 로드해서 원자적으로 교체
+    - 로드 중에는 다른 스레드는 기존 쌍을 그대로 사용 (최초 로드만 대기)
+    """
+    global _vec_current
+
+    stamp = _current_stamp()
+    version = str(stamp["version"]) if stamp else None
+    current = _vec_current
+    if current is not None and (current[0] == version or version is None):
+        return current[1], current[2]
+
+    if not _vec_load_lock.acquire(blocking=current is None):
+        return current[1], current[2]
+    try:
+        current = _vec_current
+        if current is not None and current[0] == version:
+            return current[1], current[2]
+
+        t0 = time.perf_counter()
+        try:
+            tfidf = load_vectorizer((stamp or {}).get("path"))
+        except Exception:
+            VECTORIZER_STATS["errors"] += 1
+            if current is not None:
+                logger.exception("[vector_store] vectorizer 리로드 실패, 기존 버전 유지")
+                return current[1], current[2]
+            raise
+        elapsed = time.perf_counter() - t0
+
+        collection = (stamp or {}).get("collection") or COLLECTION
+        _vec_current = (version, tfidf, collection)
+        VECTORIZER_STATS["reloads"] += 1
+        VECTORIZER_STATS["version"] = version
+        VECTORIZER_STATS["collection"] = collection
+        VECTORIZER_STATS["loaded_at"] = time.time()
+        VECTORIZER_STATS["last_load_sec"] = round(elapsed, 4)
+        VECTORIZER_STATS["total_load_sec"] = round(VECTORIZER_STATS["total_load_sec"] + elapsed, 4)
+        logger.info("[vector_store] vectorizer 로드: version=%s, collection=%s (%.2f초)", version, collection, elapsed)
+        return tfidf, collection
+    finally:
+        _vec_load_lock.release()
+
+
+def get_vectorizer() -> Vectorizer:
+    return get_active_index()[0]
+
+
+def vectorizer_stats() -> Dict[str, Any]:
+    return dict(VECTORIZER_STATS)
+
+
+def query_vector_for_point(news_id: int) -> Optional[Tuple[str, Optional[str], Any]]:
+    """
+    이미 인덱싱된 기사의 저장 벡터 → (컬렉션, using, 쿼리 벡터).
+    포인트 id = news.id 이고 벡터는 _doc_for_vector(제목 2번 + 본문 앞 400자)라
+    같은 텍스트를 다시 transform한 것과 같음 → vectorizer 로드/transform 없이 id 조회 한 번.
+    아직 인덱싱 전이거나 벡터가 비어 있으면 None (호출 측에서 query_vector_for_text로).
+    """
+    collection = active_collection()
+    sparse = _is_sparse_collection(collection)
+    using = SPARSE_VECTOR_NAME if sparse else None
+    try:
+        recs = client.retrieve(
+            collection_name=collection,
+            ids=[int(news_id)],
+            with_payload=False,
+            with_vectors=[SPARSE_VECTOR_NAME] if sparse else True,
+        )
+    except Exception as e:
+        logger.warning("[vector_store] 포인트 벡터 조회 실패(%s, id=%s): %s", collection, news_id, e)
+        return None
+    if not recs:
+        return None
+    vec = recs[0].vector
+    if isinstance(vec, dict):
+        vec = vec.get(SPARSE_VECTOR_NAME) if sparse else None
+    if vec is None:
+        return None
+    VECTORIZER_STATS["query_by_point"] += 1
+    return collection, using, vec
+
+
+def query_vector_for_text(query_text: str) -> Tuple[str, Optional[str], Any]:
+    """활성 vectorizer로 쿼리 텍스트 변환 → (컬렉션, using, 쿼리 벡터)"""
+    tfidf, collection = get_active_index()
+    VECTORIZER_STATS["query_by_text"] += 1
+    q_csr = tfidf.transform([query_text])
+    if _is_sparse_collection(collection):
+        return collection, SPARSE_VECTOR_NAME, _csr_row_to_sparse(q_csr, 0)
+    # 아직 재구축 전인 dense 컬렉션
+    return collection, None, q_csr.toarray()[0].tolist()
+
+
+def opposite_lean_filter(
     base_lean: Optional[str],
     base_date,
     hours_window: int,
-    top_k: int = 50,
-):
-    tfidf = load_vectorizer()
-    q_vec = tfidf.transform([query_text]).toarray()[0].tolist()
-
+    exclude_id: Optional[int] = None,
+) -> Optional[Filter]:
+    """
+    기간(date_ts) + 반대 성향(lean) 필터. 둘 다 must 조건이라 Qdrant가 payload 인덱스로 걸러냄.
+    base_lean을 모르면 성향 조건 없이 기간만.
+    exclude_id: 기준 기사 포인트 (저장 벡터로 검색하면 자기 자신이 유사도 1위라 제외)
+    """
     must_conditions: List[FieldCondition] = []
 
     if base_date is not None:
@@ -286,34 +987,36 @@ def search_similar_with_lean_fallback(
             )
         )
 
-    opp_leans = _opposite_lean_values(base_lean)
+    opp_leans = opposite_lean_values(base_lean)
     if opp_leans:
-        lean_conds = [
-            FieldCondition(key="lean", match=MatchValue(value=val))
-            for val in opp_leans
-        ]
-        flt_opp = Filter(
-            must=must_conditions,
-            should=lean_conds,
-        )
+        must_conditions.append(FieldCondition(key="lean", match=MatchAny(any=opp_leans)))
 
-        res = client.query_points(
-            collection_name=COLLECTION,
-            query=q_vec,
-            query_filter=flt_opp,
-            limit=top_k,
-            with_payload=True,
-        )
-        hits = res.points
-        if hits:
-            return hits
-
-    flt_all = Filter(must=must_conditions) if must_conditions else None
-    res_all = client.query_points(
-        collection_name=COLLECTION,
-        query=q_vec,
-        query_filter=flt_all,
-        limit=top_k,
-        with_payload=True,
+    must_not = [HasIdCondition(has_id=[int(exclude_id)])] if exclude_id is not None else None
+    if not must_conditions and not must_not:
+        return None
+    return Filter(must=must_conditions or None, must_not=must_not)
+
+
+def search_page(
+    collection: str,
+    using: Optional[str],
+    query: Any,
+    query_filter: Optional[Filter],
+    *,
+    limit: int,
+    offset: int = 0,
+):
+    """
+    유사도 내림차순 한 페이지 (offset부터 limit개).
+    payload 인덱스는 재구축/alias 전환/증분 인덱싱 때 만들어 두므로 여기서는 확인하지 않음 (검색당 왕복 없음)
+    """
+    res = client.query_points(
+        collection_name=collection,
+        query=query,
+        using=using,
+        query_filter=query_filter,
+        limit=limit,
+        offset=offset or None,
+        with_payload=PAYLOAD_FIELDS,
     )
-    return res_all.points
+    return res.points
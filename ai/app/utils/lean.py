@@ -0,0 +1,109 @@
+# app/utils/lean.py
+"""
+언론사 정치 성향(lean) 판정.
+
+- news.lean 값이 있으면 그대로, 없으면 출처 이름(없으면 링크 호스트)으로 LEAN_MAP에서 추정
+- 인덱싱(vector_store 포인트 payload)과 추천(recommend_core)이 같은 규칙을 쓰도록 한 곳에 둠
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+from urllib.parse import urlparse
+
+LEAN_MAP = {
+    # 진보
+    "오마이뉴스": "progressive",
+    "한겨레": "progressive",
+    "프레시안": "progressive",
+    "경향신문": "progressive",
+    "JTBC": "progressive",
+    # 보수
+    "조선일보": "conservative",
+    "동아일보": "conservative",
+    "매일경제": "conservative",
+    "국민일보": "conservative",
+    "시사저널": "conservative",
+    # 중도
+    "뉴시스": "centrist",
+    "서울신문": "centrist",
+    "SBS": "centrist",
+    "연합뉴스TV": "centrist",
+}
+
+
+def infer_source_name(source: str | None, link: str | None) -> str | None:
+    if source and source.strip():
+        return source.strip()
+
+    if not link:
+        return None
+
+    try:
+        host = (urlparse(link).hostname or "").lower()
+    except Exception:
+        return None
+
+    if host.startswith("www."):
+        host = host[4:]
+
+    if "yonhapnewstv.co.kr" in host:
+        return "연합뉴스"
+    if "ohmynews.com" in host:
+        return "오마이뉴스"
+    if "chosun.com" in host:
+        return "조선일보"
+    if "jtbc.co.kr" in host:
+        return "JTBC"
+    if "sbs.co.kr" in host:
+        return "SBS"
+    if "mk.co.kr" in host:
+        return "매일경제"
+    if "hani.co.kr" in host:
+        return "한겨레"
+    if "pressian.com" in host:
+        return "프레시안"
+    if "sisajournal.com" in host:
+        return "시사저널"
+    if "seoul.co.kr" in host:
+        return "서울신문"
+    if "donga.com" in host:
+        return "동아일보"
+    if "newsis.com" in host:
+        return "뉴시스"
+    if "kmib.co.kr" in host:
+        return "국민일보"
+    if "khan.co.kr" in host:
+        return "경향신문"
+
+    return None
+
+
+def infer_lean(source: str | None, link: str | None, db_lean: str | None) -> str | None:
+    if db_lean:
+        return db_lean
+
+    src_name = infer_source_name(source, link)
+    if src_name and src_name in LEAN_MAP:
+        return LEAN_MAP[src_name]
+
+    return None
+
+
+def is_opposite_lean(base: str, cand: str) -> bool:
+    if base == "progressive" and cand == "conservative":
+        return True
+    if base == "conservative" and cand == "progressive":
+        return True
+    if base == "centrist" and cand in ("progressive", "conservative"):
+        return True
+    return False
+
+
+def opposite_lean_values(base: Optional[str]) -> List[str]:
+    if base == "progressive":
+        return ["conservative"]
+    if base == "conservative":
+        return ["progressive"]
+    if base == "centrist":
+        return ["progressive", "conservative"]
+    return []
@@ -0,0 +1,129 @@
+# app/utils/pagination.py
+"""
+keyset(커서) 페이지네이션 공용 헬퍼.
+
+정렬: phase 순서 → date DESC (NULLS LAST) → id DESC
+- phase: 정렬 맨 앞에 오는 그룹 조건 (예: 추천 준비된 기사 먼저). 없으면 [""] 하나
+- date가 NULL일 수 있으면 phase마다 "date 있음" → "date 없음" 두 구간으로 나눔
+- 구간마다 (date, id) < (커서) 범위 조건 + ORDER BY ... LIMIT 이므로
+  (date DESC NULLS LAST, id DESC) 인덱스를 그대로 타고, 몇 번째 페이지든 비용이 같음
+- 커서(after)는 마지막 행의 (구간, date, id)를 base64로 감싼 불투명 토큰
+"""
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+
+
+def encode_cursor(scope: str, part: int, date: Optional[datetime], id_: int) -> str:
+    raw = json.dumps(
+        {"s": scope, "p": part, "d": date.isoformat() if date else None, "i": int(id_)},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(scope: str, token: str) -> Tuple[int, Optional[datetime], int]:
+    """잘못된 토큰이면 400"""
+    try:
+        pad = "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(token + pad))
+        if data.get("s") != scope:
+            raise ValueError("scope mismatch")
+        d = datetime.fromisoformat(data["d"]) if data.get("d") else None
+        return int(data["p"]), d, int(data["i"])
+    except Exception:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+
+
+def cursor_after(scope: str, date: Optional[datetime], id_: int, *,
+                 phase: int = 0, date_nullable: bool = True) -> str:
+    """행 하나 다음부터 이어지는 커서 (offset 페이지에서 커서 페이지로 넘어갈 때도 사용)"""
+    if date_nullable:
+        part = phase * 2 + (1 if date is None else 0)
+    else:
+        part = phase
+    return encode_cursor(scope, part, date, id_)
+
+
+def fetch_keyset_page(
+    cur,
+    *,
+    scope: str,
+    select_sql: str,
+    where: Sequence[str],
+    params: Sequence[Any],
+    key: Callable[[tuple], Tuple[Optional[datetime], int]],
+    limit: int,
+    after: Optional[str] = None,
+    phases: Optional[Sequence[Tuple[str, Sequence[Any]]]] = None,
+    date_expr: str = "date",
+    id_expr: str = "id",
+    date_nullable: bool = True,
+) -> Tuple[List[tuple], Optional[str]]:
+    """
+    select_sql: "SELECT ... FROM ..." (WHERE/ORDER/LIMIT 제외)
+    where: 모든 구간에 공통으로 붙는 조건
+    params: select_sql 안의 placeholder → where 순서의 파라미터
+    key: 결과 행 → (date, id)
+    phases: [(조건 SQL, 파라미터), ...] 정렬 우선 그룹 순서
+    반환: (행 목록, 다음 페이지 커서 또는 None)
+    """
+    phase_list = list(phases) if phases else [("", ())]
+    parts: List[Tuple[str, Sequence[Any], bool]] = []
+    for cond, cond_params in phase_list:
+        parts.append((cond, cond_params, True))
+        if date_nullable:
+            parts.append((cond, cond_params, False))
+
+    start_part, after_date, after_id = (0, None, None)
+    if after:
+        start_part, after_date, after_id = decode_cursor(scope, after)
+        if not 0 <= start_part < len(parts):
+            raise HTTPException(status_code=400, detail="invalid cursor")
+
+    rows: List[tuple] = []
+    last_phase = start_part // 2 if date_nullable else start_part
+    for part_idx in range(start_part, len(parts)):
+        remaining = limit - len(rows)
+        if remaining <= 0:
+            break
+        cond, cond_params, has_date = parts[part_idx]
+        clauses = list(where)
+        args: List[Any] = list(params)
+        if cond:
+            clauses.append(cond)
+            args.extend(cond_params)
+
+        if has_date:
+            if date_nullable:
+                clauses.append(f"{date_expr} IS NOT NULL")
+            if after and part_idx == start_part:
+                clauses.append(f"({date_expr}, {id_expr}) < (%s, %s)")
+                args.extend([after_date, after_id])
+            # 인덱스 정렬 방향과 같게 (nullable이면 date DESC NULLS LAST 인덱스)
+            nulls = " NULLS LAST" if date_nullable else ""
+            order = f"{date_expr} DESC{nulls}, {id_expr} DESC"
+        else:
+            clauses.append(f"{date_expr} IS NULL")
+            if after and part_idx == start_part:
+                clauses.append(f"{id_expr} < %s")
+                args.append(after_id)
+            order = f"{id_expr} DESC"
+
+        where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        cur.execute(f"{select_sql} {where_sql} ORDER BY {order} LIMIT %s", args + [remaining])
+        got = cur.fetchall()
+        if got:
+            rows.extend(got)
+            last_phase = part_idx // 2 if date_nullable else part_idx
+
+    next_cursor = None
+    if rows and len(rows) >= limit:
+        d, i = key(rows[-1])
+        next_cursor = cursor_after(scope, d, i, phase=last_phase, date_nullable=date_nullable)
+    return rows, next_cursor
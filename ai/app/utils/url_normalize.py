@@ -1,8 +1,22 @@
-import html, re
+import html, logging, os, re, threading, time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
 import httpx
+import psycopg2
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, urlunparse, urljoin, parse_qsl, urlencode
 
+from app.db.pool import get_conn
+
+logger = logging.getLogger(__name__)
+
+# 네이버 클릭 URL → 원문 URL 메모이즈 (프로세스 LRU + link_alias 테이블)
+ALIAS_CACHE_MAX = int(os.getenv("LINK_ALIAS_CACHE_MAX", "20000"))
+ALIAS_TTL_SEC = float(os.getenv("LINK_ALIAS_TTL_HOURS", "720")) * 3600
+# 원문 링크를 못 찾은 결과(일시 장애일 수 있음)는 짧게
+ALIAS_NEG_TTL_SEC = float(os.getenv("LINK_ALIAS_NEG_TTL_SEC", "600"))
+
 _TRACKING_KEYS = {
     "gclid","fbclid","ncid","ref","ref_src","referrer","spm",
     "utm_source","utm_medium","utm_campaign","utm_term","utm_content"
@@ -27,13 +41,24 @@ def normalize_variant_urls(u: str) -> str:
     path = _AMP_PATH_RE.sub("/", pu.path)
     return urlunparse(pu._replace(netloc=host, path=path))
 
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+def _client() -> httpx.Client:
+    """원문 조회용 공유 클라이언트 (요청마다 새로 만들지 않고 커넥션 재사용)"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(follow_redirects=True, timeout=10.0,
+                                            headers={"User-Agent": "VeritasBot/0.1"})
+    return _http_client
+
 def _resolve_naver_origin(u: str) -> str | None:
     """네이버 기사에서 '기사 원문' 링크를 추출해 절대경로로 반환."""
     try:
-        with httpx.Client(follow_redirects=True, timeout=10.0,
-                          headers={"User-Agent": "VeritasBot/0.1"}) as c:
-            r = c.get(u)
-            r.raise_for_status()
+        r = _client().get(u)
+        r.raise_for_status()
         soup = BeautifulSoup(r.text, "html.parser")
         a = soup.select_one(
             "a.media_end_head_origin_link, a.media_end_link, a[aria-label='기사 원문']"
@@ -45,12 +70,146 @@ def _resolve_naver_origin(u: str) -> str | None:
         pass
     return None
 
+# ---------------- 원문 URL 메모이즈 ----------------
+_ALIAS_STAT_KEYS = ("memory_hits", "db_hits", "fetches", "coalesced", "negative", "db_errors")
+_alias_stats: Dict[str, int] = {k: 0 for k in _ALIAS_STAT_KEYS}
+_alias_lru: "OrderedDict[str, Tuple[float, Optional[str]]]" = OrderedDict()
+_alias_lock = threading.Lock()
+# 같은 URL 동시 조회 합치기: url → 먼저 온 요청이 끝나면 set 되는 Event
+_inflight: Dict[str, threading.Event] = {}
+
+def alias_stats() -> Dict[str, int]:
+    with _alias_lock:
+        return {**_alias_stats, "size": len(_alias_lru)}
+
+def _alias_get(u: str):
+    """(found, origin). origin None = 원문 없음(negative) 캐시"""
+    now = time.monotonic()
+    ent = _alias_lru.get(u)
+    if ent is None:
+        return False, None
+    expires, origin = ent
+    if expires < now:
+        del _alias_lru[u]
+        return False, None
+    _alias_lru.move_to_end(u)
+    return True, origin
+
+def _alias_put(u: str, origin: Optional[str], ttl: float):
+    _alias_lru[u] = (time.monotonic() + ttl, origin)
+    _alias_lru.move_to_end(u)
+    while len(_alias_lru) > ALIAS_CACHE_MAX:
+        _alias_lru.popitem(last=False)
+
+def _alias_db_get(u: str):
+    """link_alias 조회 → (found, origin, 남은 TTL 초)"""
+    conn = get_conn(); cur = conn.cursor()
+    try:
+        cur.execute(
+            """
+            SELECT canonical_link, EXTRACT(EPOCH FROM (NOW() - checked_at))
+            FROM link_alias WHERE clicked_link = %s
+            """,
+            (u,),
+        )
+        row = cur.fetchone()
+    finally:
+        conn.rollback()
+        cur.close(); conn.close()
+    if not row:
+        return False, None, 0.0
+    origin, age = row[0], float(row[1] or 0.0)
+    ttl = (ALIAS_TTL_SEC if origin else ALIAS_NEG_TTL_SEC) - age
+    if ttl <= 0:
+        return False, None, 0.0
+    return True, origin, ttl
+
+def _alias_db_put(u: str, origin: Optional[str]):
+    conn = get_conn(); cur = conn.cursor()
+    try:
+        cur.execute(
+            """
+            INSERT INTO link_alias (clicked_link, canonical_link, checked_at)
+            VALUES (%s, %s, NOW())
+            ON CONFLICT (clicked_link) DO UPDATE SET
+              canonical_link = EXCLUDED.canonical_link,
+              checked_at = NOW()
+            """,
+            (u, origin),
+        )
+        conn.commit()
+    except psycopg2.Error:
+        conn.rollback()
+        raise
+    finally:
+        cur.close(); conn.close()
+
+def _load_origin(u: str) -> Tuple[Optional[str], float]:
+    """link_alias → 없으면 네이버 페이지 조회. 반환 (origin, L1 TTL)"""
+    try:
+        found, origin, ttl = _alias_db_get(u)
+        if found:
+            with _alias_lock:
+                _alias_stats["db_hits"] += 1
+            return origin, ttl
+    except psycopg2.Error as e:
+        # 테이블/DB 문제로 정규화가 막히면 안 됨 → 직접 조회로 진행
+        with _alias_lock:
+            _alias_stats["db_errors"] += 1
+        logger.warning("[url_normalize] link_alias 조회 실패: %s", e)
+
+    origin = _resolve_naver_origin(u)
+    with _alias_lock:
+        _alias_stats["fetches"] += 1
+        if origin is None:
+            _alias_stats["negative"] += 1
+    try:
+        _alias_db_put(u, origin)
+    except psycopg2.Error as e:
+        with _alias_lock:
+            _alias_stats["db_errors"] += 1
+        logger.warning("[url_normalize] link_alias 저장 실패: %s", e)
+    return origin, (ALIAS_TTL_SEC if origin else ALIAS_NEG_TTL_SEC)
+
+def resolve_naver_origin_cached(u: str) -> str | None:
+    """
+    _resolve_naver_origin 메모이즈 버전.
+    프로세스 LRU → link_alias 테이블 → 네이버 조회 순서, 같은 URL 동시 요청은 한 번만 조회.
+    """
+    while True:
+        with _alias_lock:
+            found, origin = _alias_get(u)
+            if found:
+                _alias_stats["memory_hits"] += 1
+                return origin
+            ev = _inflight.get(u)
+            if ev is None:
+                ev = _inflight[u] = threading.Event()
+                leader = True
+            else:
+                _alias_stats["coalesced"] += 1
+                leader = False
+        if not leader:
+            # 먼저 온 요청 결과를 기다렸다가 LRU에서 다시 읽음 (그쪽이 실패했으면 직접 조회)
+            ev.wait(timeout=15.0)
+            continue
+
+        origin, ttl = None, ALIAS_NEG_TTL_SEC
+        try:
+            origin, ttl = _load_origin(u)
+            return origin
+        finally:
+            with _alias_lock:
+                _alias_put(u, origin, ttl)
+                _inflight.pop(u, None)
+            ev.set()
+
 def normalize_clicked(u: str) -> str:
-    """클릭 URL을 정리(+네이버면 원문으로 치환)."""
+    """클릭 URL을 정리(+네이버면 원문으로 치환, 결과는 메모이즈)."""
     u = normalize_variant_urls(strip_tracking_params(u))
     host = urlparse(u).netloc
     if host.endswith("news.naver.com") or host.endswith("n.news.naver.com"):
-        orig = _resolve_naver_origin(u)
+        orig = resolve_naver_origin_cached(u)
         if orig:
             return orig
     return u
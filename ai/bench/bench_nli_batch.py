@@ -0,0 +1,80 @@
+"""
+후보 80건 cold-miss NLI 지연 비교 (pair 단위 vs 배치).
+
+실행: cd ai && python -m bench.bench_nli_batch [--n 80] [--batch-size 16] [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+
+import torch
+import torch.nn.functional as F
+
+from app.model import model as nli
+
+_WORDS = (
+    "국회 정부 여당 야당 대통령 예산 법안 개정 표결 본회의 위원회 특검 "
+    "의혹 수사 검찰 발표 반대 찬성 합의 협상 정책 지지율 선거 후보 논란"
+).split()
+
+
+def _fake_text(rng: random.Random, n_words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(n_words)) + "."
+
+
+@torch.no_grad()
+def _legacy_nli_infer(premise: str, hypothesis: str):
+    """배치 도입 전 방식: pair마다 두 번 토크나이즈 + 단건 forward"""
+    tok, mdl = nli._tokenizer, nli._model
+    max_pos = getattr(mdl.config, "max_position_embeddings", 512)
+    enc = tok(premise, hypothesis, add_special_tokens=True,
+              truncation="longest_first", max_length=max_pos - 3)
+    _ = len(enc["input_ids"])
+    inputs = tok(premise, hypothesis, return_tensors="pt",
+                 truncation="longest_first", max_length=min(max_pos - 3, 510))
+    probs = F.softmax(mdl(**inputs).logits, dim=-1).cpu().tolist()[0]
+    return nli._LABELS[int(probs.index(max(probs)))], probs
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=80)
+    ap.add_argument("--batch-size", type=int, default=nli.NLI_BATCH_SIZE)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    nli.load_model()
+    premise = _fake_text(rng, 120)
+    hyps = [_fake_text(rng, rng.randint(40, 160)) for _ in range(args.n)]
+
+    # warm-up
+    nli.nli_infer_batch(premise, hyps[:2])
+
+    before, after = [], []
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        legacy = [_legacy_nli_infer(premise, h) for h in hyps]
+        before.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        batched = nli.nli_infer_batch(premise, hyps, batch_size=args.batch_size)
+        after.append(time.perf_counter() - t0)
+
+    max_diff = max(
+        abs(a - b)
+        for (_, pa), (_, pb) in zip(legacy, batched)
+        for a, b in zip(pa, pb)
+    )
+    b_med, a_med = statistics.median(before), statistics.median(after)
+    print(f"candidates={args.n} batch_size={args.batch_size} repeat={args.repeat}")
+    print(f"before (pair 단위): median {b_med:.3f}s")
+    print(f"after  (배치)     : median {a_med:.3f}s  (x{b_med / a_med:.1f})")
+    print(f"max |prob diff|   : {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
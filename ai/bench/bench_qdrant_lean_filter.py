@@ -0,0 +1,173 @@
+"""
+후보 검색 비교: 기존(top_k=80 고정 + 반대 성향 결과가 없으면 무필터 재검색) vs
+현재(lean/date_ts payload 인덱스 + must 필터 + 적응형 top_k 페이지).
+
+합성 sparse 포인트를 임시 컬렉션(bench_lean_filter)에 넣고, 같은 쿼리들로
+요청당 검색 호출 수 / 받아온 포인트 수 / 응답 payload 바이트(JSON 직렬화 기준) /
+같은 성향이라 버려진 후보 수 / 검색 지연을 비교한다.
+점수 계산은 결정적 가짜 NLI로 _extend_prefix를 그대로 사용 (모델 불필요).
+
+- 성향 분포: progressive 35%, conservative 35%, centrist 20%, 없음 10%
+- --local: Qdrant 서버 대신 프로세스 내부 메모리 모드 (지연 수치는 참고용)
+
+실행: cd ai && QDRANT_HOST=localhost python -m bench.bench_qdrant_lean_filter [--points 50000] [--queries 200] [--local]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timezone
+
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import (
+    FieldCondition,
+    Filter,
+    MatchValue,
+    PointStruct,
+    SparseVector,
+    SparseVectorParams,
+)
+
+from app.services import recommend_core as rc
+from app.services import vector_store as vs
+from app.utils.lean import is_opposite_lean, opposite_lean_values
+from bench.bench_reco_early_stop import _fake_infer
+
+COLLECTION = "bench_lean_filter"
+_DIM = 3000
+_LEANS = ["progressive"] * 35 + ["conservative"] * 35 + ["centrist"] * 20 + [None] * 10
+_T0 = 1735689600  # 2025-01-01
+
+
+def _sparse(rng: random.Random) -> SparseVector:
+    idx = sorted(rng.sample(range(_DIM), rng.randint(30, 80)))
+    return SparseVector(indices=idx, values=[rng.random() for _ in idx])
+
+
+def _seed(n: int, rng: random.Random):
+    if vs.client.collection_exists(collection_name=COLLECTION):
+        vs.client.delete_collection(collection_name=COLLECTION)
+    vs.client.create_collection(
+        collection_name=COLLECTION,
+        vectors_config={},
+        sparse_vectors_config={vs.SPARSE_VECTOR_NAME: SparseVectorParams()},
+    )
+    vs._payload_indexed.discard(COLLECTION)
+    vs._ensure_payload_indexes(COLLECTION)
+    batch = []
+    for i in range(n):
+        batch.append(PointStruct(
+            id=i,
+            vector={vs.SPARSE_VECTOR_NAME: _sparse(rng)},
+            payload={
+                "id": i,
+                "title": f"제목 {i}",
+                "content": "본문 요약 " * 60,
+                "link": f"https://example.com/a/{i}",
+                "source": "src",
+                "lean": rng.choice(_LEANS),
+                "date_ts": _T0 + rng.randint(0, 30 * 86400),
+                "date": None,
+            },
+        ))
+        if len(batch) == 1000:
+            vs.client.upsert(collection_name=COLLECTION, points=batch, wait=True)
+            batch = []
+    if batch:
+        vs.client.upsert(collection_name=COLLECTION, points=batch, wait=True)
+
+
+def _bytes(points) -> int:
+    return sum(len(json.dumps({"id": p.id, "score": p.score, "payload": p.payload},
+                              ensure_ascii=False).encode()) for p in points)
+
+
+def _legacy_search(q, base_lean, ts):
+    """변경 전 search_similar_with_lean_fallback과 같은 호출"""
+    must = [FieldCondition(key="date_ts", range=vs.Range(gte=ts - 48 * 3600, lte=ts + 48 * 3600))]
+    calls, pts = 0, []
+    opp = opposite_lean_values(base_lean)
+    if opp:
+        flt = Filter(must=must, should=[FieldCondition(key="lean", match=MatchValue(value=v)) for v in opp])
+        pts = vs.client.query_points(collection_name=COLLECTION, query=q, using=vs.SPARSE_VECTOR_NAME,
+                                     query_filter=flt, limit=80, with_payload=True).points
+        calls += 1
+    if not pts:
+        pts = vs.client.query_points(collection_name=COLLECTION, query=q, using=vs.SPARSE_VECTOR_NAME,
+                                     query_filter=Filter(must=must), limit=80, with_payload=True).points
+        calls += 1
+    return pts, calls
+
+
+def _to_cands(page, base_lean):
+    out = []
+    for h in page:
+        lean = (h.payload or {}).get("lean")
+        if base_lean and lean and not is_opposite_lean(base_lean, lean):
+            continue
+        out.append((h, h.payload, lean, f"가설 {h.id}"))
+    return out
+
+
+def _paged_cands(page, offset, base_lean):
+    """_extend_prefix용: (검색 offset, 후보). 같은 성향으로 버린 후보도 offset은 차지함"""
+    kept = {c[0].id: c for c in _to_cands(page, base_lean)}
+    return [(offset + i, kept[h.id]) for i, h in enumerate(page) if h.id in kept]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--points", type=int, default=50000)
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--topk", type=int, default=8)
+    ap.add_argument("--local", action="store_true")
+    args = ap.parse_args()
+
+    if args.local:
+        vs.client = QdrantClient(":memory:")
+    rng = random.Random(0)
+    t0 = time.time()
+    _seed(args.points, rng)
+    print(f"seed points={args.points} ({time.time() - t0:.1f}s)")
+
+    res = {k: {"calls": [], "points": [], "bytes": [], "wasted": [], "ms": []} for k in ("before", "after")}
+    for _ in range(args.queries):
+        q = _sparse(rng)
+        base_lean = rng.choice(["progressive", "conservative", "centrist"])
+        ts = _T0 + rng.randint(0, 30 * 86400)
+
+        t = time.perf_counter()
+        pts, calls = _legacy_search(q, base_lean, ts)
+        ms = (time.perf_counter() - t) * 1000
+        r = res["before"]
+        r["calls"].append(calls); r["points"].append(len(pts)); r["bytes"].append(_bytes(pts))
+        r["wasted"].append(len(pts) - len(_to_cands(pts, base_lean))); r["ms"].append(ms)
+
+        flt = vs.opposite_lean_filter(base_lean, datetime.fromtimestamp(ts, tz=timezone.utc), 48)
+        got = []
+
+        def fetch(limit, offset):
+            page = vs.search_page(COLLECTION, vs.SPARSE_VECTOR_NAME, q, flt, limit=limit, offset=offset)
+            got.extend(page)
+            return page
+
+        t = time.perf_counter()
+        _, st = rc._extend_prefix(fetch, lambda p, offset: _paged_cands(p, offset, base_lean),
+                                  "전제", args.topk, 0.1, infer=_fake_infer)
+        ms = (time.perf_counter() - t) * 1000
+        r = res["after"]
+        r["calls"].append(st["search_calls"]); r["points"].append(st["fetched"]); r["bytes"].append(_bytes(got))
+        r["wasted"].append(len(got) - len(_to_cands(got, base_lean))); r["ms"].append(ms)
+
+    for k, r in res.items():
+        print(f"{k:6s} calls/req {statistics.mean(r['calls']):4.2f}  points/req {statistics.mean(r['points']):6.1f}"
+              f"  bytes/req {statistics.mean(r['bytes']):9.0f}  wasted/req {statistics.mean(r['wasted']):5.1f}"
+              f"  p50 {statistics.median(r['ms']):7.2f} ms")
+    vs.client.delete_collection(collection_name=COLLECTION)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Qdrant payload 크기 비교: 기존 payload(title/content/date 포함) vs 슬림 payload(PAYLOAD_FIELDS).
+
+같은 sparse 벡터로 두 임시 컬렉션(bench_payload_full / bench_payload_slim)을 만들고
+80건 쿼리 응답 바이트와 지연을 비교한다. 슬림 쪽은 표시용 필드를 news에서 읽는
+WHERE id = ANY(%s) 한 번이 더 붙으므로 --pg 를 주면 그 시간도 더한다.
+
+- 서버 모드: REST 응답 본문 바이트를 그대로 잼 (QDRANT_HOST/QDRANT_PORT)
+- --local: 프로세스 내부 메모리 모드, 바이트는 JSON 직렬화 기준 (지연은 참고용)
+- 저장 크기: 포인트 payload JSON 바이트 합
+
+실행: cd ai && QDRANT_HOST=localhost python -m bench.bench_qdrant_payload [--points 20000] [--queries 200] [--pg] [--local]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+
+import httpx
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import PointStruct, SparseVector, SparseVectorParams
+
+from app.services import vector_store as vs
+
+FULL, SLIM = "bench_payload_full", "bench_payload_slim"
+_DIM = 3000
+_T0 = 1735689600  # 2025-01-01
+
+
+def _sparse(rng: random.Random) -> SparseVector:
+    idx = sorted(rng.sample(range(_DIM), rng.randint(30, 80)))
+    return SparseVector(indices=idx, values=[rng.random() for _ in idx])
+
+
+def _payloads(i: int, rng: random.Random):
+    ts = _T0 + rng.randint(0, 30 * 86400)
+    slim = {"id": i, "link": f"https://example.com/a/{i}", "source": "한겨레",
+            "lean": rng.choice(["progressive", "conservative", "centrist"]), "date_ts": ts}
+    full = dict(slim, title=f"기사 제목 {i} " * 3,
+                content="요약 문장입니다. " * rng.randint(20, 60),
+                date="2025-01-01T00:00:00+00:00")
+    return full, slim
+
+
+def _seed(n: int, rng: random.Random) -> dict:
+    for c in (FULL, SLIM):
+        if vs.client.collection_exists(collection_name=c):
+            vs.client.delete_collection(collection_name=c)
+        vs.client.create_collection(collection_name=c, vectors_config={},
+                                    sparse_vectors_config={vs.SPARSE_VECTOR_NAME: SparseVectorParams()})
+    stored = {FULL: 0, SLIM: 0}
+    fb, sb = [], []
+    for i in range(n):
+        vec = {vs.SPARSE_VECTOR_NAME: _sparse(rng)}
+        full, slim = _payloads(i, rng)
+        stored[FULL] += len(json.dumps(full, ensure_ascii=False).encode())
+        stored[SLIM] += len(json.dumps(slim, ensure_ascii=False).encode())
+        fb.append(PointStruct(id=i, vector=vec, payload=full))
+        sb.append(PointStruct(id=i, vector=vec, payload=slim))
+        if len(fb) == 1000 or i == n - 1:
+            vs.client.upsert(collection_name=FULL, points=fb, wait=True)
+            vs.client.upsert(collection_name=SLIM, points=sb, wait=True)
+            fb, sb = [], []
+    return stored
+
+
+def _query_rest(http: httpx.Client, collection: str, q: SparseVector, with_payload):
+    body = {"query": {"indices": q.indices, "values": q.values}, "using": vs.SPARSE_VECTOR_NAME,
+            "limit": 80, "with_payload": with_payload}
+    r = http.post(f"/collections/{collection}/points/query", json=body)
+    r.raise_for_status()
+    return [p["id"] for p in r.json()["result"]["points"]], len(r.content)
+
+
+def _query_local(collection: str, q: SparseVector, with_payload):
+    pts = vs.client.query_points(collection_name=collection, query=q, using=vs.SPARSE_VECTOR_NAME,
+                                 limit=80, with_payload=with_payload).points
+    size = sum(len(json.dumps({"id": p.id, "score": p.score, "payload": p.payload},
+                              ensure_ascii=False).encode()) for p in pts)
+    return [p.id for p in pts], size
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--points", type=int, default=20000)
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--pg", action="store_true", help="슬림 쪽에 news id = ANY 조회 시간 포함")
+    ap.add_argument("--local", action="store_true")
+    args = ap.parse_args()
+
+    if args.local:
+        vs.client = QdrantClient(":memory:")
+    rng = random.Random(0)
+    stored = _seed(args.points, rng)
+
+    http = None if args.local else httpx.Client(base_url=f"http://{vs.QDRANT_HOST}:{vs.QDRANT_PORT}")
+
+    def query(collection, q, with_payload):
+        if http is None:
+            return _query_local(collection, q, with_payload)
+        return _query_rest(http, collection, q, with_payload)
+
+    cur = conn = None
+    if args.pg:
+        from app.db.pool import get_conn
+        from app.services.recommend_core import _load_candidate_rows
+
+        conn = get_conn()
+        cur = conn.cursor()
+
+    res = {"before": {"bytes": [], "ms": []}, "after": {"bytes": [], "ms": []}}
+    try:
+        for _ in range(args.queries):
+            q = _sparse(rng)
+            t = time.perf_counter()
+            _, size = query(FULL, q, True)
+            res["before"]["ms"].append((time.perf_counter() - t) * 1000)
+            res["before"]["bytes"].append(size)
+
+            t = time.perf_counter()
+            ids, size = query(SLIM, q, vs.PAYLOAD_FIELDS)
+            if cur is not None:
+                _load_candidate_rows(cur, ids)
+            res["after"]["ms"].append((time.perf_counter() - t) * 1000)
+            res["after"]["bytes"].append(size)
+    finally:
+        if cur is not None:
+            cur.close()
+            conn.close()
+        for c in (FULL, SLIM):
+            vs.client.delete_collection(collection_name=c)
+
+    print(f"points={args.points} stored payload: full {stored[FULL] / 1e6:.1f} MB, slim {stored[SLIM] / 1e6:.1f} MB")
+    for k, r in res.items():
+        print(f"{k:6s} response {statistics.mean(r['bytes']):9.0f} B/query   "
+              f"p50 {statistics.median(r['ms']):7.2f} ms   p95 {sorted(r['ms'])[int(len(r['ms']) * 0.95) - 1]:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+추천 후보 캐시 계층별 조회 지연: memory(L1) / redis / pg(article_reco_candidates).
+
+같은 후보 목록(SEARCH_MAX_K건 크기)을 각 계층에 넣어 두고 reco_store.get_cache 경로로
+반복 조회해 p50/p99를 잰다. 조합(topk/threshold)별 선택은 bench_reco_variants 참고.
+- memory: L1 hit
+- redis: L1을 비운 상태에서 redis hit (REDIS_URL이 없으면 프로세스 내부 가짜 redis)
+- pg: --pg 를 주면 L1/redis를 끈 상태에서 article_reco_candidates PK 조회 (실제 DB 필요)
+
+실행: cd ai && python -m bench.bench_reco_cache [--repeat 20000] [--pg]
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from datetime import datetime, timezone
+
+from app.services import reco_cache, reco_store
+
+LINK = "https://example.com/bench/reco-cache"
+HOURS_WINDOW = 48
+
+
+class _FakeRedis:
+    """redis.Redis의 get/setex만 흉내 내는 로컬 가짜 (TTL은 무시)"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, k):
+        return self.data.get(k)
+
+    def setex(self, k, ttl, v):
+        self.data[k] = v.encode("utf-8") if isinstance(v, str) else v
+
+
+def _candidates():
+    item = dict(
+        title="벤치 기사 제목 " * 3,
+        link="https://example.com/a/1",
+        source="한겨레",
+        lean="progressive",
+        date="2025-01-01T00:00:00",
+        probs={"entailment": 0.1, "neutral": 0.2, "contradiction": 0.7},
+        stance=0.6,
+        sim=0.5,
+        score=0.42,
+    )
+    return [dict(item) for _ in range(80)]
+
+
+def _measure(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    samples.sort()
+    return {
+        "p50_us": round(statistics.median(samples) * 1e6, 1),
+        "p99_us": round(samples[int(len(samples) * 0.99) - 1] * 1e6, 1),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=20000)
+    ap.add_argument("--pg", action="store_true", help="article_reco_candidates(L2) 조회도 측정 (DB 필요)")
+    args = ap.parse_args()
+
+    if not reco_cache.REDIS_URL:
+        reco_cache.set_redis_client(_FakeRedis())
+    row = (_candidates(), LINK, datetime.now(timezone.utc), None, 0)
+    reco_cache.store([LINK], HOURS_WINDOW, row)
+
+    res = {"memory": _measure(lambda: reco_store.get_cache(LINK, HOURS_WINDOW), args.repeat)}
+
+    def redis_only():
+        reco_cache.clear_memory()
+        reco_store.get_cache(LINK, HOURS_WINDOW)
+
+    res["redis"] = _measure(redis_only, max(1, args.repeat // 10))
+
+    if args.pg:
+        reco_store.upsert_cache(LINK, HOURS_WINDOW, normalized_link=LINK, candidates=row[0])
+        reco_cache.set_redis_client(None)
+
+        def pg_only():
+            reco_cache.clear_memory()
+            reco_store.get_cache(LINK, HOURS_WINDOW)
+
+        res["pg"] = _measure(pg_only, max(1, args.repeat // 100))
+
+    for tier, r in res.items():
+        print(f"{tier:7s} p50 {r['p50_us']:9.1f} us   p99 {r['p99_us']:9.1f} us")
+    print("tier_stats:", reco_cache.tier_stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+조기 종료(best-first) 점수 계산 차등 검사 + NLI/검색 절감량.
+
+같은 후보/같은 NLI 결과로
+- 전체 추론: EARLY_STOP=False로 _extend_prefix (후보 전체 SEARCH_MAX_K개를 한 번에 검색/추론)
+- 조기 종료 + 페이지 검색: EARLY_STOP=True로 _extend_prefix (SEARCH_FIRST_K개부터 필요할 때만 더 받아옴)
+을 돌려 select_recommendations 결과가 완전히 같은지 확인하고, 요청당 건너뛴 NLI 수와
+받아온 후보 수를 집계한다. (캐시된 prefix를 다른 조합에 재사용하는 쪽은 bench_reco_variants)
+불일치가 있으면 종료 코드 1.
+
+- 기본: 가설 문자열로 확률이 정해지는 결정적 가짜 NLI (pair 단위로 같은 값 → 배치 구성과 무관)
+- --model: 실제 NLI 모델 (합성 문장, 느림)
+  실제 모델은 배치 padding 구성에 따라 확률 끝자리가 달라질 수 있어 동점 근처에서만 차이가 날 수 있음
+
+실행: cd ai && python -m bench.bench_reco_early_stop [--trials 2000] [--n 80] [--model]
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import random
+import statistics
+import sys
+from types import SimpleNamespace
+
+from app.services import recommend_core as rc
+
+_WORDS = (
+    "국회 정부 여당 야당 대통령 예산 법안 개정 표결 본회의 위원회 특검 "
+    "의혹 수사 검찰 발표 반대 찬성 합의 협상 정책 지지율 선거 후보 논란"
+).split()
+
+
+def _fake_infer(premise, hyps):
+    out = []
+    for h in hyps:
+        d = hashlib.blake2b(f"{premise}|{h}".encode(), digest_size=6).digest()
+        e, n, c = d[0] + 1, d[1] + 1, d[2] * 3 + 1
+        t = float(e + n + c)
+        out.append(("x", [e / t, n / t, c / t]))
+    return out
+
+
+def _cands(rng: random.Random, n: int):
+    sims = sorted((rng.random() ** 2 for _ in range(n)), reverse=True)
+    # 동점 유사도도 일부 섞음
+    for i in range(1, n):
+        if rng.random() < 0.05:
+            sims[i] = sims[i - 1]
+    out = []
+    for i, sim in enumerate(sims):
+        hyp = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(8, 30)))
+        info = {"link": f"https://example.com/a/{i}", "title": f"t{i}", "source": "s", "date": None}
+        out.append((SimpleNamespace(id=i, score=sim), info, "conservative", hyp))
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--trials", type=int, default=2000)
+    ap.add_argument("--n", type=int, default=80)
+    ap.add_argument("--model", action="store_true", help="실제 NLI 모델 사용")
+    args = ap.parse_args()
+
+    infer = _fake_infer
+    if args.model:
+        from app.model.model import load_model, nli_infer_batch
+
+        load_model()
+        infer = nli_infer_batch
+        args.trials = min(args.trials, 50)
+
+    rc.SEARCH_MAX_K = max(rc.SEARCH_MAX_K, args.n)
+    rng = random.Random(0)
+    mismatches = 0
+    skipped, fetched, in_page = [], [], []
+    for _ in range(args.trials):
+        cands = _cands(rng, rng.randint(0, args.n))
+        topk = rng.randint(1, 20)
+        threshold = rng.choice([0.0, 0.1, 0.15, 0.3, 0.6, 1.0])
+        premise = " ".join(rng.choice(_WORDS) for _ in range(40))
+
+        hits = [c[0] for c in cands]
+
+        def run(early_stop):
+            rc.EARLY_STOP = early_stop
+            prefix, st = rc._extend_prefix(
+                lambda limit, offset: hits[offset:offset + limit],
+                lambda page, offset: [(offset + i, cands[h.id]) for i, h in enumerate(page)],
+                premise, topk, threshold, infer=infer,
+            )
+            return rc.select_recommendations(prefix["candidates"], topk, threshold), st
+
+        full, st_full = run(False)
+        fast, st = run(True)
+        if full != fast:
+            mismatches += 1
+        skipped.append(st_full["nli_calls"] - st["nli_calls"])
+        fetched.append(st["fetched"])
+        in_page.append(st["nli_skipped"])
+
+    print(f"trials={args.trials} mismatches={mismatches}")
+    print(f"NLI skipped per request: mean {statistics.mean(skipped):.1f}  "
+          f"median {statistics.median(skipped):.0f}  max {max(skipped)}")
+    print(f"NLI skipped inside a page (nli_skipped): mean {statistics.mean(in_page):.1f}")
+    print(f"candidates fetched per request: mean {statistics.mean(fetched):.1f} "
+          f"(exhaustive: up to {rc.SEARCH_MAX_K})")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
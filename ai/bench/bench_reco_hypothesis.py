@@ -0,0 +1,94 @@
+"""
+추천 1회당 NLI 가설 문장 준비 시간: 후보마다 TextRank 요약(before) vs 저장된 summary 재사용(after).
+
+before: 후보 payload의 content(= COALESCE(summary, content))를 summarize_text로 다시 요약
+after : hypothesis_text(summary, title) — 요약 없음, 문자열 자르기만
+--pg 를 주면 after에 실제 DB에서 후보 summary를 한 번에 읽는 _load_candidate_rows 시간도 포함
+(최근 기사 id를 --n개 골라 사용).
+
+실행: cd ai && python -m bench.bench_reco_hypothesis [--n 80] [--repeat 20] [--pg]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+
+from app.services.recommend_core import _load_candidate_rows, hypothesis_text, summarize_text
+
+_WORDS = (
+    "국회 정부 여당 야당 대통령 예산 법안 개정 표결 본회의 위원회 특검 "
+    "의혹 수사 검찰 발표 반대 찬성 합의 협상 정책 지지율 선거 후보 논란"
+).split()
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(8, 20))) + "."
+
+
+def _candidates(rng: random.Random, n: int):
+    out = []
+    for i in range(n):
+        summary = " ".join(_sentence(rng) for _ in range(3))
+        content = " ".join(_sentence(rng) for _ in range(rng.randint(15, 40)))
+        # 요약 작업 전 기사 10%
+        has_summary = rng.random() >= 0.1
+        out.append({
+            "id": i,
+            "title": _sentence(rng),
+            "summary": summary if has_summary else None,
+            "content": summary if has_summary else content,  # 기존 payload content
+        })
+    return out
+
+
+def _median_ms(fn, repeat: int) -> float:
+    fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=80)
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--pg", action="store_true")
+    args = ap.parse_args()
+
+    cands = _candidates(random.Random(0), args.n)
+
+    def before():
+        return [summarize_text(c["content"] or c["title"], ratio=0.2, hard_cap=600) or c["title"]
+                for c in cands]
+
+    def after():
+        return [hypothesis_text(c["summary"], c["title"]) for c in cands]
+
+    b_ms = _median_ms(before, args.repeat)
+    a_ms = _median_ms(after, args.repeat)
+    print(f"candidates={args.n}")
+    print(f"  before (summarize_text x{args.n})  {b_ms:9.3f} ms / request")
+    print(f"  after  (stored summary)         {a_ms:9.3f} ms / request")
+
+    if args.pg:
+        from app.db.pool import get_conn
+
+        conn = get_conn()
+        cur = conn.cursor()
+        try:
+            cur.execute("SELECT id FROM news ORDER BY id DESC LIMIT %s", (args.n,))
+            ids = [r[0] for r in cur.fetchall()]
+            q_ms = _median_ms(lambda: _load_candidate_rows(cur, ids), args.repeat)
+        finally:
+            cur.close()
+            conn.close()
+        print(f"  after  + DB read (id = ANY)     {a_ms + q_ms:9.3f} ms / request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+기준 기사 쿼리 벡터 준비 시간: 텍스트 재변환(before) vs 저장된 포인트 벡터 id 조회(after).
+
+before: query_vector_for_text — 활성 vectorizer 로드(프로세스 첫 요청만) + transform
+after : query_vector_for_point — Qdrant retrieve(id) 한 번, vectorizer 불필요
+최근 기사 --n개로 각각 측정하고, 두 벡터로 검색한 상위 --topk 결과 id가 같은지도 확인
+(기사 본문이 마지막 인덱싱 이후 바뀌었으면 다를 수 있음).
+
+실행: cd ai && python -m bench.bench_reco_query_vector [--n 50] [--topk 24]
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from app.db.pool import get_conn
+from app.services import vector_store as vs
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=50)
+    ap.add_argument("--topk", type=int, default=24)
+    args = ap.parse_args()
+
+    conn = get_conn()
+    cur = conn.cursor()
+    try:
+        cur.execute(
+            "SELECT id, title, COALESCE(summary, content, '') FROM news ORDER BY id DESC LIMIT %s",
+            (args.n,),
+        )
+        rows = cur.fetchall()
+    finally:
+        cur.close()
+        conn.close()
+
+    t0 = time.perf_counter()
+    vs.get_active_index()
+    print(f"vectorizer first load      {(time.perf_counter() - t0) * 1000:9.1f} ms (프로세스당 1회)")
+
+    text_ms, point_ms, missing, same = [], [], 0, 0
+    for news_id, title, text in rows:
+        t = time.perf_counter()
+        by_text = vs.query_vector_for_text(vs._doc_for_vector(title, text))
+        text_ms.append((time.perf_counter() - t) * 1000)
+
+        t = time.perf_counter()
+        by_point = vs.query_vector_for_point(news_id)
+        point_ms.append((time.perf_counter() - t) * 1000)
+        if by_point is None:
+            missing += 1
+            continue
+
+        a = [p.id for p in vs.search_page(*by_text, None, limit=args.topk)]
+        b = [p.id for p in vs.search_page(*by_point, None, limit=args.topk)]
+        same += a == b
+
+    print(f"articles={len(rows)}  not indexed={missing}  same top-{args.topk}={same}/{len(rows) - missing}")
+    print(f"  before (transform)        p50 {statistics.median(text_ms):7.3f} ms")
+    print(f"  after  (retrieve by id)   p50 {statistics.median(point_ms):7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+후보 prefix 캐시 → topk/threshold 조합별 결과 차등 검사 + NLI 절감량.
+
+같은 후보/같은 NLI 결과로
+- 기존: 조합(topk_return, stance_threshold)마다 후보 전체 NLI + strong/weak 선택 (아래 _reference)
+- 현재: 기사당 prefix 하나를 JSON 왕복(캐시 저장 형식)으로 들고 있다가 조합마다
+  is_settled면 select_recommendations, 아니면 _extend_prefix로 이어서 늘린 뒤 선택
+을 돌려 추천 목록이 완전히 같은지 확인한다. 불일치가 있으면 종료 코드 1.
+여러 프론트엔드가 섞어 보내는 조합으로 기사당 NLI 추론 수(기존: 조합 수 × 후보 수,
+현재: prefix 길이)와 prefix 연장 횟수, 조합 하나를 메모리에서 고르는 시간도 출력.
+
+- 기본: 가설 문자열로 확률이 정해지는 결정적 가짜 NLI (pair 단위로 같은 값 → 배치 구성과 무관)
+- --model: 실제 NLI 모델 (합성 문장, 느림)
+
+실행: cd ai && python -m bench.bench_reco_variants [--trials 500] [--n 80] [--model]
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+from app.services import recommend_core as rc
+
+_WORDS = (
+    "국회 정부 여당 야당 대통령 예산 법안 개정 표결 본회의 위원회 특검 "
+    "의혹 수사 검찰 발표 반대 찬성 합의 협상 정책 지지율 선거 후보 논란"
+).split()
+_THRESHOLDS = [0.0, 0.05, 0.1, 0.15, 0.2, 0.3, 0.5, 0.6, 1.0]
+
+
+def _fake_infer(premise, hyps):
+    out = []
+    for h in hyps:
+        d = hashlib.blake2b(f"{premise}|{h}".encode(), digest_size=6).digest()
+        e, n, c = d[0] + 1, d[1] + 1, d[2] * 3 + 1
+        t = float(e + n + c)
+        out.append(("x", [e / t, n / t, c / t]))
+    return out
+
+
+def _cands(rng: random.Random, n: int):
+    sims = sorted((rng.random() ** 2 for _ in range(n)), reverse=True)
+    # 동점 유사도도 일부 섞음
+    for i in range(1, n):
+        if rng.random() < 0.05:
+            sims[i] = sims[i - 1]
+    out = []
+    for i, sim in enumerate(sims):
+        hyp = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(8, 30)))
+        info = {"link": f"https://example.com/a/{i}?utm_source=x", "title": f"t{i}",
+                "source": "s", "date": None}
+        out.append((SimpleNamespace(id=i, score=sim), info, "conservative", hyp))
+    return out
+
+
+def _reference(premise, cands, topk, threshold, infer):
+    """변경 전: 조합마다 후보 전체를 추론하고 threshold로 strong/weak를 나눠 점수순 선택"""
+    cands = sorted(cands, key=lambda c: float(c[0].score or 0.0), reverse=True)
+    strong, weak = [], []
+    for (h, info, lean, _), (_, probs) in zip(cands, infer(premise, [c[3] for c in cands])):
+        e, n, c = float(probs[0]), float(probs[1]), float(probs[2])
+        stance = c - e
+        stance_norm = max(0.0, min(1.0, (stance + 1.0) / 2.0))
+        item = dict(
+            title=info["title"],
+            link=rc.normalize_variant_urls(rc.strip_tracking_params(info["link"] or "")),
+            source=info["source"],
+            lean=lean,
+            date=info["date"],
+            probs={"entailment": e, "neutral": n, "contradiction": c},
+            stance=stance,
+            score=float(h.score or 0.0) * (0.8 + 0.2 * stance_norm),
+        )
+        (strong if abs(stance) >= threshold else weak).append(item)
+    strong.sort(key=lambda x: x["score"], reverse=True)
+    weak.sort(key=lambda x: x["score"], reverse=True)
+    merged = strong[:topk]
+    merged.extend(weak[:topk - len(merged)])
+    return merged
+
+
+def _serve(premise, cands, combos, infer):
+    """기사 하나: 조합 순서대로 prefix 캐시에서 응답. 반환: ([(조합, 결과)], NLI 추론 수, 연장 횟수, 선택 시간 us)"""
+    hits = [c[0] for c in cands]
+    by_id = {c[0].id: c for c in cands}
+
+    def fetch_page(limit, offset):
+        return hits[offset:offset + limit]
+
+    def to_cands(page, offset):
+        return [(offset + i, by_id[h.id]) for i, h in enumerate(page)]
+
+    stored, nli, extensions, out, derive_us = None, 0, 0, [], []
+    for topk, threshold in combos:
+        t0 = time.perf_counter()
+        settled = stored is not None and rc.is_settled(stored["candidates"], stored["next_bound"], topk, threshold)
+        if not settled:
+            prefix, st = rc._extend_prefix(fetch_page, to_cands, premise, topk, threshold,
+                                           prior=stored, infer=infer)
+            nli += st["nli_calls"]
+            extensions += stored is not None
+            stored = json.loads(json.dumps(prefix, ensure_ascii=False))
+            t0 = time.perf_counter()
+        got = rc.select_recommendations(stored["candidates"], topk, threshold)
+        derive_us.append((time.perf_counter() - t0) * 1e6)
+        out.append(((topk, threshold), got))
+    return out, nli, extensions, derive_us
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--trials", type=int, default=500)
+    ap.add_argument("--n", type=int, default=80)
+    ap.add_argument("--variants", type=int, default=12, help="기사당 요청 조합 수")
+    ap.add_argument("--model", action="store_true", help="실제 NLI 모델 사용")
+    args = ap.parse_args()
+
+    infer = _fake_infer
+    if args.model:
+        from app.model.model import load_model, nli_infer_batch
+
+        load_model()
+        infer = nli_infer_batch
+        args.trials = min(args.trials, 20)
+
+    rc.SEARCH_MAX_K = max(rc.SEARCH_MAX_K, args.n)
+    rng = random.Random(0)
+    mismatches = checked = 0
+    before_nli, full_nli, after_nli, exts, derive_us = [], [], [], [], []
+    for _ in range(args.trials):
+        cands = _cands(rng, rng.randint(0, args.n))
+        premise = " ".join(rng.choice(_WORDS) for _ in range(40))
+        # 첫 요청은 기본 조합(미리 계산), 이후는 프론트엔드들이 섞어 보내는 조합
+        combos = [(rc.DEFAULT_TOPK_RETURN, rc.DEFAULT_STANCE_THRESHOLD)]
+        combos += [(rng.randint(1, 20), rng.choice(_THRESHOLDS)) for _ in range(args.variants)]
+        before_nli.append(len(set(combos)) * len(cands))
+        full_nli.append(len(cands))
+
+        out, nli, ext, us = _serve(premise, cands, combos, infer)
+        after_nli.append(nli)
+        exts.append(ext)
+        derive_us.extend(us)
+        for (topk, threshold), got in out:
+            checked += 1
+            if got != _reference(premise, cands, topk, threshold, infer):
+                mismatches += 1
+
+    print(f"trials={args.trials} variants checked={checked} mismatches={mismatches}")
+    print(f"NLI per article: 조합마다 후보 전체 {statistics.mean(before_nli):.1f}  "
+          f"후보 전체 1회 {statistics.mean(full_nli):.1f}  "
+          f"prefix {statistics.mean(after_nli):.1f} (연장 {statistics.mean(exts):.2f}회/기사)")
+    print(f"확정된 조합 선택(is_settled + select): p50 {statistics.median(derive_us):.1f} us  "
+          f"max {max(derive_us):.1f} us")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+로컬 mock 피드 서버 대상 RSS 크롤 wall time 비교.
+
+- 피드마다 서로 다른 루프백 호스트(127.0.0.{k})를 써서 실제처럼 "언론사별 호스트"를 흉내냄
+- 모든 응답에 --latency 만큼 지연
+- legacy: 피드 1개씩, 호스트당 1요청, 기사마다 0.8초 간격 (기존 순차 크롤러와 같은 조건)
+- async : 기본 설정 (RSS_FEED_CONCURRENCY / RSS_PER_HOST_LIMIT / RSS_POLITE_DELAY)
+- warm  : async를 한 번 더 실행. 피드는 ETag 조건부 요청(304), 이미 본문이 있는 기사는 요청 생략
+- warm+new: 피드마다 --new 개의 새 기사가 올라온 뒤 재실행 (새 기사만 본문 요청)
+
+DB(news 저장, http_cache)는 메모리 dict로 대체해서 측정에서 제외한다.
+
+실행: cd ai && python -m bench.bench_rss_crawl [--feeds 14] [--entries 20] [--latency 0.15]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.api import rss_crawl
+
+_ARTICLE = "<html><head><title>t</title></head><body><article>" + (
+    "<p>국회는 오늘 본회의를 열고 예산안을 표결에 부쳤다. 여야는 막판까지 협상을 이어갔다.</p>" * 30
+) + "</article></body></html>"
+
+
+def _make_handler(entries: int, latency: float, state: dict):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            time.sleep(latency)
+            host = self.headers.get("Host", "")
+            if self.path.startswith("/feed"):
+                items = "".join(
+                    f"<item><title>기사 {i}</title><link>http://{host}/article/{i}</link>"
+                    f"<description>요약 {i}</description>"
+                    f"<pubDate>Mon, 06 Oct 2025 09:00:00 +0900</pubDate></item>"
+                    for i in range(state["shift"], state["shift"] + entries)
+                )
+                body = f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'
+                ctype = "application/rss+xml"
+            else:
+                body, ctype = _ARTICLE, "text/html; charset=utf-8"
+            data = body.encode("utf-8")
+            etag = '"' + hashlib.md5(data).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
+
+
+def _run(feeds, **kwargs) -> float:
+    t0 = time.perf_counter()
+    res = asyncio.run(rss_crawl.crawl_rss_async(feeds=feeds, **kwargs))
+    elapsed = time.perf_counter() - t0
+    errors = [s for s, st in res["by_source"].items() if "error" in st]
+    if errors:
+        print("errors:", {s: res["by_source"][s]["error"] for s in errors})
+    slowest = max(
+        (st["timing"]["total_sec"] for st in res["by_source"].values() if "timing" in st),
+        default=0.0,
+    )
+    t = res["total"]
+    print(f"  processed={t['processed']} slowest_source={slowest:.2f}s "
+          f"fetches={t['fetches']} bytes={t['bytes_fetched']} "
+          f"not_modified={t['not_modified']} fetches_saved={t['fetches_saved']} bytes_saved={t['bytes_saved']}")
+    return elapsed
+
+
+class _MemoryDB:
+    """news / http_cache 대용"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.http_cache = {}
+        self.news_links = set()
+
+    def install(self):
+        def store_rows(source, rows):
+            self.news_links.update(r["link"] for r in rows if r["content"])
+            return {"source": source, "processed": len(rows), "inserted": 0, "updated": len(rows),
+                    "samples": {"inserted": [], "updated": []}}
+
+        def load_feed_validators(urls):
+            return {u: dict(self.http_cache[u]) for u in urls if u in self.http_cache}
+
+        def lookup_known(raw_links):
+            known = {}
+            for u in raw_links:
+                info = dict(self.http_cache.get(u) or {})
+                cands = [x for x in (info.get("canonical_url"), u) if x]
+                stored = next((x for x in cands if x in self.news_links), None)
+                if info or stored:
+                    info["stored_link"] = stored
+                    known[u] = info
+            return known
+
+        def save_validators(validators):
+            for url, etag, lm, nbytes, canon in validators:
+                self.http_cache[url] = {"etag": etag, "last_modified": lm, "body_bytes": nbytes,
+                                        "canonical_url": canon, "checked_at": None}
+
+        rss_crawl._store_rows = store_rows
+        rss_crawl._load_feed_validators = load_feed_validators
+        rss_crawl._lookup_known_articles = lookup_known
+        rss_crawl._save_validators = save_validators
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--feeds", type=int, default=14)
+    ap.add_argument("--entries", type=int, default=20)
+    ap.add_argument("--latency", type=float, default=0.15)
+    ap.add_argument("--new", type=int, default=2)
+    ap.add_argument("--port", type=int, default=18765)
+    args = ap.parse_args()
+
+    state = {"shift": 0}
+    server = ThreadingHTTPServer(("0.0.0.0", args.port), _make_handler(args.entries, args.latency, state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # DB 저장은 제외하고 fetch/추출만 측정
+    db = _MemoryDB()
+    db.install()
+    feeds = {f"feed{k}": f"http://127.0.0.{k + 2}:{args.port}/feed" for k in range(args.feeds)}
+
+    try:
+        print("legacy (순차, 0.8s 간격):")
+        legacy = _run(feeds, feed_concurrency=1, per_host_limit=1, polite_delay=0.8)
+        print(f"  wall={legacy:.2f}s")
+
+        db.reset()
+        print("async (기본 설정):")
+        fast = _run(feeds)
+        print(f"  wall={fast:.2f}s  (x{legacy / fast:.1f})")
+
+        print("warm (재실행, 조건부 요청):")
+        warm = _run(feeds)
+        print(f"  wall={warm:.2f}s")
+
+        state["shift"] = args.new
+        print(f"warm+new (피드마다 새 기사 {args.new}개):")
+        warm_new = _run(feeds)
+        print(f"  wall={warm_new:.2f}s")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+dense vs sparse TF-IDF 컬렉션 비교: 인덱스 빌드 시간, RSS 메모리, 쿼리 지연.
+
+각 (mode, n) 조합은 별도 프로세스에서 실행해 RSS high-water를 분리해서 측정.
+bench_tfidf_* 임시 컬렉션을 만들고 끝나면 삭제한다.
+
+실행: cd ai && QDRANT_HOST=localhost python -m bench.bench_sparse_index [--sizes 50000 200000] [--modes sparse dense]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+_VOCAB_SIZE = 60000
+
+
+def _corpus(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    # zipf 비슷한 분포의 합성 토큰
+    weights = [1.0 / (i + 1) for i in range(_VOCAB_SIZE)]
+    vocab = [f"w{i}" for i in range(_VOCAB_SIZE)]
+    for _ in range(n):
+        yield " ".join(rng.choices(vocab, weights=weights, k=rng.randint(60, 140)))
+
+
+def _rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def _run_one(mode: str, n: int, batch_size: int, queries: int) -> dict:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from qdrant_client.http.models import PointStruct, SparseVectorParams, VectorParams, Distance
+
+    from app.services.vector_store import client, _csr_row_to_sparse, SPARSE_VECTOR_NAME
+
+    tfidf = TfidfVectorizer(min_df=3, max_df=0.9, ngram_range=(1, 2),
+                            max_features=20000, sublinear_tf=True)
+    X = tfidf.fit_transform(_corpus(n))
+    dim = X.shape[1]
+    rss_before = _rss_mb()
+
+    name = f"bench_tfidf_{mode}_{n}"
+    if mode == "sparse":
+        client.recreate_collection(
+            collection_name=name,
+            vectors_config={},
+            sparse_vectors_config={SPARSE_VECTOR_NAME: SparseVectorParams()},
+        )
+    else:
+        client.recreate_collection(
+            collection_name=name,
+            vectors_config=VectorParams(size=dim, distance=Distance.COSINE),
+        )
+
+    t0 = time.perf_counter()
+    for start in range(0, n, batch_size):
+        end = min(start + batch_size, n)
+        Xb = X[start:end]
+        if mode == "sparse":
+            points = [
+                PointStruct(id=start + i, vector={SPARSE_VECTOR_NAME: _csr_row_to_sparse(Xb, i)}, payload={})
+                for i in range(end - start)
+            ]
+        else:
+            dense = Xb.toarray().tolist()
+            points = [PointStruct(id=start + i, vector=dense[i], payload={}) for i in range(end - start)]
+        client.upsert(collection_name=name, points=points)
+    build_sec = time.perf_counter() - t0
+    rss_after = _rss_mb()
+
+    rng = random.Random(1)
+    lat = []
+    for _ in range(queries):
+        row = rng.randrange(n)
+        if mode == "sparse":
+            q, using = _csr_row_to_sparse(X, row), SPARSE_VECTOR_NAME
+        else:
+            q, using = X[row].toarray()[0].tolist(), None
+        t0 = time.perf_counter()
+        client.query_points(collection_name=name, query=q, using=using, limit=80, with_payload=False)
+        lat.append(time.perf_counter() - t0)
+
+    client.delete_collection(collection_name=name)
+    lat.sort()
+    return {
+        "mode": mode,
+        "n": n,
+        "dim": dim,
+        "build_sec": round(build_sec, 2),
+        "rss_build_delta_mb": round(rss_after - rss_before, 1),
+        "rss_peak_mb": round(rss_after, 1),
+        "query_p50_ms": round(statistics.median(lat) * 1000, 2),
+        "query_p95_ms": round(lat[int(len(lat) * 0.95) - 1] * 1000, 2),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[50000, 200000])
+    ap.add_argument("--modes", nargs="+", default=["sparse", "dense"])
+    ap.add_argument("--batch-size", type=int, default=1000)
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--child", nargs=2, metavar=("MODE", "N"))
+    args = ap.parse_args()
+
+    if args.child:
+        mode, n = args.child[0], int(args.child[1])
+        print(json.dumps(_run_one(mode, n, args.batch_size, args.queries)))
+        return
+
+    for n in args.sizes:
+        for mode in args.modes:
+            out = subprocess.run(
+                [sys.executable, "-m", "bench.bench_sparse_index",
+                 "--child", mode, str(n),
+                 "--batch-size", str(args.batch_size),
+                 "--queries", str(args.queries)],
+                capture_output=True, text=True,
+            )
+            if out.returncode != 0:
+                print(f"{mode} n={n}: FAILED\n{out.stderr[-2000:]}")
+                continue
+            print(out.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import gc
+
+import psycopg2.extensions
+import pytest
+
+from app.db.pool import ConnectionPool, PoolTimeout
+
+
+class _FakeConn:
+    """ConnectionPool이 쓰는 부분만 가진 연결 (close()는 PooledConnection처럼 풀 반납)"""
+
+    closed = 0
+    autocommit = False
+
+    def __init__(self):
+        self._pool = None
+        self._checked_out = False
+        self._reclaim = None
+
+    def get_transaction_status(self):
+        return psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        if self._checked_out:
+            self._pool._return(self)
+
+    def _disconnect(self):
+        pass
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    p = ConnectionPool({}, maxconn=1, timeout=0.1, ping_after=30)
+    monkeypatch.setattr(p, "_connect", _FakeConn)
+    return p
+
+
+def test_unclosed_connection_slot_is_reclaimed_on_gc(pool):
+    def leaky_handler():
+        pool.getconn()  # close() 없이 버려지는 연결
+        raise RuntimeError("query failed before conn.close()")
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            leaky_handler()
+        gc.collect()
+
+    conn = pool.getconn()
+    st = pool.stats()
+    assert st["leaked"] == 3
+    assert st["checked_out"] == 1
+    conn.close()
+
+
+def test_closed_connection_is_reused_not_counted_as_leak(pool):
+    first = pool.getconn()
+    first.close()
+    again = pool.getconn()
+    assert again is first
+    del first
+    with pytest.raises(PoolTimeout):
+        pool.getconn()
+
+    again.close()
+    del again
+    gc.collect()
+    st = pool.stats()
+    assert st["leaked"] == 0
+    assert st["checked_out"] == 0
+    assert st["idle"] == 1
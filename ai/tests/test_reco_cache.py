@@ -0,0 +1,46 @@
+"""reco_cache redis 계층: 깨진 값은 오류로 세고 캐시 미스로 내려가야 함"""
+import pytest
+
+from app.services import reco_cache
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, raw):
+        self.data[key] = raw
+
+
+@pytest.fixture
+def fake_redis():
+    client = _FakeRedis()
+    reco_cache.set_redis_client(client)
+    reco_cache.clear_memory()
+    yield client
+    reco_cache.set_redis_client(None)
+    reco_cache.clear_memory()
+
+
+def test_undecodable_redis_value_is_error_and_miss(fake_redis):
+    key = reco_cache.cache_key("https://n.news.naver.com/a/1", 48)
+    fake_redis.data[reco_cache._redis_key(key)] = b"\xff not json"
+    before = reco_cache.tier_stats()["redis"]
+
+    assert reco_cache.lookup(key) is None
+
+    after = reco_cache.tier_stats()["redis"]
+    assert after["errors"] == before["errors"] + 1
+    assert after["hits"] == before["hits"]
+
+
+def test_redis_roundtrip_hits(fake_redis):
+    link = "https://n.news.naver.com/a/2"
+    row = ([{"link": "x", "score": 0.5}], link, None, 0.42, 24)
+    reco_cache.store([link], 48, row)
+    reco_cache.clear_memory()
+
+    assert reco_cache.lookup(reco_cache.cache_key(link, 48)) == row
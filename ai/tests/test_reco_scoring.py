@@ -0,0 +1,121 @@
+"""recommend_core 후보 점수: early stop / prefix에서 고른 조합이 조합마다 후보 전체를 매긴 결과와 같은지"""
+import hashlib
+import json
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import recommend_core as rc
+
+PREMISE = "국회 예산 법안 표결 여당 야당 합의"
+COMBOS = [(k, th) for k in (1, 3, 8, 20) for th in (0.0, 0.1, 0.3, 0.6, 1.0)]
+
+
+def _fake_infer(premise, hyps):
+    """가설 문자열로 확률이 정해지는 결정적 NLI (배치 구성과 무관)"""
+    out = []
+    for h in hyps:
+        d = hashlib.blake2b(f"{premise}|{h}".encode(), digest_size=3).digest()
+        e, n, c = d[0] + 1, d[1] + 1, d[2] * 3 + 1
+        t = float(e + n + c)
+        out.append(("x", [e / t, n / t, c / t]))
+    return out
+
+
+def _cands(seed: int, n: int):
+    rng = random.Random(seed)
+    sims = sorted((rng.random() ** 2 for _ in range(n)), reverse=True)
+    for i in range(1, n):
+        if rng.random() < 0.1:
+            sims[i] = sims[i - 1]  # 동점 유사도
+    return [
+        (SimpleNamespace(id=i, score=sim),
+         {"link": f"https://example.com/a/{i}", "title": f"t{i}", "source": "s", "date": None},
+         "conservative", f"hyp {seed} {i} {rng.random()}")
+        for i, sim in enumerate(sims)
+    ]
+
+
+def _search(cands):
+    """검색 결과 페이지 흉내: (fetch_page, to_cands, 추론한 가설 수 목록)"""
+    hits = [c[0] for c in cands]
+    by_id = {c[0].id: c for c in cands}
+    inferred = []
+
+    def fetch_page(limit, offset):
+        return hits[offset:offset + limit]
+
+    def to_cands(page, offset):
+        return [(offset + i, by_id[h.id]) for i, h in enumerate(page)]
+
+    def infer(premise, hyps):
+        inferred.extend(hyps)
+        return _fake_infer(premise, hyps)
+
+    return fetch_page, to_cands, infer, inferred
+
+
+def _per_combination(cands, topk, threshold):
+    """변경 전 방식: 조합마다 후보 전체를 추론하고 strong/weak로 나눠 점수순 선택"""
+    items = [rc._score_item(c, r) for c, r in zip(cands, _fake_infer(PREMISE, [c[3] for c in cands]))]
+    strong = sorted((x for x in items if abs(x["stance"]) >= threshold), key=lambda x: x["score"], reverse=True)
+    weak = sorted((x for x in items if abs(x["stance"]) < threshold), key=lambda x: x["score"], reverse=True)
+    merged = strong[:topk]
+    merged.extend(weak[:topk - len(merged)])
+    return [{k: v for k, v in x.items() if k != "sim"} for x in merged]
+
+
+@pytest.fixture
+def paging(monkeypatch):
+    monkeypatch.setattr(rc, "SEARCH_FIRST_K", 8)
+    monkeypatch.setattr(rc, "SEARCH_MAX_K", 80)
+    monkeypatch.setattr(rc, "NLI_CHUNK", 4)
+    return monkeypatch
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_early_stop_matches_exhaustive(paging, seed):
+    cands = _cands(seed, random.Random(seed).randint(0, 60))
+    skipped = 0
+    for topk, th in COMBOS:
+        paging.setattr(rc, "EARLY_STOP", True)
+        fetch_page, to_cands, infer, inferred = _search(cands)
+        early, st = rc._extend_prefix(fetch_page, to_cands, PREMISE, topk, th, infer=infer)
+        skipped += st["nli_skipped"]
+        assert st["nli_calls"] == len(inferred) <= len(cands)
+
+        paging.setattr(rc, "EARLY_STOP", False)
+        fetch_page, to_cands, infer, _ = _search(cands)
+        full, _ = rc._extend_prefix(fetch_page, to_cands, PREMISE, topk, th, infer=infer)
+        assert full["next_bound"] is None
+
+        expected = _per_combination(cands, topk, th)
+        assert rc.select_recommendations(early["candidates"], topk, th) == expected
+        assert rc.select_recommendations(full["candidates"], topk, th) == expected
+    if len(cands) > 20:
+        assert skipped > 0
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_derived_variants_match_per_combination(paging, seed):
+    paging.setattr(rc, "EARLY_STOP", True)
+    cands = _cands(seed, random.Random(seed).randint(0, 60))
+    fetch_page, to_cands, infer, inferred = _search(cands)
+
+    # 미리 계산(기본 조합) 후 캐시(JSON 왕복)에 둔 prefix 하나로 여러 조합에 응답
+    stored, _ = rc._extend_prefix(fetch_page, to_cands, PREMISE,
+                                  rc.DEFAULT_TOPK_RETURN, rc.DEFAULT_STANCE_THRESHOLD, infer=infer)
+    stored = json.loads(json.dumps(stored))
+    rng = random.Random(seed)
+    for topk, th in rng.sample(COMBOS, len(COMBOS)):
+        if not rc.is_settled(stored["candidates"], stored["next_bound"], topk, th):
+            stored, _ = rc._extend_prefix(fetch_page, to_cands, PREMISE, topk, th, prior=stored, infer=infer)
+            stored = json.loads(json.dumps(stored))
+        assert rc.is_settled(stored["candidates"], stored["next_bound"], topk, th)
+        assert rc.select_recommendations(stored["candidates"], topk, th) == _per_combination(cands, topk, th)
+
+    # 연장해도 같은 후보를 다시 추론하거나 중복으로 넣지 않음
+    links = [c["link"] for c in stored["candidates"]]
+    assert len(links) == len(set(links))
+    assert len(inferred) <= len(cands)
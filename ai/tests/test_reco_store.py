@@ -0,0 +1,142 @@
+"""reco_store: 백그라운드 리프레시와 foreground 계산이 같은 single-flight / 슬롯 / advisory lock 순서를 타는지"""
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from app.services import reco_store
+from app.services.single_flight import SingleFlight
+
+LINK = "https://example.com/reco/overlap"
+HW = 48
+
+
+class _FakeKeyLock:
+    """pg_key_lock 대용: 키별 threading.Lock. 처음 잡은 쪽은 hold_first가 풀릴 때까지 락을 쥐고 멈춤"""
+
+    def __init__(self):
+        self.locks = {}
+        self.waiting = 0
+        self.hold_first = threading.Event()
+        self._first = True
+        self._mu = threading.Lock()
+
+    @contextmanager
+    def __call__(self, key, *, wait_sec):
+        with self._mu:
+            lk = self.locks.setdefault(key, threading.Lock())
+        acquired = lk.acquire(blocking=False)
+        waited = False
+        if not acquired and wait_sec > 0:
+            waited = True
+            with self._mu:
+                self.waiting += 1
+            acquired = lk.acquire(timeout=wait_sec)
+            with self._mu:
+                self.waiting -= 1
+        try:
+            if acquired:
+                with self._mu:
+                    first, self._first = self._first, False
+                if first:
+                    self.hold_first.wait(5)
+            yield acquired, waited
+        finally:
+            if acquired:
+                lk.release()
+
+
+@pytest.fixture
+def store(monkeypatch):
+    calls = []
+    saved = {}
+
+    def fake_compute(base_link, hours_window, topk_return, stance_threshold, *, prior=None, normalized=None):
+        calls.append(threading.current_thread().name)
+        return {"clicked": base_link, "candidates": [{"link": "x", "score": 0.5, "stance": 0.5}],
+                "next_bound": None, "fetched": 1}
+
+    def fake_upsert(base_link, hours_window, normalized_link, candidates, **kw):
+        saved[(base_link, hours_window)] = candidates
+
+    lock = _FakeKeyLock()
+    monkeypatch.setattr(reco_store, "pg_key_lock", lock)
+    monkeypatch.setattr(reco_store, "compute_candidates", fake_compute)
+    monkeypatch.setattr(reco_store, "upsert_cache", fake_upsert)
+    monkeypatch.setattr(reco_store, "get_cache_pg", lambda *a, **kw: None)
+    monkeypatch.setattr(reco_store, "RECO_FLIGHT_WAIT_SEC", 2.0)
+    monkeypatch.setattr(reco_store, "_reco_flight", SingleFlight())
+    monkeypatch.setattr(reco_store, "_compute_slots", threading.BoundedSemaphore(2))
+    return lock, calls, saved
+
+
+def _wait_until(cond, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not cond():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.005)
+
+
+def test_refresh_overlapping_foreground_computes_once(store):
+    lock, calls, saved = store
+    assert reco_store.claim_refresh(LINK, HW)
+
+    bg = threading.Thread(target=reco_store.refresh_in_background, args=(LINK, HW), name="bg")
+    bg.start()
+    # 리프레시가 advisory lock을 쥔 상태에서 같은 키 foreground 계산이 들어옴
+    _wait_until(lambda: not lock._first)
+
+    fg_res = {}
+    t0 = time.monotonic()
+    fg = threading.Thread(
+        target=lambda: fg_res.update(reco_store.compute_coalesced(LINK, HW)), name="fg"
+    )
+    fg.start()
+    _wait_until(lambda: reco_store.single_flight_stats()["coalesced"] >= 1 or lock.waiting >= 1)
+    lock.hold_first.set()
+    bg.join(5)
+    fg.join(5)
+    elapsed = time.monotonic() - t0
+
+    assert not bg.is_alive() and not fg.is_alive()
+    assert calls == ["bg"]
+    assert fg_res["candidates"] == saved[(LINK, HW)]
+    assert elapsed < reco_store.RECO_FLIGHT_WAIT_SEC
+    # 리프레시가 끝나면 다시 예약 가능
+    assert reco_store.claim_refresh(LINK, HW)
+
+
+def test_refresh_is_bounded_by_compute_slots(store, monkeypatch):
+    lock, calls, _ = store
+    lock.hold_first.set()
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(reco_store, "_compute_slots", slots)
+
+    slots.acquire()
+    reco_store.claim_refresh(LINK, HW)
+    bg = threading.Thread(target=reco_store.refresh_in_background, args=(LINK, HW))
+    bg.start()
+    time.sleep(0.1)
+    assert calls == []  # 슬롯이 빌 때까지 계산하지 않음
+
+    slots.release()
+    bg.join(5)
+    assert len(calls) == 1
+
+
+def test_clicked_url_is_resolved_before_slot_and_advisory_lock(store, monkeypatch):
+    lock, calls, _ = store
+    lock.hold_first.set()
+    held = []
+
+    def fake_normalize(u):
+        # 정규화(link_alias 연결, 네이버 조회) 중에는 계산 슬롯도 advisory lock도 쥐고 있지 않아야 함
+        held.append(any(lk.locked() for lk in lock.locks.values()) or reco_store._compute_slots._value < 2)
+        return u
+
+    monkeypatch.setattr(reco_store, "normalize_clicked", fake_normalize)
+    reco_store.compute_coalesced(LINK, HW)
+    assert held == [False]
+    assert len(calls) == 1
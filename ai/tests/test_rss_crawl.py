@@ -0,0 +1,78 @@
+import asyncio
+
+import httpx
+
+from app.api import rss_crawl
+
+FEED_URL = "https://feeds.example.com/politics.xml"
+ARTICLE_URL = "https://news.example.com/a/1"
+_REAL_CLIENT = httpx.AsyncClient
+
+FEED = f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>t</title>
+<item><title>기사 1</title><link>{ARTICLE_URL}</link>
+<description>요약</description><pubDate>Mon, 06 Jan 2025 09:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+def _run(monkeypatch, requests, http_cache, store):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url == FEED_URL:
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text=FEED, headers={"ETag": '"v1"'})
+        return httpx.Response(200, text="<html><body><p>본문</p></body></html>")
+
+    monkeypatch.setattr(
+        rss_crawl.httpx, "AsyncClient",
+        lambda **kw: _REAL_CLIENT(transport=httpx.MockTransport(handler), **kw),
+    )
+    monkeypatch.setattr(rss_crawl, "_load_feed_validators",
+                        lambda urls: {u: http_cache[u] for u in urls if u in http_cache})
+    monkeypatch.setattr(rss_crawl, "_lookup_known_articles", lambda links: {})
+    monkeypatch.setattr(
+        rss_crawl, "_save_validators",
+        lambda vs: http_cache.update(
+            {v[0]: {"etag": v[1], "last_modified": v[2], "body_bytes": v[3]} for v in vs}
+        ),
+    )
+    monkeypatch.setattr(rss_crawl, "_store_rows", store)
+    return asyncio.run(rss_crawl.crawl_rss_async(feeds={"src": FEED_URL}, polite_delay=0))
+
+
+def _feed_requests(requests):
+    return [r for r in requests if r.url == FEED_URL]
+
+
+def test_store_failure_does_not_save_feed_validators(monkeypatch):
+    http_cache = {}
+
+    def failing_store(source_name, rows):
+        raise RuntimeError("db down")
+
+    first = []
+    res = _run(monkeypatch, first, http_cache, failing_store)
+    assert "error" in res["by_source"]["src"]
+    assert FEED_URL not in http_cache
+
+    stored = []
+
+    def store(source_name, rows):
+        stored.extend(rows)
+        return {"source": source_name, "processed": len(rows), "inserted": len(rows),
+                "updated": 0, "samples": {"inserted": [], "updated": []}}
+
+    second = []
+    res = _run(monkeypatch, second, http_cache, store)
+    # 실패 다음 크롤은 조건부가 아닌 GET → 200 → 기사 저장
+    assert "if-none-match" not in _feed_requests(second)[0].headers
+    assert res["by_source"]["src"]["processed"] == 1
+    assert [r["title"] for r in stored] == ["기사 1"]
+    assert http_cache[FEED_URL]["etag"] == '"v1"'
+
+    third = []
+    res = _run(monkeypatch, third, http_cache, store)
+    # 저장이 성공한 뒤에는 조건부 요청 → 304
+    assert _feed_requests(third)[0].headers["if-none-match"] == '"v1"'
+    assert res["by_source"]["src"]["not_modified"] is True